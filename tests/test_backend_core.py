@@ -171,6 +171,119 @@ class TestDLNADevice:
         
         result = dlna_device.set_brightness(50)
         assert result is True
+    
+    def test_send_action_retries_with_backoff(self, dlna_device):
+        """Test that failed SOAP requests are retried with growing delays over the shared session"""
+        from web.backend.core import dlna_device as dlna_module
+        ok = Mock(content=b"<ok/>")
+        with patch.object(dlna_module._soap_session, 'post',
+                          side_effect=[OSError("timeout"), OSError("timeout"), ok]) as mock_post, \
+                patch('web.backend.core.dlna_device.time.sleep') as mock_sleep:
+            result = dlna_device._send_dlna_action_with_response(None, "GetTransportInfo")
+        
+        assert result == "<ok/>"
+        assert mock_post.call_count == 3
+        delays = [call[0][0] for call in mock_sleep.call_args_list]
+        assert len(delays) == 2
+        assert dlna_module.RETRY_BASE_DELAY <= delays[0] < delays[1] <= dlna_module.RETRY_MAX_DELAY * (1 + dlna_module.RETRY_JITTER)
+    
+    def test_action_template_read_once(self, dlna_device):
+        """Test that SOAP action templates are loaded on first use and then reused"""
+        from web.backend.core import dlna_device as dlna_module
+        dlna_module._action_templates.pop("Stop", None)
+        ok = Mock(content=b"<ok/>")
+        with patch.object(dlna_module._soap_session, 'post', return_value=ok), \
+                patch('web.backend.core.dlna_device._load_action_template',
+                      wraps=dlna_module._load_action_template) as mock_load:
+            dlna_device._send_dlna_action_with_response(None, "Stop")
+            dlna_device._send_dlna_action_with_response(None, "Stop")
+        
+        mock_load.assert_called_once_with("Stop")
+        assert "Stop" in dlna_module._action_templates
+    
+    def test_soap_headers_built_once_per_action(self, dlna_device):
+        """Test that request headers are reused per action and leave Content-Length to requests"""
+        from web.backend.core import dlna_device as dlna_module
+        ok = Mock(content=b"<ok/>")
+        with patch.object(dlna_module._soap_session, 'post', return_value=ok) as mock_post:
+            dlna_device._send_dlna_action_with_response(None, "GetTransportInfo")
+            dlna_device._send_dlna_action_with_response(None, "GetTransportInfo")
+        
+        first, second = (call[1]["headers"] for call in mock_post.call_args_list)
+        assert first is second
+        assert first["SOAPACTION"] == '"urn:schemas-upnp-org:service:AVTransport:1#GetTransportInfo"'
+        assert "Content-Length" not in first
+    
+    def test_av_transport_envelope(self, dlna_device):
+        """Test that AVTransport envelopes are well formed and escape their arguments"""
+        import xml.etree.ElementTree as ET
+        from web.backend.core import dlna_device as dlna_module
+        with patch.object(dlna_module._soap_session, 'post', return_value=Mock(status_code=200)) as mock_post:
+            assert dlna_device._send_av_transport_action("Seek", {"Unit": "REL_TIME", "Target": "0:01:00&<"})
+        
+        root = ET.fromstring(mock_post.call_args[1]["data"])
+        action = root.find(
+            "{http://schemas.xmlsoap.org/soap/envelope/}Body/{urn:schemas-upnp-org:service:AVTransport:1}Seek"
+        )
+        assert [(child.tag, child.text) for child in action] == [
+            ("InstanceID", "0"), ("Unit", "REL_TIME"), ("Target", "0:01:00&<")
+        ]
+    
+    def test_get_position_info(self, dlna_device):
+        """Test that position info is read from a GetPositionInfo response"""
+        response = (
+            '<s:Envelope xmlns:s="http://schemas.xmlsoap.org/soap/envelope/"><s:Body>'
+            '<u:GetPositionInfoResponse xmlns:u="urn:schemas-upnp-org:service:AVTransport:1">'
+            '<u:TrackDuration>0:02:00</u:TrackDuration><u:RelTime>0:00:30</u:RelTime>'
+            '</u:GetPositionInfoResponse></s:Body></s:Envelope>'
+        )
+        with patch.object(dlna_device, '_send_dlna_action_with_response', return_value=response):
+            info = dlna_device._get_position_info()
+        
+        assert info == {"RelTime": "0:00:30", "AbsTime": "NOT_IMPLEMENTED", "TrackDuration": "0:02:00"}
+    
+    def test_get_transport_and_position(self, dlna_device):
+        """Test that transport and position info are fetched side by side"""
+        import threading
+        threads = {}
+        
+        def position_info():
+            threads["position"] = threading.current_thread()
+            return {"RelTime": "0:00:30"}
+        
+        with patch.object(dlna_device, '_get_position_info', side_effect=position_info), \
+                patch.object(dlna_device, '_get_transport_info', return_value={"CurrentTransportState": "PLAYING"}):
+            transport_info, position_info = dlna_device._get_transport_and_position()
+        
+        assert transport_info == {"CurrentTransportState": "PLAYING"}
+        assert position_info == {"RelTime": "0:00:30"}
+        assert threads["position"] is not threading.current_thread()
+    
+    def test_poll_interval_scales_with_duration(self, dlna_device):
+        """Test that the monitor poll interval follows the video duration within its bounds"""
+        from web.backend.core import dlna_device as dlna_module
+        jitter = 1 + dlna_module.POLL_JITTER
+        
+        dlna_device.current_video_duration = 5
+        assert dlna_module.MIN_POLL_INTERVAL / jitter <= dlna_device._poll_interval() <= dlna_module.MIN_POLL_INTERVAL * jitter
+        dlna_device.current_video_duration = 60
+        assert 3 / jitter <= dlna_device._poll_interval() <= 3 * jitter
+        dlna_device.current_video_duration = 7200
+        assert dlna_device._poll_interval() <= dlna_module.MAX_POLL_INTERVAL * jitter
+    
+    def test_stop_wakes_loop_monitor(self, dlna_device):
+        """Test that stop() ends a waiting loop monitor thread without waiting out its sleep"""
+        import time
+        dlna_device._setup_loop_monitoring("http://localhost:8888/stream/test.mp4")
+        loop_thread = dlna_device._loop_thread
+        assert loop_thread.is_alive()
+        
+        started = time.monotonic()
+        with patch.object(dlna_device, '_send_dlna_action', return_value=True):
+            dlna_device.stop()
+        
+        assert not loop_thread.is_alive()
+        assert time.monotonic() - started < 2
 
 
 class TestTwistedStreaming:
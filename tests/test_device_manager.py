@@ -13,7 +13,8 @@ from unittest.mock import patch, MagicMock, Mock
 # Import the required classes for testing
 import sys
 sys.path.append('web/backend')
-from core.device_manager import DeviceManager
+from core.device_manager import DeviceManager, MAX_VIDEOS_PER_DEVICE, PLAYBACK_PROGRESS_HEARTBEAT
+from core.device_status import DeviceStatus
 from core.config_service import ConfigService
 
 
@@ -29,12 +30,13 @@ class TestDeviceManager(unittest.TestCase):
         # Reset the ConfigService singleton for each test
         ConfigService._instance = None
         
-        # Create a device manager for testing
-        self.device_manager = DeviceManager()
-        
         # Create a temporary directory for test files
         self.temp_dir = tempfile.TemporaryDirectory()
         
+        # Create a device manager for testing
+        self.device_manager = DeviceManager()
+        self.device_manager._known_devices_file = os.path.join(self.temp_dir.name, "known_devices.json")
+        
         # Create a test config file
         self.test_config = [
             {
@@ -306,6 +308,9 @@ class TestDeviceManager(unittest.TestCase):
                 return None
             
             mock_sleep.side_effect = stop_discovery_after_loop
+            # The loop waits on its wakeup event between cycles
+            self.device_manager._discovery_wakeup = MagicMock()
+            self.device_manager._discovery_wakeup.wait.side_effect = stop_discovery_after_loop
             
             # Start discovery in the main thread for testing
             self.device_manager.discovery_running = True
@@ -317,6 +322,536 @@ class TestDeviceManager(unittest.TestCase):
             # Restore original interval
             self.device_manager.discovery_interval = original_interval
     
+    @patch('core.device_manager.DeviceManager._discover_dlna_devices')
+    def test_discovery_idle_backoff(self, mock_discover):
+        """Test that the wait between discovery cycles grows while nothing changes"""
+        device = {
+            "friendly_name": "TestDevice1",
+            "hostname": "192.168.1.100",
+            "location": "http://192.168.1.100:49152/device.xml",
+            "action_url": "http://192.168.1.100:49152/AVTransport/Control"
+        }
+        # Same device every cycle, then a new one appears on the last cycle
+        new_device = dict(device, friendly_name="TestDevice2", hostname="192.168.1.101",
+                          location="http://192.168.1.101:49152/device.xml")
+        cycles = [[dict(device)] for _ in range(6)] + [[dict(device), new_device]]
+        mock_discover.side_effect = cycles
+        self.device_manager.discovery_interval = 10
+
+        waits = []
+        def record_wait(timeout):
+            waits.append(timeout)
+            if len(waits) == len(cycles):
+                self.device_manager.discovery_running = False
+            return False
+        self.device_manager._discovery_wakeup = MagicMock()
+        self.device_manager._discovery_wakeup.wait.side_effect = record_wait
+
+        with patch.object(self.device_manager, '_process_device_video_assignment'):
+            self.device_manager.discovery_running = True
+            self.device_manager._discovery_loop()
+
+        self.assertEqual(waits, [10, 20, 40, 60, 60, 60, 10])
+
+        # Waking discovery resets the backoff
+        self.device_manager._consecutive_idle_cycles = 3
+        self.device_manager.wake_discovery()
+        self.assertEqual(self.device_manager._consecutive_idle_cycles, 0)
+        self.device_manager._discovery_wakeup.set.assert_called_once()
+
+    @patch('core.device_manager.DeviceManager._register_dlna_device')
+    @patch('core.device_manager.DeviceManager._discover_dlna_devices')
+    def test_discovery_warm_start(self, mock_discover, mock_register_dlna):
+        """Test that devices known from the last run are probed and registered on startup"""
+        known_file = self.device_manager._known_devices_file
+        with open(known_file, "w") as f:
+            json.dump([{
+                "name": "TestDevice1",
+                "friendly_name": "TestDevice1",
+                "hostname": "192.168.1.100",
+                "location": "http://192.168.1.100:49152/device.xml"
+            }], f)
+        mock_discover.return_value = []
+        mock_register_dlna.return_value = {
+            "device_name": "TestDevice1",
+            "type": "dlna",
+            "location": "http://192.168.1.100:49152/device.xml",
+            "hostname": "192.168.1.100",
+            "friendly_name": "TestDevice1",
+            "action_url": "http://192.168.1.100:49152/AVTransport/Control"
+        }
+
+        def stop_after_cycle(*args, **kwargs):
+            self.device_manager.discovery_running = False
+            return False
+        self.device_manager._discovery_wakeup = MagicMock()
+        self.device_manager._discovery_wakeup.wait.side_effect = stop_after_cycle
+
+        with patch.object(self.device_manager, '_process_device_video_assignment'):
+            self.device_manager.discovery_running = True
+            self.device_manager._discovery_loop()
+
+        # The known device was probed directly even though SSDP found nothing
+        mock_register_dlna.assert_called_once_with("http://192.168.1.100:49152/device.xml")
+        self.assertIsNotNone(self.device_manager.get_device("TestDevice1"))
+
+        # The list is written back with the registered device
+        with open(known_file) as f:
+            saved = json.load(f)
+        self.assertEqual([entry["name"] for entry in saved], ["TestDevice1"])
+
+    @patch.dict(os.environ, {}, clear=False)
+    @patch('core.device_manager.DeviceManager._discover_dlna_devices')
+    def test_resume_while_paused_cycle_finishes(self, mock_discover):
+        """Test that resuming during a paused loop's last cycle starts a fresh loop"""
+        os.environ.pop("PYTEST_CURRENT_TEST", None)
+        in_cycle = threading.Event()
+        release_cycle = threading.Event()
+        def slow_discover(*args, **kwargs):
+            in_cycle.set()
+            release_cycle.wait(2.0)
+            return []
+        mock_discover.side_effect = slow_discover
+
+        self.device_manager.start_discovery()
+        self.assertTrue(in_cycle.wait(2.0))
+        old_thread = self.device_manager.discovery_thread
+
+        # Pause and resume while the first loop is still inside its cycle
+        self.device_manager.pause_discovery()
+        self.device_manager.resume_discovery()
+        release_cycle.set()
+
+        self.assertIsNot(self.device_manager.discovery_thread, old_thread)
+        old_thread.join(2.0)
+        self.assertFalse(old_thread.is_alive())
+        self.assertTrue(self.device_manager.discovery_thread.is_alive())
+        self.assertTrue(self.device_manager.discovery_running)
+
+    @patch.dict(os.environ, {}, clear=False)
+    @patch('core.device_manager.DeviceManager._discover_dlna_devices')
+    def test_config_update_wakes_discovery(self, mock_discover):
+        """Test that a configuration change cuts the wait between discovery cycles short"""
+        os.environ.pop("PYTEST_CURRENT_TEST", None)
+        os.environ["DEVICE_CONFIG_FILE"] = self.config_file_path
+        cycles = []
+        cycle_started = threading.Condition()
+        def record_cycle(*args, **kwargs):
+            with cycle_started:
+                cycles.append(time.monotonic())
+                cycle_started.notify_all()
+            return []
+        mock_discover.side_effect = record_cycle
+        self.device_manager.discovery_interval = 60
+
+        def wait_for_cycles(count, timeout):
+            with cycle_started:
+                return cycle_started.wait_for(lambda: len(cycles) >= count, timeout)
+
+        self.device_manager.start_discovery()
+        self.assertTrue(wait_for_cycles(1, 2.0))
+        # The loop's own load of the configuration file does not wake it
+        self.assertFalse(wait_for_cycles(2, 0.3))
+
+        ConfigService.get_instance().update_device_config("TestDevice1", {"hostname": "192.168.1.150"})
+        self.assertTrue(wait_for_cycles(2, 2.0))
+
+    def test_config_file_reloaded_only_when_modified(self):
+        """Test that the default configuration is reloaded only after its mtime changes"""
+        config_service = ConfigService.get_instance()
+        with patch.object(config_service, 'load_configs_from_file',
+                          wraps=config_service.load_configs_from_file) as mock_load:
+            self.assertTrue(self.device_manager._reload_config_file_if_changed(self.config_file_path))
+            self.assertFalse(self.device_manager._reload_config_file_if_changed(self.config_file_path))
+            self.assertEqual(mock_load.call_count, 1)
+            self.assertEqual(self.device_manager._get_cached_device_config("TestDevice1")["hostname"],
+                             "192.168.1.100")
+
+            # Edit the file and move its mtime forward
+            self.test_config[0]["hostname"] = "192.168.1.150"
+            with open(self.config_file_path, "w") as f:
+                json.dump(self.test_config, f)
+            stat = os.stat(self.config_file_path)
+            os.utime(self.config_file_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+            self.assertTrue(self.device_manager._reload_config_file_if_changed(self.config_file_path))
+            self.assertEqual(mock_load.call_count, 2)
+            self.assertEqual(self.device_manager._get_cached_device_config("TestDevice1")["hostname"],
+                             "192.168.1.150")
+
+        # A missing file is reported once and not loaded
+        missing = os.path.join(self.temp_dir.name, "missing.json")
+        self.assertFalse(self.device_manager._reload_config_file_if_changed(missing))
+
+    def test_playback_health_check_runs_on_shared_loop(self):
+        """Test that health checks are tasks on one event loop and stop immediately"""
+        self.device_manager.register_device(self.test_config[0].copy())
+        self.device_manager.register_device(self.test_config[1].copy())
+        
+        self.device_manager._start_playback_health_check("TestDevice1", "/tmp/test_video1.mp4")
+        self.device_manager._start_playback_health_check("TestDevice2", "/tmp/test_video2.mp4")
+        
+        # Both checks share the same loop thread
+        tasks = dict(self.device_manager.playback_health_tasks)
+        self.assertEqual(set(tasks), {"TestDevice1", "TestDevice2"})
+        self.assertTrue(self.device_manager._health_loop_thread.is_alive())
+        
+        # Stopping cancels the task without waiting out the check interval
+        self.device_manager._stop_playback_health_check("TestDevice1")
+        deadline = time.time() + 1.0
+        while "TestDevice1" in self.device_manager.playback_health_tasks and time.time() < deadline:
+            time.sleep(0.01)
+        self.assertTrue(tasks["TestDevice1"]["task"].cancelled())
+        self.assertNotIn("TestDevice1", self.device_manager.playback_health_tasks)
+        self.assertIn("TestDevice2", self.device_manager.playback_health_tasks)
+    
+    @patch('core.device_manager.PLAYBACK_HEALTH_CHECK_INTERVAL', 0.01)
+    @patch('core.device_manager.PLAYBACK_HEALTH_STABLE_CHECKS', 2)
+    @patch('core.device_manager.PLAYBACK_HEALTH_MAX_INTERVAL', 0.04)
+    def test_playback_health_check_interval_adapts(self):
+        """Test that the check interval grows while playback is healthy and resets on failure"""
+        device = self.device_manager.register_device(self.test_config[0].copy())
+        device.update_playing(True)
+        
+        self.device_manager._start_playback_health_check("TestDevice1", "/tmp/test_video1.mp4")
+        health_info = self.device_manager.playback_health_tasks["TestDevice1"]
+        
+        # Healthy checks stretch the interval up to the cap
+        deadline = time.time() + 2.0
+        while health_info["interval"] < 0.04 and time.time() < deadline:
+            time.sleep(0.01)
+        self.assertEqual(health_info["interval"], 0.04)
+        
+        # A failed check drops back to the base interval
+        device.update_playing(False)
+        deadline = time.time() + 2.0
+        while health_info["interval"] != 0.01 and time.time() < deadline:
+            time.sleep(0.01)
+        self.assertEqual(health_info["interval"], 0.01)
+        
+        self.device_manager._stop_playback_health_check("TestDevice1")
+    
+    def test_db_device_cache(self):
+        """Test that database device lookups are cached until invalidated"""
+        device_service = MagicMock()
+        self.device_manager.set_device_service(device_service)
+        
+        first = self.device_manager._get_db_device("TestDevice1")
+        second = self.device_manager._get_db_device("TestDevice1")
+        self.assertIs(first, second)
+        device_service.get_device_by_name.assert_called_once_with("TestDevice1")
+        
+        # Registering the device drops its cached row
+        self.device_manager.register_device(self.test_config[0].copy())
+        self.device_manager._get_db_device("TestDevice1")
+        self.assertEqual(device_service.get_device_by_name.call_count, 2)
+
+    def test_device_config_cache(self):
+        """Test that device configs are cached and dropped when the config changes"""
+        config_service = ConfigService.get_instance()
+        config_service.add_device_config("TestDevice1", self.test_config[0].copy(), source="test")
+
+        with patch.object(config_service, 'get_device_config', wraps=config_service.get_device_config) as mock_get:
+            first = self.device_manager._get_cached_device_config("TestDevice1")
+            self.device_manager._get_cached_device_config("TestDevice1")
+            self.assertEqual(mock_get.call_count, 1)
+            self.assertEqual(first["hostname"], "192.168.1.100")
+
+            # Updating the config invalidates the cached copy
+            config_service.update_device_config("TestDevice1", {"hostname": "192.168.1.150"}, source="test")
+            updated = self.device_manager._get_cached_device_config("TestDevice1")
+            self.assertEqual(mock_get.call_count, 2)
+            self.assertEqual(updated["hostname"], "192.168.1.150")
+
+    def test_video_assignment_steady_state_short_circuit(self):
+        """Test that unchanged devices skip the assignment lookups until an input changes"""
+        device_service = MagicMock()
+        device_service.get_device_by_name.return_value = None
+        self.device_manager.set_device_service(device_service)
+        self.device_manager.register_device(self.test_config[0].copy())
+        device_service.get_device_by_name.reset_mock()
+
+        with patch.object(self.device_manager, '_get_cached_device_config', return_value=None) as mock_config:
+            self.device_manager._process_device_video_assignment("TestDevice1", False, False)
+            self.device_manager._process_device_video_assignment("TestDevice1", False, False)
+            self.assertEqual(mock_config.call_count, 1)
+            self.assertEqual(device_service.get_device_by_name.call_count, 1)
+
+            # A config change forces a full check on the next cycle
+            self.device_manager.invalidate_device_config("TestDevice1")
+            self.device_manager._process_device_video_assignment("TestDevice1", False, False)
+            self.assertEqual(mock_config.call_count, 2)
+
+    @patch('core.device_manager.DeviceManager._discover_dlna_devices')
+    def test_discovery_loads_control_modes_once_per_cycle(self, mock_discover):
+        """Test that user control modes are read in one query on the loop thread"""
+        mock_discover.return_value = [self.test_config[0].copy(), self.test_config[1].copy()]
+        device_service = MagicMock()
+        device_service.get_device_control_modes_by_names.return_value = {"Test Device 1": ("manual", "user")}
+        self.device_manager.set_device_service(device_service)
+        
+        def stop_after_cycle(*args, **kwargs):
+            self.device_manager.discovery_running = False
+            return False
+        self.device_manager._discovery_wakeup = MagicMock()
+        self.device_manager._discovery_wakeup.wait.side_effect = stop_after_cycle
+        
+        with patch.object(self.device_manager, 'assign_video_to_device') as mock_assign, \
+                patch.object(self.device_manager, '_get_cached_device_config', return_value=None):
+            self.device_manager.discovery_running = True
+            self.device_manager._discovery_loop()
+        
+        device_service.get_device_control_modes_by_names.assert_called_once()
+        self.assertEqual(sorted(device_service.get_device_control_modes_by_names.call_args[0][0]),
+                         ["Test Device 1", "Test Device 2"])
+        device_service.get_device_by_name.assert_not_called()
+        mock_assign.assert_not_called()
+
+    def test_video_assignment_respects_control_modes(self):
+        """Test that devices under user control, or with an unknown control mode, are not auto-assigned"""
+        self.device_manager.register_device(self.test_config[0].copy())
+        
+        with patch.object(self.device_manager, '_get_cached_device_config') as mock_config:
+            self.device_manager._process_device_video_assignment(
+                "TestDevice1", True, False, control_modes={"TestDevice1": ("manual", "user")}
+            )
+            mock_config.assert_not_called()
+            
+            # A failed lookup is not treated as 'auto'
+            device_service = MagicMock()
+            device_service.get_device_by_name.side_effect = RuntimeError("concurrent operations are not permitted")
+            self.device_manager.set_device_service(device_service)
+            self.device_manager._process_device_video_assignment("TestDevice1", True, False)
+            mock_config.assert_not_called()
+            
+            # Devices without a database row are assigned automatically
+            self.device_manager._process_device_video_assignment("TestDevice1", True, False, control_modes={})
+            mock_config.assert_called_once_with("TestDevice1")
+
+    def test_device_status_record(self):
+        """Test that status records behave like the dicts they replaced"""
+        self.device_manager.update_device_status("TestDevice1", "connected", is_playing=True)
+        status = self.device_manager.device_status["TestDevice1"]
+        
+        self.assertIsInstance(status, DeviceStatus)
+        self.assertEqual(status["status"], "connected")
+        self.assertTrue(status.is_playing)
+        self.assertIn("last_updated", status)
+        self.assertNotIn("last_error", status)
+        self.assertIsNone(status.get("last_error"))
+        self.assertEqual(status.get("streaming_bytes", 0), 0)
+        with self.assertRaises(KeyError):
+            status["unknown_field"] = 1
+
+    def test_device_status_snapshot(self):
+        """Test that status snapshots are unaffected by later additions and removals"""
+        self.device_manager.update_device_status("TestDevice1", "connected")
+        snapshot = self.device_manager.device_status
+        record = snapshot["TestDevice1"]
+
+        self.device_manager.update_device_status("TestDevice2", "connected")
+        self.assertNotIn("TestDevice2", snapshot)
+        self.assertIn("TestDevice2", self.device_manager.device_status)
+
+        # Field updates are made in place on the shared record
+        self.device_manager.update_device_playback_progress("TestDevice1", "00:00:10", "00:01:00", 16)
+        self.assertIs(self.device_manager.device_status["TestDevice1"], record)
+        self.assertEqual(snapshot["TestDevice1"]["playback_progress"], 16)
+
+        self.device_manager._publish_status("TestDevice1", None)
+        self.assertIn("TestDevice1", snapshot)
+        self.assertNotIn("TestDevice1", self.device_manager.device_status)
+
+    def test_progress_writes_coalesced_and_flushed_on_stop(self):
+        """Test that queued progress writes keep only the latest value and are flushed on stop"""
+        with patch.object(self.device_manager, '_progress_flush_loop'):
+            self.device_manager._queue_progress_write("TestDevice1", "00:00:01", "00:01:00", 1)
+            self.device_manager._queue_progress_write("TestDevice1", "00:00:02", "00:01:00", 3)
+            self.device_manager._queue_progress_write("TestDevice2", "00:00:05", "00:02:00", 4)
+
+        self.assertEqual(self.device_manager._progress_writes, {
+            "TestDevice1": ("00:00:02", "00:01:00", 3),
+            "TestDevice2": ("00:00:05", "00:02:00", 4),
+        })
+        with patch.object(self.device_manager, '_flush_playback_progress',
+                          wraps=self.device_manager._flush_playback_progress) as mock_flush:
+            self.device_manager.stop_discovery()
+            mock_flush.assert_called_once()
+        self.assertEqual(self.device_manager._progress_writes, {})
+
+    def test_unchanged_progress_skipped_until_heartbeat(self):
+        """Test that repeated identical progress reports are only written once per heartbeat"""
+        with patch.object(self.device_manager, '_queue_progress_write') as mock_queue:
+            self.device_manager.update_device_playback_progress("TestDevice1", "00:00:10", "00:01:00", 16)
+            self.device_manager.update_device_playback_progress("TestDevice1", "00:00:10", "00:01:00", 16)
+            self.assertEqual(mock_queue.call_count, 1)
+            
+            self.device_manager.update_device_playback_progress("TestDevice1", "00:00:11", "00:01:00", 18)
+            self.assertEqual(mock_queue.call_count, 2)
+            
+            now = time.time()
+            with patch('core.device_manager.time.time', return_value=now + PLAYBACK_PROGRESS_HEARTBEAT):
+                self.device_manager.update_device_playback_progress("TestDevice1", "00:00:11", "00:01:00", 18)
+            self.assertEqual(mock_queue.call_count, 3)
+
+    def test_progress_updates_core_device(self):
+        """Test that progress is copied onto devices that track it and skipped for others"""
+        self.device_manager.register_device(self.test_config[0])
+        device = self.device_manager.get_device("TestDevice1")
+        
+        self.device_manager.update_device_playback_progress("TestDevice1", "00:00:10", "00:01:00", 16)
+        
+        self.assertEqual(device.current_position, "00:00:10")
+        self.assertEqual(device.duration_formatted, "00:01:00")
+        self.assertEqual(device.playback_progress, 16)
+        
+        other = Mock(spec=["name"])
+        self.device_manager.devices["Other"] = other
+        self.device_manager.update_device_playback_progress("Other", "00:00:10", "00:01:00", 16)
+        self.assertFalse(hasattr(other, "current_position"))
+
+    def test_device_shard_locks(self):
+        """Test that each device always maps to the same shard lock"""
+        shard = self.device_manager._shard("TestDevice1")
+
+        self.assertIs(self.device_manager._shard("TestDevice1"), shard)
+        self.assertIn(shard, self.device_manager._device_shards)
+
+        # Unregistering clears per-device state held under the shard
+        self.device_manager.register_device(self.test_config[0])
+        self.device_manager.video_assignment_priority["TestDevice1"] = 5
+        self.device_manager._track_playback_result("TestDevice1", "/videos/a.mp4", True)
+        self.assertTrue(self.device_manager.unregister_device("TestDevice1"))
+        self.assertNotIn("TestDevice1", self.device_manager.video_assignment_priority)
+        self.assertNotIn("TestDevice1", self.device_manager.video_playback_history)
+
+    def test_playback_history_bounded(self):
+        """Test that per-device video stats keep only the most recently played videos"""
+        for i in range(MAX_VIDEOS_PER_DEVICE + 1):
+            self.device_manager._track_playback_result("TestDevice1", f"/videos/{i}.mp4", True)
+        self.device_manager._track_playback_result("TestDevice1", "/videos/1.mp4", False)
+        self.device_manager._track_playback_result("TestDevice1", "/videos/extra.mp4", True)
+
+        stats = self.device_manager.get_device_playback_stats("TestDevice1")
+        self.assertEqual(len(stats["videos"]), MAX_VIDEOS_PER_DEVICE)
+        self.assertEqual(stats["attempts"], MAX_VIDEOS_PER_DEVICE + 3)
+        # The oldest videos are evicted first; replaying one keeps it
+        self.assertNotIn("/videos/0.mp4", stats["videos"])
+        self.assertNotIn("/videos/2.mp4", stats["videos"])
+        self.assertEqual(stats["videos"]["/videos/1.mp4"], {"attempts": 2, "successes": 1})
+
+    @patch('os.path.exists')
+    def test_path_exists_cache(self, mock_exists):
+        """Test that video file existence checks are cached until invalidated"""
+        mock_exists.return_value = True
+
+        self.assertTrue(self.device_manager._path_exists("/videos/a.mp4"))
+        self.assertTrue(self.device_manager._path_exists("/videos/a.mp4"))
+        mock_exists.assert_called_once_with("/videos/a.mp4")
+
+        # Invalidating forces a fresh check
+        mock_exists.return_value = False
+        self.device_manager.invalidate_path_exists("/videos/a.mp4")
+        self.assertFalse(self.device_manager._path_exists("/videos/a.mp4"))
+        self.assertEqual(mock_exists.call_count, 2)
+
+    def test_parse_ssdp_response(self):
+        """Test parsing the discovery headers out of a raw SSDP reply"""
+        data = (
+            b"HTTP/1.1 200 OK\r\n"
+            b"CACHE-CONTROL: max-age=1800\r\n"
+            b"Location: http://192.168.1.100:49152/description.xml \r\n"
+            b"ST:urn:schemas-upnp-org:service:AVTransport:1\r\n"
+            b"USN: uuid:1234::urn:schemas-upnp-org:service:AVTransport:1\r\n"
+            b"\r\n"
+        )
+        
+        headers = DeviceManager._parse_ssdp_response(data)
+        
+        self.assertEqual(headers, {
+            "location": "http://192.168.1.100:49152/description.xml",
+            "st": "urn:schemas-upnp-org:service:AVTransport:1",
+            "usn": "uuid:1234::urn:schemas-upnp-org:service:AVTransport:1",
+        })
+    
+    def test_fetch_device_description_revalidates(self):
+        """Test that unchanged descriptions are reused on a 304 response"""
+        xml = (
+            b'<root xmlns="urn:schemas-upnp-org:device-1-0"><device>'
+            b'<friendlyName>Test Device 1</friendlyName></device></root>'
+        )
+        session = MagicMock()
+        session.get.side_effect = [
+            Mock(status_code=200, content=xml, headers={"ETag": '"v1"'}),
+            Mock(status_code=304, content=b"", headers={}),
+        ]
+        self.device_manager._desc_session = session
+        url = "http://192.168.1.100:49152/description.xml"
+        
+        first = self.device_manager._fetch_device_description(url)
+        second = self.device_manager._fetch_device_description(url)
+        
+        self.assertEqual(first.find("./device/friendlyName").text, "Test Device 1")
+        self.assertIs(first, second)
+        self.assertEqual(session.get.call_args.kwargs["headers"], {"If-None-Match": '"v1"'})
+    
+    def test_fetch_device_description_strips_namespaces(self):
+        """Test that every namespace is dropped from description tags, not just the first"""
+        xml = (
+            b'<?xml version="1.0"?>\n<!-- renderer -->'
+            b'<root xmlns="urn:schemas-upnp-org:device-1-0" xmlns:dlna="urn:schemas-dlna-org:device-1-0">'
+            b'<device><dlna:X_DLNADOC>DMR-1.50</dlna:X_DLNADOC>'
+            b'<serviceList><service xmlns="urn:schemas-upnp-org:service-1-0">'
+            b'<serviceType>urn:schemas-upnp-org:service:AVTransport:1</serviceType>'
+            b'<controlURL>/AVTransport/Control</controlURL></service></serviceList>'
+            b'</device></root>'
+        )
+        session = MagicMock()
+        session.get.return_value = Mock(status_code=200, content=xml, headers={})
+        self.device_manager._desc_session = session
+        
+        root = self.device_manager._fetch_device_description("http://192.168.1.100:49152/description.xml")
+        
+        self.assertEqual(root.find("./device/X_DLNADOC").text, "DMR-1.50")
+        control = root.find(
+            "./device/serviceList/service/[serviceType='urn:schemas-upnp-org:service:AVTransport:1']/controlURL"
+        )
+        self.assertEqual(control.text, "/AVTransport/Control")
+    
+    def test_register_dlna_device_from_description(self):
+        """Test that device fields and the AVTransport control URL are read from the description"""
+        xml = (
+            b'<root xmlns="urn:schemas-upnp-org:device-1-0"><device>'
+            b'<friendlyName>Test Device 1</friendlyName><manufacturer>Acme</manufacturer>'
+            b'<serviceList>'
+            b'<service><serviceType>urn:schemas-upnp-org:service:RenderingControl:1</serviceType>'
+            b'<controlURL>/RenderingControl/Control</controlURL></service>'
+            b'<service><serviceType>urn:schemas-upnp-org:service:AVTransport:1</serviceType>'
+            b'<controlURL>AVTransport/Control</controlURL></service>'
+            b'</serviceList></device></root>'
+        )
+        session = MagicMock()
+        session.get.return_value = Mock(status_code=200, content=xml, headers={})
+        self.device_manager._desc_session = session
+        
+        info = self.device_manager._register_dlna_device("http://192.168.1.100:49152/description.xml")
+        
+        self.assertEqual(info["friendly_name"], "Test Device 1")
+        self.assertEqual(info["manufacturer"], "Acme")
+        self.assertEqual(info["hostname"], "192.168.1.100")
+        self.assertEqual(info["action_url"], "http://192.168.1.100:49152/AVTransport/Control")
+    
+    def test_overlay_sync_uses_keep_alive_session(self):
+        """Test that overlay sync requests go through the pooled HTTP session"""
+        session = MagicMock()
+        session.post.return_value = Mock(status_code=200)
+        self.device_manager._desc_session = session
+        
+        self.device_manager._trigger_overlay_sync("test.mp4")
+        
+        session.post.assert_called_once()
+        self.assertEqual(session.post.call_args[1]["params"]["video_name"], "test.mp4")
+    
     def test_thread_safety_register_device(self):
         """Test thread safety of device registration"""
         # Function to register devices in a thread
@@ -6,6 +6,7 @@ This file makes the core directory a proper Python package.
 from .device import Device
 from .dlna_device import DLNADevice
 from .transcreen_device import TranscreenDevice
+from .device_status import DeviceStatus
 from .device_manager import DeviceManager
 from .streaming_service import StreamingService
 from .config_service import ConfigService
@@ -16,6 +17,7 @@ __all__ = [
     'Device',
     'DLNADevice',
     'TranscreenDevice',
+    'DeviceStatus',
     'DeviceManager',
     'StreamingService',
     'ConfigService',
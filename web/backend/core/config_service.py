@@ -8,7 +8,7 @@ import os
 import logging
 import threading
 import time
-from typing import Dict, List, Any, Optional
+from typing import Callable, Dict, List, Any, Optional
 
 logger = logging.getLogger(__name__)
 
@@ -43,6 +43,8 @@ class ConfigService:
         self._device_configs: Dict[str, Dict[str, Any]] = {}
         self._config_sources: Dict[str, str] = {}  # Track where each config came from
         self._loaded_files: List[str] = []  # Track which files have been loaded
+        # Called with the device name (None for all devices) whenever a configuration changes
+        self._change_listeners: List[Callable[[Optional[str]], None]] = []
     
     def _acquire_lock(self):
         """Acquire the config lock with timeout to prevent deadlock"""
@@ -62,6 +64,28 @@ class ConfigService:
             # Lock wasn't held
             pass
     
+    def register_change_listener(self, listener: Callable[[Optional[str]], None]) -> None:
+        """
+        Register a callback to be notified when device configurations change
+        
+        Args:
+            listener: Called with the changed device name, or None when all configurations changed
+        """
+        self._change_listeners.append(listener)
+    
+    def _notify_change(self, device_name: Optional[str]) -> None:
+        """
+        Notify listeners that a device configuration changed
+        
+        Args:
+            device_name: Name of the changed device, or None for all devices
+        """
+        for listener in list(self._change_listeners):
+            try:
+                listener(device_name)
+            except Exception as e:
+                logger.error(f"Error in configuration change listener: {e}")
+    
     def clear_configurations(self):
         """
         Clear all loaded configurations
@@ -72,6 +96,7 @@ class ConfigService:
             self._device_configs.clear()
             self._config_sources.clear()
             self._loaded_files.clear()
+            self._notify_change(None)
             logger.info("Cleared all device configurations")
         finally:
             self._release_lock()
@@ -154,6 +179,7 @@ class ConfigService:
             # Store the configuration
             self._device_configs[device_name] = config
             self._config_sources[device_name] = source
+            self._notify_change(device_name)
             logger.info(f"Added device configuration for {device_name} from {source}")
             return True
         finally:
@@ -197,6 +223,7 @@ class ConfigService:
             current_config = self._device_configs[device_name]
             current_config.update(config_update)
             self._config_sources[device_name] = source
+            self._notify_change(device_name)
             logger.info(f"Updated device configuration for {device_name} from {source}")
             return True
         finally:
@@ -223,6 +250,7 @@ class ConfigService:
             del self._device_configs[device_name]
             if device_name in self._config_sources:
                 del self._config_sources[device_name]
+            self._notify_change(device_name)
             logger.info(f"Removed device configuration for {device_name}")
             return True
         finally:
@@ -365,6 +393,7 @@ class ConfigService:
         for device_name in to_remove:
             del self._device_configs[device_name]
             del self._config_sources[device_name]
+            self._notify_change(device_name)
             logger.info(f"Cleared configuration for device {device_name} from {source}")
             
     def save_configs_to_file(self, config_file: str, filter_source: Optional[str] = None) -> bool:
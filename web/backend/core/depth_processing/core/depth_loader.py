@@ -7,6 +7,8 @@ import numpy as np
 from PIL import Image
 from typing import Optional, Tuple
 
+from .kernels import use_kernel, use_gpu, gpu_normalize, _normalize_impl, _visualize_impl
+
 # Configure logger for this module
 logger = logging.getLogger(__name__)
 
@@ -197,7 +199,20 @@ class DepthLoader:
             
         # Normalize depth map to [0, 1]
         if max_val > min_val:
-            normalized = (depth_map - min_val) / (max_val - min_val)
+            # Multiply by a precomputed reciprocal instead of dividing every pixel;
+            # the product can round just below 1, so the max pixels are pinned to 1.0
+            inv_range = 1.0 / (max_val - min_val)
+            
+            if use_gpu(depth_map):
+                return gpu_normalize(depth_map, min_val, max_val, inv_range)
+            
+            if use_kernel(depth_map):
+                return _normalize_impl(
+                    np.ascontiguousarray(depth_map), np.float32(min_val), np.float32(max_val), np.float32(inv_range)
+                )
+            
+            normalized = (depth_map - min_val) * inv_range
+            normalized[depth_map == max_val] = 1.0
             # Replace non-finite values with 0
             normalized[~valid_mask] = 0
             return normalized
@@ -219,6 +234,10 @@ class DepthLoader:
         if depth_map is None:
             return None
             
+        # 8/16-bit maps (PNG, TIFF) go through a lookup table, no float temporaries
+        if depth_map.dtype in (np.uint8, np.uint16):
+            return DepthLoader._visualize_with_lut(depth_map)
+            
         # Normalize if not already in [0, 1]
         if depth_map.min() < 0 or depth_map.max() > 1:
             normalized = DepthLoader.normalize_depth_map(depth_map)
@@ -226,5 +245,26 @@ class DepthLoader:
             normalized = depth_map
             
         # Convert to uint8 [0, 255]
+        if use_kernel(normalized):
+            return _visualize_impl(np.ascontiguousarray(normalized))
+            
         visualization = (normalized * 255).astype(np.uint8)
-        return visualization 
\ No newline at end of file
+        return visualization
+    
+    @staticmethod
+    def _visualize_with_lut(depth_map: np.ndarray) -> np.ndarray:
+        """Visualize a uint8/uint16 depth map with a single lookup table gather"""
+        min_val = int(depth_map.min())
+        max_val = int(depth_map.max())
+        levels = np.arange(np.iinfo(depth_map.dtype).max + 1, dtype=np.float64)
+        
+        # Build the same mapping normalize_depth_map would apply, once per level
+        if max_val <= 1:
+            lut = levels * 255
+        elif max_val > min_val:
+            lut = (levels - min_val) / (max_val - min_val) * 255
+        else:
+            lut = np.zeros_like(levels)
+        lut = np.clip(lut, 0, 255).astype(np.uint8)
+        
+        return lut[depth_map]
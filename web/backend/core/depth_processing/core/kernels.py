@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+# encoding: UTF-8
+
+"""
+Optional Numba-compiled kernels for the hot per-pixel depth map operations.
+
+The kernels are declared with explicit signatures so they are compiled when
+this module is imported instead of on the first call, and ``cache=True``
+keeps the compiled code on disk between sessions. Callers must check
+``NUMBA_AVAILABLE`` and fall back to plain NumPy when it is False.
+
+Setting ``DEPTH_USE_GPU=1`` additionally offloads very large maps to the GPU
+through CuPy when it is installed (see ``use_gpu``).
+"""
+
+import os
+import logging
+import numpy as np
+
+# Configure logger for this module
+logger = logging.getLogger(__name__)
+
+try:
+    from numba import njit, prange, types
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# GPU offload is opt-in and only pays off once the transfer is amortized
+GPU_MIN_PIXELS = 4_000_000
+
+cp = None
+if os.environ.get("DEPTH_USE_GPU", "").lower() in ("1", "true", "yes"):
+    try:
+        import cupy as cp
+    except ImportError:
+        logger.warning("DEPTH_USE_GPU is set but CuPy is not installed, using the CPU")
+CUPY_AVAILABLE = cp is not None
+
+# Fast-math flags minus 'nnan'/'ninf': depth maps may contain NaN/inf pixels
+# and the kernels must still be able to detect them
+_FASTMATH = {'nsz', 'arcp', 'contract', 'afn', 'reassoc'}
+
+
+if NUMBA_AVAILABLE:
+
+    @njit('f4[:,::1](f4[:,::1], f4, f4, f4)', cache=True, parallel=True, fastmath=_FASTMATH)
+    def _normalize_impl(depth_map, min_val, max_val, inv_range):
+        """Normalize a float32 depth map to [0, 1], mapping non-finite values to 0"""
+        height, width = depth_map.shape
+        out = np.empty((height, width), dtype=np.float32)
+        for y in prange(height):
+            for x in range(width):
+                v = depth_map[y, x]
+                if v == max_val:
+                    # The reciprocal product can round just below 1
+                    out[y, x] = 1.0
+                elif np.isfinite(v):
+                    # Multiply by the reciprocal: a divide keeps LLVM from vectorizing the loop
+                    out[y, x] = (v - min_val) * inv_range
+                else:
+                    out[y, x] = 0.0
+        return out
+
+    @njit(
+        ['void(f4[:,::1], f4[::1], u1[:,::1])', 'void(f4[:,::1], f4[::1], u2[:,::1])'],
+        cache=True,
+        parallel=True,
+    )
+    def _threshold_impl(depth_map, thresholds, out):
+        """Write the number of sorted thresholds each pixel reaches into a label buffer"""
+        height, width = depth_map.shape
+        n_thresholds = thresholds.size
+        for y in prange(height):
+            for x in range(width):
+                v = depth_map[y, x]
+                label = 0
+                while label < n_thresholds and v >= thresholds[label]:
+                    label += 1
+                out[y, x] = label
+
+    @njit('u1[:,::1](f4[:,::1])', cache=True, parallel=True, fastmath=_FASTMATH)
+    def _visualize_impl(normalized):
+        """Convert a normalized float32 depth map to uint8 [0, 255]"""
+        height, width = normalized.shape
+        out = np.empty((height, width), dtype=np.uint8)
+        for y in prange(height):
+            for x in range(width):
+                out[y, x] = np.uint8(normalized[y, x] * 255.0)
+        return out
+
+    @njit('void(i8[:,::1], u1[:,::1], u1[:,:,::1])', cache=True, parallel=True)
+    def _colorize_impl(index, palette, out):
+        """Write palette[index] into a preallocated RGB buffer"""
+        height, width = index.shape
+        for y in prange(height):
+            for x in range(width):
+                color = index[y, x]
+                for c in range(3):
+                    out[y, x, c] = palette[color, c]
+
+    # The image may be a read-only broadcast view of a grayscale map
+    _u1_3d_readonly = types.Array(types.uint8, 3, 'A', readonly=True)
+
+    @njit(
+        types.void(types.uint8[:, :, ::1], _u1_3d_readonly, types.int64, types.uint8[:, :, ::1]),
+        cache=True,
+        parallel=True,
+    )
+    def _blend_impl(overlay, image, alpha_num, out):
+        """Blend two uint8 images as (alpha_num * overlay + (256 - alpha_num) * image) >> 8"""
+        height, width, channels = overlay.shape
+        image_num = 256 - alpha_num
+        for y in prange(height):
+            for x in range(width):
+                for c in range(channels):
+                    out[y, x, c] = (alpha_num * overlay[y, x, c] + image_num * image[y, x, c]) >> 8
+
+else:
+    _normalize_impl = None
+    _threshold_impl = None
+    _visualize_impl = None
+    _colorize_impl = None
+    _blend_impl = None
+
+
+def use_kernel(array: np.ndarray) -> bool:
+    """
+    Check whether the compiled kernels can handle an array
+
+    Args:
+        array: Input array
+
+    Returns:
+        True if Numba is available and the array is a 2D float32 map
+    """
+    return NUMBA_AVAILABLE and array.ndim == 2 and array.dtype == np.float32
+
+
+def use_gpu(array: np.ndarray) -> bool:
+    """
+    Check whether an array should be processed on the GPU
+
+    Args:
+        array: Input array
+
+    Returns:
+        True if GPU offload is enabled and the array is large enough
+    """
+    return CUPY_AVAILABLE and array.size >= GPU_MIN_PIXELS
+
+
+def gpu_normalize(depth_map: np.ndarray, min_val: float, max_val: float, inv_range: float) -> np.ndarray:
+    """Normalize a depth map on the GPU, mapping non-finite values to 0"""
+    d = cp.asarray(depth_map)
+    normalized = (d - min_val) * inv_range
+    normalized[d == max_val] = 1.0
+    normalized[~cp.isfinite(d)] = 0
+    return cp.asnumpy(normalized)
+
+
+def gpu_threshold(depth_map: np.ndarray, thresholds: np.ndarray, dtype=np.uint8) -> np.ndarray:
+    """Label each pixel with the number of sorted thresholds it reaches, on the GPU"""
+    d = cp.asarray(depth_map)
+    segmentation = cp.searchsorted(cp.asarray(thresholds), d, side='right').astype(dtype)
+    # searchsorted sorts NaN past every threshold; the CPU path labels it 0
+    segmentation[cp.isnan(d)] = 0
+    return cp.asnumpy(segmentation)
@@ -6,9 +6,23 @@ import numpy as np
 from typing import List, Tuple, Optional
 import time
 
+from .kernels import use_kernel, use_gpu, gpu_threshold, _threshold_impl
+
 # Configure logger for this module
 logger = logging.getLogger(__name__)
 
+# Above this many valid pixels, KMeans switches to MiniBatchKMeans
+MINIBATCH_KMEANS_MIN_SAMPLES = 200_000
+MINIBATCH_KMEANS_BATCH_SIZE = 4096
+
+# Up to this many distinct depth values, KMeans clusters the values themselves
+# weighted by pixel count instead of every pixel
+UNIQUE_KMEANS_MAX_VALUES = 4096
+
+def _label_dtype(n_labels: int) -> np.dtype:
+    """Smallest unsigned integer dtype that holds labels 0..n_labels-1"""
+    return np.dtype(np.uint8) if n_labels <= 256 else np.dtype(np.uint16)
+
 class DepthSegmenter:
     """Class for segmenting depth maps"""
     
@@ -48,21 +62,58 @@ class DepthSegmenter:
         try:
             # Try sklearn KMeans if available
             try:
-                from sklearn.cluster import KMeans
-                
-                # Reshape for sklearn (n_samples, n_features)
-                X = valid_values.reshape(-1, 1)
+                from sklearn.cluster import KMeans, MiniBatchKMeans
                 
-                # Run KMeans
-                kmeans = KMeans(
-                    n_clusters=n_clusters,
-                    max_iter=iterations,
-                    random_state=random_state,
-                    n_init=1  # For faster execution
+                # Depth maps from 8-bit sources only hold a few distinct values;
+                # clustering those with pixel counts as weights gives the same
+                # clusters for a fraction of the work
+                values, inverse, counts = np.unique(
+                    valid_values, return_inverse=True, return_counts=True
                 )
+                if n_clusters <= values.size <= UNIQUE_KMEANS_MAX_VALUES:
+                    samples, sample_weight = values, counts
+                else:
+                    samples, sample_weight, inverse = valid_values, None, None
+                
+                # Reshape for sklearn (n_samples, n_features); float32 halves
+                # the bytes moved through the distance computations
+                X = samples.astype(np.float32, copy=False).reshape(-1, 1)
+                
+                # Run KMeans on the GPU when offload is enabled and cuML is installed
+                kmeans = None
+                if use_gpu(samples):
+                    try:
+                        from cuml.cluster import KMeans as GPUKMeans
+                        kmeans = GPUKMeans(
+                            n_clusters=n_clusters,
+                            max_iter=iterations,
+                            random_state=random_state,
+                            n_init=1
+                        )
+                    except ImportError:
+                        logger.debug("cuML not available, clustering on the CPU")
+                
+                # Otherwise use mini-batches for large depth maps
+                if kmeans is None and samples.size > MINIBATCH_KMEANS_MIN_SAMPLES:
+                    kmeans = MiniBatchKMeans(
+                        n_clusters=n_clusters,
+                        max_iter=iterations,
+                        batch_size=MINIBATCH_KMEANS_BATCH_SIZE,
+                        random_state=random_state,
+                        n_init=1  # For faster execution
+                    )
+                elif kmeans is None:
+                    kmeans = KMeans(
+                        n_clusters=n_clusters,
+                        max_iter=iterations,
+                        random_state=random_state,
+                        n_init=1  # For faster execution
+                    )
                 
                 start_time = time.time()
-                labels = kmeans.fit_predict(X)
+                labels = kmeans.fit_predict(X, sample_weight=sample_weight)
+                if inverse is not None:
+                    labels = labels[inverse]
                 logger.debug(f"KMeans clustering completed in {time.time() - start_time:.2f} seconds")
                 
                 # Create the segmentation mask
@@ -72,8 +123,8 @@ class DepthSegmenter:
                 # Reshape back to original shape
                 segmentation = segmentation.reshape(depth_map.shape)
                 
-                # Get cluster centers (depths)
-                centers = kmeans.cluster_centers_.flatten()
+                # Get cluster centers (depths) as float64 so callers get plain floats
+                centers = kmeans.cluster_centers_.flatten().astype(np.float64)
                 
                 return segmentation, sorted(centers)
                 
@@ -146,27 +197,46 @@ class DepthSegmenter:
         
         Args:
             depth_map: Normalized depth map
-            thresholds: List of threshold values (0-1)
+            thresholds: List of threshold values (0-1), in any order;
+                duplicates are ignored
             
         Returns:
-            Segmentation mask
+            Segmentation mask (uint8, or uint16 past 255 thresholds)
         """
         if depth_map is None or depth_map.size == 0:
             return None
             
-        if not thresholds:
-            return np.zeros_like(depth_map, dtype=int)
+        if len(thresholds) == 0:
+            return np.zeros_like(depth_map, dtype=np.uint8)
             
-        # Sort thresholds
-        thresholds = sorted(thresholds)
+        # Compare in the depth map's own precision, like the compiled kernel,
+        # so labels don't depend on which path runs; then sort and de-duplicate
+        thresholds = np.asarray(thresholds, dtype=np.float64)
+        if np.issubdtype(depth_map.dtype, np.floating):
+            thresholds = thresholds.astype(depth_map.dtype)
+        thresholds = np.unique(thresholds)
+        
+        # Labels run from 0 to len(thresholds); the smallest dtype that fits
+        # them keeps every later pass over the mask cheap
+        dtype = _label_dtype(thresholds.size + 1)
         
-        # Create segmentation mask
-        segmentation = np.zeros_like(depth_map, dtype=int)
+        if use_gpu(depth_map):
+            return gpu_threshold(depth_map, thresholds, dtype)
         
-        # Apply thresholds
-        for i, threshold in enumerate(thresholds):
-            mask = depth_map >= threshold
-            segmentation[mask] = i + 1  # Segment ID (1-based)
+        if use_kernel(depth_map):
+            segmentation = np.empty(depth_map.shape, dtype=dtype)
+            _threshold_impl(
+                np.ascontiguousarray(depth_map), thresholds, segmentation
+            )
+            return segmentation
+        
+        # Segment ID is the number of thresholds each pixel reaches (1-based),
+        # found with one binary search per pixel
+        segmentation = np.searchsorted(thresholds, depth_map, side='right').astype(dtype)
+        
+        # searchsorted sorts NaN past every threshold; keep it as background
+        if np.issubdtype(depth_map.dtype, np.floating):
+            segmentation[np.isnan(depth_map)] = 0
         
         return segmentation
     
@@ -183,7 +253,7 @@ class DepthSegmenter:
             n_bands: Number of bands
             
         Returns:
-            Segmentation mask
+            Segmentation mask (uint8, or uint16 past 256 bands)
         """
         if depth_map is None or depth_map.size == 0:
             return None
@@ -193,10 +263,32 @@ class DepthSegmenter:
         
         return DepthSegmenter.threshold_segmentation(depth_map, thresholds)
     
+    @staticmethod
+    def segment_areas(segmentation: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Find the segments present in a segmentation mask and their areas
+        
+        Args:
+            segmentation: Segmentation mask
+            
+        Returns:
+            Tuple of (sorted segment IDs, pixel count of each segment)
+        """
+        # Non-negative integer labels are counted in one O(N) pass instead of sorting
+        if np.issubdtype(segmentation.dtype, np.integer) and (
+            segmentation.dtype.kind == 'u' or segmentation.size == 0 or segmentation.min() >= 0
+        ):
+            counts = np.bincount(segmentation.ravel())
+            segment_ids = np.flatnonzero(counts)
+            return segment_ids, counts[segment_ids]
+            
+        return np.unique(segmentation, return_counts=True)
+    
     @staticmethod
     def extract_binary_mask(
         segmentation: np.ndarray, 
-        segment_id: int
+        segment_id: int,
+        out: Optional[np.ndarray] = None
     ) -> np.ndarray:
         """
         Extract a binary mask for a specific segment
@@ -204,15 +296,21 @@ class DepthSegmenter:
         Args:
             segmentation: Segmentation mask
             segment_id: Segment ID to extract
+            out: Optional preallocated uint8 buffer of the same shape to write into
             
         Returns:
-            Binary mask
+            Binary mask (uint8, 0 or 255)
         """
         if segmentation is None:
             return None
             
-        binary_mask = (segmentation == segment_id).astype(np.uint8) * 255
-        return binary_mask
+        # Compare straight into the uint8 output and scale in place,
+        # without bool or int temporaries
+        if out is None:
+            out = np.empty(segmentation.shape, dtype=np.uint8)
+        np.equal(segmentation, segment_id, out=out)
+        out *= 255
+        return out
     
     @staticmethod
     def clean_binary_mask(
@@ -235,33 +333,72 @@ class DepthSegmenter:
             return None
             
         try:
-            # Try using OpenCV
-            import cv2
-            
-            # Convert to proper binary mask (0 or 255)
-            binary = np.where(mask > 127, 255, 0).astype(np.uint8)
+            # Prefer scipy.ndimage, whose labelling and area count are fully vectorized
+            return DepthSegmenter._clean_binary_mask_ndimage(mask, min_area, kernel_size)
+        except ImportError:
+            pass
             
-            # Create a kernel for morphological operations
-            kernel = np.ones((kernel_size, kernel_size), np.uint8)
+        try:
+            # Fall back to OpenCV
+            return DepthSegmenter._clean_binary_mask_cv2(mask, min_area, kernel_size)
+        except ImportError:
+            logger.warning("Neither scipy nor OpenCV available, returning original mask")
+            return mask
+    
+    @staticmethod
+    def _clean_binary_mask_ndimage(
+        mask: np.ndarray, 
+        min_area: int, 
+        kernel_size: int
+    ) -> np.ndarray:
+        """Clean a binary mask with scipy.ndimage"""
+        from scipy import ndimage
+        
+        structure = np.ones((kernel_size, kernel_size), dtype=bool)
+        # binary_dilation reflects the structure, so an even kernel needs its
+        # origin shifted to land on OpenCV's centre anchor
+        dilation_origin = -1 if kernel_size % 2 == 0 else 0
+        
+        # Morphological closing; the border values make pixels outside the
+        # image neutral, matching OpenCV's default border handling
+        dilated = ndimage.binary_dilation(mask > 127, structure, border_value=0, origin=dilation_origin)
+        closed = ndimage.binary_erosion(dilated, structure, border_value=1)
+        
+        if min_area <= 0:
+            return closed.astype(np.uint8) * 255
             
-            # Apply morphological closing (dilation followed by erosion)
-            closed = cv2.morphologyEx(binary, cv2.MORPH_CLOSE, kernel)
+        # Label 8-connected components and drop small ones with one table lookup
+        labels, _ = ndimage.label(closed, structure=np.ones((3, 3), dtype=bool))
+        areas = np.bincount(labels.ravel())
+        keep = np.where(areas >= min_area, 255, 0).astype(np.uint8)
+        keep[0] = 0  # Background
+        
+        return keep[labels]
+    
+    @staticmethod
+    def _clean_binary_mask_cv2(
+        mask: np.ndarray, 
+        min_area: int, 
+        kernel_size: int
+    ) -> np.ndarray:
+        """Clean a binary mask with OpenCV"""
+        import cv2
+        
+        # Convert to proper binary mask (0 or 255)
+        binary = np.where(mask > 127, 255, 0).astype(np.uint8)
+        
+        # Create a kernel for morphological operations
+        kernel = np.ones((kernel_size, kernel_size), np.uint8)
+        
+        # Apply morphological closing (dilation followed by erosion)
+        closed = cv2.morphologyEx(binary, cv2.MORPH_CLOSE, kernel)
+        
+        if min_area <= 0:
+            return closed
             
-            # Remove small components
-            if min_area > 0:
-                # Find connected components
-                num_labels, labels, stats, _ = cv2.connectedComponentsWithStats(closed, 8, cv2.CV_32S)
-                
-                # Create a new mask keeping only components above min_area
-                cleaned = np.zeros_like(binary)
-                for i in range(1, num_labels):  # Skip background
-                    if stats[i, cv2.CC_STAT_AREA] >= min_area:
-                        cleaned[labels == i] = 255
-                
-                return cleaned
-            else:
-                return closed
-                
-        except ImportError:
-            logger.warning("OpenCV not available, returning original mask")
-            return mask 
\ No newline at end of file
+        # Find connected components and keep those above min_area
+        _, labels, stats, _ = cv2.connectedComponentsWithStats(closed, 8, cv2.CV_32S)
+        keep = np.where(stats[:, cv2.CC_STAT_AREA] >= min_area, 255, 0).astype(np.uint8)
+        keep[0] = 0  # Background
+        
+        return keep[labels]
@@ -103,6 +103,41 @@ class TestDepthLoader(unittest.TestCase):
         self.assertEqual(visualization[50, 50], 255)
         self.assertEqual(visualization[0, 0], 0)
     
+    def test_visualize_uint8_depth_map(self):
+        """Test visualizing an 8-bit depth map stretches it to the full range"""
+        depth_map = np.full((100, 100), 64, dtype=np.uint8)
+        depth_map[25:75, 25:75] = 192
+        depth_map[0, 0] = 128
+        
+        visualization = DepthLoader.visualize_depth_map(depth_map)
+        
+        # The lookup table must match the normalize-then-scale result
+        self.assertEqual(visualization.dtype, np.uint8)
+        self.assertEqual(visualization[50, 50], 255)
+        self.assertEqual(visualization[10, 10], 0)
+        self.assertEqual(visualization[0, 0], int(0.5 * 255))
+    
+    def test_visualize_uint8_depth_map_max_is_white(self):
+        """Test that the brightest level maps to 255 for ranges whose reciprocal rounds down"""
+        depth_map = np.full((10, 10), 10, dtype=np.uint8)
+        depth_map[5:, 5:] = 59  # max - min == 49, where r * (1 / r) < 1
+        
+        visualization = DepthLoader.visualize_depth_map(depth_map)
+        
+        self.assertEqual(visualization.max(), 255)
+        self.assertEqual(visualization[9, 9], 255)
+    
+    def test_normalize_max_is_exactly_one(self):
+        """Test that the max pixel normalizes to exactly 1.0 for ranges whose reciprocal rounds down"""
+        for dtype in (np.float64, np.float32):
+            depth_map = np.full((10, 10), 10.0, dtype=dtype)
+            depth_map[5:, 5:] = 59.0  # max - min == 49, where r * (1 / r) < 1
+            
+            normalized = DepthLoader.normalize_depth_map(depth_map)
+            
+            self.assertEqual(normalized.max(), 1.0)
+            self.assertEqual(DepthLoader.visualize_depth_map(depth_map).max(), 255)
+    
     def test_normalize_already_normalized(self):
         """Test normalizing an already normalized depth map"""
         # Create a depth map already in [0, 1] range
@@ -126,6 +161,20 @@ class TestDepthLoader(unittest.TestCase):
         
         # Should be all zeros for constant input
         self.assertTrue(np.allclose(normalized, 0.0))
+    
+    def test_normalize_non_finite_values(self):
+        """Test that non-finite values are zeroed for float32 and float64 input"""
+        depth_map = np.linspace(0, 100, 100 * 100).reshape(100, 100)
+        depth_map[0, 0] = np.nan
+        depth_map[99, 99] = np.inf
+        
+        normalized_64 = DepthLoader.normalize_depth_map(depth_map.copy())
+        normalized_32 = DepthLoader.normalize_depth_map(depth_map.astype(np.float32))
+        
+        # Non-finite pixels become 0 and both paths agree
+        self.assertEqual(normalized_32[0, 0], 0.0)
+        self.assertEqual(normalized_32[99, 99], 0.0)
+        self.assertTrue(np.allclose(normalized_32, normalized_64, atol=1e-6))
 
 if __name__ == "__main__":
     unittest.main() 
\ No newline at end of file
@@ -1,7 +1,9 @@
 #!/usr/bin/env python3
 # encoding: UTF-8
 
+import importlib.util
 import unittest
+from unittest.mock import patch
 import numpy as np
 
 # Import the module to test
@@ -22,7 +24,7 @@ class TestDepthSegmenter(unittest.TestCase):
         """Test KMeans segmentation"""
         # Segment with 3 clusters
         segmentation, centers = DepthSegmenter.kmeans_segmentation(
-            self.depth_map, n_clusters=3, iterations=10
+            self.depth_map, n_clusters=3, iterations=10, random_state=0
         )
         
         # Check that the segmentation has the right shape
@@ -45,6 +47,21 @@ class TestDepthSegmenter(unittest.TestCase):
         self.assertNotEqual(segmentation[16, 50], segmentation[50, 50])
         self.assertNotEqual(segmentation[50, 50], segmentation[80, 50])
     
+    def test_kmeans_segmentation_many_values(self):
+        """Test KMeans on a depth map with more distinct values than the fast path"""
+        rng = np.random.default_rng(0)
+        noise = rng.normal(0, 0.01, self.depth_map.shape).astype(np.float32)
+        
+        segmentation, centers = DepthSegmenter.kmeans_segmentation(
+            self.depth_map + noise, n_clusters=3, iterations=10, random_state=0
+        )
+        
+        # The three bands are still recovered
+        self.assertEqual(len(np.unique(segmentation)), 3)
+        self.assertTrue(np.allclose(centers, [0.2, 0.5, 0.8], atol=0.01))
+        self.assertNotEqual(segmentation[16, 50], segmentation[50, 50])
+        self.assertNotEqual(segmentation[50, 50], segmentation[80, 50])
+    
     def test_threshold_segmentation(self):
         """Test threshold segmentation"""
         # Segment with two thresholds
@@ -70,6 +87,42 @@ class TestDepthSegmenter(unittest.TestCase):
         # Values >= 0.6 should be segment 2
         self.assertEqual(segmentation[80, 50], 2)
     
+    def test_threshold_segmentation_dtypes(self):
+        """Test that float32 and float64 depth maps segment identically"""
+        depth_map = np.linspace(0, 1, 100 * 100, dtype=np.float32).reshape(100, 100)
+        thresholds = [0.75, 0.25, 0.5]
+        
+        segmentation_32 = DepthSegmenter.threshold_segmentation(depth_map, thresholds)
+        segmentation_64 = DepthSegmenter.threshold_segmentation(
+            depth_map.astype(np.float64), thresholds
+        )
+        
+        self.assertTrue(np.array_equal(segmentation_32, segmentation_64))
+        self.assertEqual(set(np.unique(segmentation_32)), {0, 1, 2, 3})
+    
+    def test_threshold_segmentation_float32_precision(self):
+        """Test that float32 pixels are compared against float32 thresholds"""
+        # float32(0.7) is just below 0.7, so a float64 comparison would miss it
+        depth_map = np.full((4, 4), 0.7, dtype=np.float32)
+        segmentation = DepthSegmenter.threshold_segmentation(depth_map, [0.7])
+        self.assertTrue(np.all(segmentation == 1))
+        
+        # The NumPy fallback labels it the same way as the compiled kernel
+        with patch("core.depth_processing.core.segmentation.use_kernel", return_value=False):
+            fallback = DepthSegmenter.threshold_segmentation(depth_map, [0.7])
+        self.assertTrue(np.array_equal(fallback, segmentation))
+    
+    def test_threshold_segmentation_label_dtype(self):
+        """Test that labels use the smallest unsigned dtype that fits them"""
+        segmentation = DepthSegmenter.threshold_segmentation(self.depth_map, [0.3, 0.6])
+        self.assertEqual(segmentation.dtype, np.uint8)
+        
+        # 300 thresholds give 301 labels, which no longer fit in uint8
+        thresholds = np.linspace(0, 1, 302)[1:-1]
+        segmentation = DepthSegmenter.threshold_segmentation(self.depth_map, thresholds)
+        self.assertEqual(segmentation.dtype, np.uint16)
+        self.assertEqual(segmentation[80, 50], 240)
+    
     def test_depth_band_segmentation(self):
         """Test depth band segmentation"""
         # Segment into 3 bands
@@ -95,6 +148,21 @@ class TestDepthSegmenter(unittest.TestCase):
         # Band 3: 0.67-1.0
         self.assertEqual(segmentation[80, 50], 2)
     
+    def test_segment_areas(self):
+        """Test finding segment IDs and their pixel counts"""
+        segmentation = np.zeros((100, 100), dtype=np.int32)
+        segmentation[0:10, :] = 3
+        segmentation[10:15, :] = 7
+        
+        segment_ids, areas = DepthSegmenter.segment_areas(segmentation)
+        self.assertEqual(segment_ids.tolist(), [0, 3, 7])
+        self.assertEqual(areas.tolist(), [8500, 1000, 500])
+        
+        # Float and negative labels give the same answer through np.unique
+        segment_ids, areas = DepthSegmenter.segment_areas(segmentation.astype(np.float64) - 1)
+        self.assertEqual(segment_ids.tolist(), [-1, 2, 6])
+        self.assertEqual(areas.tolist(), [8500, 1000, 500])
+    
     def test_extract_binary_mask(self):
         """Test extracting a binary mask"""
         # Create a simple segmentation mask
@@ -115,6 +183,12 @@ class TestDepthSegmenter(unittest.TestCase):
         
         # Check that the corner is 0
         self.assertEqual(binary_mask[0, 0], 0)
+        
+        # A preallocated buffer is filled and returned
+        buffer = np.full((100, 100), 7, dtype=np.uint8)
+        result = DepthSegmenter.extract_binary_mask(segmentation, 1, out=buffer)
+        self.assertIs(result, buffer)
+        self.assertTrue(np.array_equal(buffer, binary_mask))
     
     def test_clean_binary_mask(self):
         """Test cleaning a binary mask"""
@@ -148,6 +222,21 @@ class TestDepthSegmenter(unittest.TestCase):
             # Skip test if OpenCV is not available
             print("Skipping clean_binary_mask test - OpenCV not available")
     
+    def test_clean_binary_mask_backends_agree(self):
+        """Test that the scipy and OpenCV cleaning paths produce the same mask"""
+        if importlib.util.find_spec("cv2") is None or importlib.util.find_spec("scipy") is None:
+            self.skipTest("scipy and OpenCV are both required")
+        
+        # Random noise touching the borders exercises edge handling
+        rng = np.random.default_rng(0)
+        binary_mask = np.where(rng.random((200, 200)) > 0.7, 255, 0).astype(np.uint8)
+        
+        # Even kernels check that both paths use the same anchor
+        for kernel_size in (1, 2, 3, 4, 5, 6):
+            ndimage_mask = DepthSegmenter._clean_binary_mask_ndimage(binary_mask, 20, kernel_size)
+            cv2_mask = DepthSegmenter._clean_binary_mask_cv2(binary_mask, 20, kernel_size)
+            self.assertTrue(np.array_equal(ndimage_mask, cv2_mask))
+    
     def test_empty_input(self):
         """Test handling of empty input"""
         # Test with None input
@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+# encoding: UTF-8
+
+import io
+import sys
+import types
+import unittest
+from unittest.mock import patch
+import numpy as np
+from PIL import Image
+
+# Import the module to test
+from core.depth_processing.utils.visualizer import DepthVisualizer
+
+class TestDepthVisualizer(unittest.TestCase):
+    """Tests for the DepthVisualizer class"""
+
+    def setUp(self):
+        """Set up for tests"""
+        # Create a test segmentation with three horizontal bands
+        self.segmentation = np.zeros((100, 100), dtype=np.int32)
+        self.segmentation[33:66, :] = 1
+        self.segmentation[66:100, :] = 2
+
+        self.colormap = np.array([
+            [255, 0, 0],
+            [0, 255, 0],
+            [0, 0, 255],
+        ], dtype=np.uint8)
+
+    def test_create_colormap(self):
+        """Test creating a cached colormap"""
+        colormap = DepthVisualizer.create_colormap(12)
+
+        # Check shape and dtype
+        self.assertEqual(colormap.shape, (12, 3))
+        self.assertEqual(colormap.dtype, np.uint8)
+
+        # Repeated calls share one read-only array
+        self.assertIs(DepthVisualizer.create_colormap(12), colormap)
+        self.assertFalse(colormap.flags.writeable)
+
+    def test_visualize_segmentation(self):
+        """Test visualizing a segmentation with a colormap"""
+        visualization = DepthVisualizer.visualize_segmentation(self.segmentation, self.colormap)
+
+        # Check shape and dtype
+        self.assertEqual(visualization.shape, (100, 100, 3))
+        self.assertEqual(visualization.dtype, np.uint8)
+
+        # Each band gets its own color
+        self.assertEqual(visualization[16, 50].tolist(), [255, 0, 0])
+        self.assertEqual(visualization[50, 50].tolist(), [0, 255, 0])
+        self.assertEqual(visualization[80, 50].tolist(), [0, 0, 255])
+
+    def test_visualize_segmentation_sparse_labels(self):
+        """Test that colors follow segment order, not segment IDs"""
+        segmentation = self.segmentation * 7 + 3  # Labels 3, 10, 17
+
+        visualization = DepthVisualizer.visualize_segmentation(segmentation, self.colormap)
+
+        self.assertEqual(visualization[16, 50].tolist(), [255, 0, 0])
+        self.assertEqual(visualization[50, 50].tolist(), [0, 255, 0])
+        self.assertEqual(visualization[80, 50].tolist(), [0, 0, 255])
+
+    def test_visualize_segmentation_float_labels(self):
+        """Test visualizing a float segmentation as returned by KMeans"""
+        visualization = DepthVisualizer.visualize_segmentation(
+            self.segmentation.astype(np.float64) + 1, self.colormap
+        )
+
+        self.assertEqual(visualization[16, 50].tolist(), [255, 0, 0])
+        self.assertEqual(visualization[80, 50].tolist(), [0, 0, 255])
+
+    def test_visualize_segmentation_out_buffer(self):
+        """Test writing the visualization into a preallocated buffer"""
+        buffer = np.empty((100, 100, 3), dtype=np.uint8)
+
+        visualization = DepthVisualizer.visualize_segmentation(
+            self.segmentation, self.colormap, out=buffer
+        )
+
+        self.assertIs(visualization, buffer)
+        self.assertEqual(buffer[80, 50].tolist(), [0, 0, 255])
+
+    def test_create_colormap_old_matplotlib(self):
+        """Test that matplotlib releases without the colormap registry use cm.get_cmap"""
+        requested = []
+        def get_cmap(name, lut):
+            requested.append((name, lut))
+            return lambda values: np.tile([0.0, 0.5, 1.0, 1.0], (len(values), 1))
+        
+        matplotlib = types.ModuleType("matplotlib")
+        matplotlib.cm = types.SimpleNamespace(get_cmap=get_cmap)
+        DepthVisualizer.create_colormap.cache_clear()
+        try:
+            with patch.dict(sys.modules, {"matplotlib": matplotlib}):
+                colormap = DepthVisualizer.create_colormap(3)
+        finally:
+            DepthVisualizer.create_colormap.cache_clear()
+        
+        self.assertEqual(requested, [("tab10", 3)])
+        self.assertTrue(np.array_equal(colormap, [[0, 127, 255]] * 3))
+    
+    def test_visualize_segmentation_short_colormap(self):
+        """Test that a colormap shorter than the segment count is extended"""
+        visualization = DepthVisualizer.visualize_segmentation(
+            self.segmentation, self.colormap[:1]
+        )
+
+        # The given color is kept and the extension is stable across calls
+        self.assertEqual(visualization[16, 50].tolist(), [255, 0, 0])
+        again = DepthVisualizer.visualize_segmentation(self.segmentation, self.colormap[:1])
+        self.assertTrue(np.array_equal(visualization, again))
+
+    def test_create_overlay(self):
+        """Test blending a segmentation over a grayscale image"""
+        image = np.full((100, 100), 100, dtype=np.uint8)
+
+        overlay = DepthVisualizer.create_overlay(image, self.segmentation, 0.5, self.colormap)
+
+        # Check shape and dtype
+        self.assertEqual(overlay.shape, (100, 100, 3))
+        self.assertEqual(overlay.dtype, np.uint8)
+
+        # Half of each color plus half of the gray, within rounding
+        expected = 0.5 * np.array([255, 0, 0]) + 0.5 * 100
+        self.assertTrue(np.all(np.abs(overlay[16, 50] - expected) <= 1))
+
+        # Fully opaque and fully transparent overlays reproduce the inputs
+        opaque = DepthVisualizer.create_overlay(image, self.segmentation, 1.0, self.colormap)
+        clear = DepthVisualizer.create_overlay(image, self.segmentation, 0.0, self.colormap)
+        self.assertEqual(opaque[80, 50].tolist(), [0, 0, 255])
+        self.assertEqual(clear[80, 50].tolist(), [100, 100, 100])
+
+    def test_create_comparison_image(self):
+        """Test building a side-by-side comparison image"""
+        original = np.zeros((100, 100), dtype=np.float32)
+        original[:, 50:] = 1.0
+
+        comparison = DepthVisualizer.create_comparison_image(
+            original, self.segmentation, self.colormap
+        )
+
+        # Check shape and dtype
+        self.assertEqual(comparison.shape, (100, 200, 3))
+        self.assertEqual(comparison.dtype, np.uint8)
+
+        # Left half is the grayscale original, right half the segmentation
+        self.assertEqual(comparison[10, 10].tolist(), [0, 0, 0])
+        self.assertEqual(comparison[10, 60].tolist(), [255, 255, 255])
+        self.assertEqual(comparison[80, 150].tolist(), [0, 0, 255])
+
+    def test_export_mask(self):
+        """Test exporting a binary mask as PNG round-trips losslessly"""
+        mask = np.where(self.segmentation == 1, 255, 0).astype(np.uint8)
+
+        png_bytes = DepthVisualizer.export_image(mask, is_mask=True)
+
+        self.assertTrue(png_bytes.startswith(b"\x89PNG"))
+        self.assertTrue(np.array_equal(np.array(Image.open(io.BytesIO(png_bytes))), mask))
+
+    def test_none_input(self):
+        """Test handling of None input"""
+        self.assertIsNone(DepthVisualizer.visualize_segmentation(None))
+
+if __name__ == "__main__":
+    unittest.main()
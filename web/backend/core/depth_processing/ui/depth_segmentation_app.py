@@ -4,10 +4,11 @@
 import os
 import sys
 import numpy as np
-from PIL import Image
 import tempfile
 import logging
 import io
+import threading
+from concurrent.futures import ThreadPoolExecutor
 
 # Add parent directories to the Python path
 parent_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..'))
@@ -25,6 +26,81 @@ except ImportError as e:
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+@st.cache_data(show_spinner=False)
+def load_and_normalize(file_bytes, suffix):
+    """
+    Load, normalize and visualize an uploaded depth map
+    
+    Cached on the file contents, so widget changes don't reload the file.
+    
+    Returns:
+        Tuple of (depth map, normalized map, visualization); trailing items
+        are None when a step fails
+    """
+    # Save the uploaded file to a temporary file for the loader
+    with tempfile.NamedTemporaryFile(delete=False, suffix=suffix) as temp:
+        temp.write(file_bytes)
+        temp_path = temp.name
+    
+    try:
+        depth_map = DepthLoader.load_depth_map(temp_path)
+        if depth_map is None:
+            return None, None, None
+        
+        normalized = DepthLoader.normalize_depth_map(depth_map)
+        if normalized is None:
+            return depth_map, None, None
+        
+        return depth_map, normalized, DepthLoader.visualize_depth_map(normalized)
+    finally:
+        # Clean up temporary file
+        try:
+            os.unlink(temp_path)
+        except OSError:
+            pass
+
+@st.cache_data(show_spinner=False)
+def segment_depth_map(file_bytes, suffix, method, n_clusters=None, thresholds=None, n_bands=None):
+    """
+    Segment an uploaded depth map
+    
+    Cached on the file contents and segmentation parameters, so only changing
+    those re-runs the (potentially slow) segmentation.
+    
+    Returns:
+        Tuple of (segmentation mask, KMeans cluster centers)
+    """
+    _, normalized, _ = load_and_normalize(file_bytes, suffix)
+    
+    if method == "KMeans Clustering":
+        return DepthSegmenter.kmeans_segmentation(normalized, n_clusters=n_clusters)
+    elif method == "Depth Thresholds":
+        return DepthSegmenter.threshold_segmentation(normalized, thresholds=thresholds), []
+    elif method == "Equal Depth Bands":
+        return DepthSegmenter.depth_band_segmentation(normalized, n_bands=n_bands), []
+    return None, []
+
+# Per-worker scratch buffer for raw masks that are only an input to cleaning
+_mask_buffers = threading.local()
+
+def build_mask(segmentation, segment_id, clean_masks, min_area, kernel_size):
+    """Extract the binary mask for one segment and clean it if requested"""
+    if not clean_masks:
+        return DepthSegmenter.extract_binary_mask(segmentation, segment_id)
+    
+    # Reuse this worker's uint8 buffer instead of allocating a raw mask per segment
+    mask_buf = getattr(_mask_buffers, 'buf', None)
+    if mask_buf is None or mask_buf.shape != segmentation.shape:
+        mask_buf = _mask_buffers.buf = np.empty(segmentation.shape, dtype=np.uint8)
+    
+    binary_mask = DepthSegmenter.extract_binary_mask(segmentation, segment_id, out=mask_buf)
+    cleaned = DepthSegmenter.clean_binary_mask(
+        binary_mask, min_area=min_area, kernel_size=kernel_size
+    )
+    
+    # Cleaning hands back its input when no backend is installed
+    return cleaned.copy() if cleaned is mask_buf else cleaned
+
 def main():
     st.set_page_config(
         page_title="Depth Map Segmentation Tool",
@@ -78,6 +154,8 @@ def main():
         if clean_masks:
             min_area = st.slider("Minimum area (pixels)", 10, 1000, 100)
             kernel_size = st.slider("Morphological kernel size", 1, 15, 3, 2)
+        else:
+            min_area, kernel_size = None, None
     
     # File uploader
     uploaded_file = st.file_uploader(
@@ -89,29 +167,22 @@ def main():
         # Create columns for displaying images
         col1, col2 = st.columns(2)
         
-        # Save the uploaded file to a temporary file
-        with tempfile.NamedTemporaryFile(delete=False, suffix="." + uploaded_file.name.split(".")[-1]) as temp:
-            temp.write(uploaded_file.getvalue())
-            temp_path = temp.name
+        # The file contents key the cached load and segmentation steps
+        file_bytes = uploaded_file.getvalue()
+        suffix = "." + uploaded_file.name.split(".")[-1]
         
         try:
-            # Load the depth map
-            depth_map = DepthLoader.load_depth_map(temp_path)
+            # Load, normalize and visualize the depth map
+            depth_map, normalized, visualization = load_and_normalize(file_bytes, suffix)
             
             if depth_map is None:
                 st.error("Failed to load depth map. Ensure the file is valid.")
                 return
             
-            # Normalize the depth map
-            normalized = DepthLoader.normalize_depth_map(depth_map)
-            
             if normalized is None:
                 st.error("Failed to normalize depth map. Check for invalid values.")
                 return
             
-            # Visualize the normalized depth map
-            visualization = DepthLoader.visualize_depth_map(normalized)
-            
             # Display the depth map
             with col1:
                 st.subheader("Original Depth Map")
@@ -124,12 +195,9 @@ def main():
                 st.markdown(f"- Data type: {depth_map.dtype}")
             
             # Segment the depth map
-            segmentation = None
-            
             if method == "KMeans Clustering":
-                # KMeans segmentation
-                segmentation, centers = DepthSegmenter.kmeans_segmentation(
-                    normalized, n_clusters=n_clusters
+                segmentation, centers = segment_depth_map(
+                    file_bytes, suffix, method, n_clusters=n_clusters
                 )
                 
                 # Display cluster centers
@@ -139,15 +207,13 @@ def main():
                         st.markdown(f"- Cluster {i+1}: {center:.4f}")
                 
             elif method == "Depth Thresholds":
-                # Threshold segmentation
-                segmentation = DepthSegmenter.threshold_segmentation(
-                    normalized, thresholds=thresholds
+                segmentation, _ = segment_depth_map(
+                    file_bytes, suffix, method, thresholds=thresholds
                 )
                 
             elif method == "Equal Depth Bands":
-                # Depth band segmentation
-                segmentation = DepthSegmenter.depth_band_segmentation(
-                    normalized, n_bands=n_bands
+                segmentation, _ = segment_depth_map(
+                    file_bytes, suffix, method, n_bands=n_bands
                 )
             
             if segmentation is None:
@@ -163,7 +229,7 @@ def main():
                 st.image(segment_vis, use_column_width=True)
                 
                 # Count unique segments
-                unique_segments = np.unique(segmentation)
+                unique_segments, _ = DepthSegmenter.segment_areas(segmentation)
                 st.markdown(f"**Found {len(unique_segments)} segments**")
             
             # Create a header for binary masks
@@ -175,20 +241,26 @@ def main():
             # Keep track of selected masks
             selected_masks = []
             
-            # Create a binary mask for each segment
+            # Build the masks of all segments except background (0) in parallel;
+            # the morphology and labelling run in C and release the GIL.
+            # Cleaned masks are kept by segment ID for the export below
+            segment_ids = [segment_id for segment_id in unique_segments if segment_id != 0]
+            with ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 1)) as executor:
+                built_masks = executor.map(
+                    lambda segment_id: build_mask(
+                        segmentation, segment_id, clean_masks, min_area, kernel_size
+                    ),
+                    segment_ids
+                )
+                binary_masks = dict(zip(segment_ids, built_masks))
+            
+            # Display a binary mask for each segment on the main thread
             for i, segment_id in enumerate(unique_segments):
                 # Skip background (0)
                 if segment_id == 0:
                     continue
                     
-                # Extract binary mask
-                binary_mask = DepthSegmenter.extract_binary_mask(segmentation, segment_id)
-                
-                # Clean the mask if requested
-                if clean_masks:
-                    binary_mask = DepthSegmenter.clean_binary_mask(
-                        binary_mask, min_area=min_area, kernel_size=kernel_size
-                    )
+                binary_mask = binary_masks[segment_id]
                 
                 # Display the mask
                 col_idx = (i - 1) % len(mask_cols)
@@ -209,28 +281,16 @@ def main():
                     import zipfile
                     zip_buffer = io.BytesIO()
                     
-                    with zipfile.ZipFile(zip_buffer, 'w', zipfile.ZIP_DEFLATED) as zip_file:
+                    # PNGs are already deflated, so store them as-is
+                    with zipfile.ZipFile(zip_buffer, 'w', zipfile.ZIP_STORED) as zip_file:
                         for segment_id in selected_masks:
-                            # Extract binary mask
-                            binary_mask = DepthSegmenter.extract_binary_mask(
-                                segmentation, segment_id
+                            # Encode the already cleaned mask as PNG
+                            mask_bytes = DepthVisualizer.export_image(
+                                binary_masks[segment_id], is_mask=True
                             )
                             
-                            # Clean the mask if requested
-                            if clean_masks:
-                                binary_mask = DepthSegmenter.clean_binary_mask(
-                                    binary_mask, min_area=min_area, kernel_size=kernel_size
-                                )
-                            
-                            # Convert to PIL Image
-                            mask_image = Image.fromarray(binary_mask)
-                            
-                            # Save to bytes
-                            mask_bytes = io.BytesIO()
-                            mask_image.save(mask_bytes, format="PNG")
-                            
                             # Add to ZIP
-                            zip_file.writestr(f"mask_{segment_id}.png", mask_bytes.getvalue())
+                            zip_file.writestr(f"mask_{segment_id}.png", mask_bytes)
                     
                     # Offer the ZIP for download
                     zip_buffer.seek(0)
@@ -248,13 +308,6 @@ def main():
         except Exception as e:
             logger.error(f"Error processing depth map: {e}", exc_info=True)
             st.error(f"Error processing depth map: {str(e)}")
-        
-        finally:
-            # Clean up temporary file
-            try:
-                os.unlink(temp_path)
-            except:
-                pass
 
 if __name__ == "__main__":
     main() 
\ No newline at end of file
@@ -2,21 +2,42 @@
 # encoding: UTF-8
 
 import logging
+import functools
 import numpy as np
 from typing import Optional, List, Tuple
 import io
 
+from ..core.kernels import NUMBA_AVAILABLE, _colorize_impl, _blend_impl
+from ..core.segmentation import DepthSegmenter
+
 # Configure logger for this module
 logger = logging.getLogger(__name__)
 
+# Distinct colors used when matplotlib is not available
+_FALLBACK_COLORS = np.array([
+    [255, 0, 0],     # Red
+    [0, 255, 0],     # Green
+    [0, 0, 255],     # Blue
+    [255, 255, 0],   # Yellow
+    [255, 0, 255],   # Magenta
+    [0, 255, 255],   # Cyan
+    [255, 128, 0],   # Orange
+    [128, 0, 255],   # Purple
+    [0, 128, 255],   # Light blue
+    [255, 128, 128], # Pink
+], dtype=np.uint8)
+
 class DepthVisualizer:
     """Class for visualizing depth maps and segmentation results"""
     
     @staticmethod
+    @functools.lru_cache(maxsize=32)
     def create_colormap(n_colors: int = 10) -> np.ndarray:
         """
         Create a colormap for visualization
         
+        Colormaps are cached per size and returned read-only; copy before modifying.
+        
         Args:
             n_colors: Number of colors in the colormap
             
@@ -25,47 +46,32 @@ class DepthVisualizer:
         """
         try:
             # Try using matplotlib
-            import matplotlib.pyplot as plt
-            import matplotlib.colors as mcolors
-            
-            # Create a colormap
-            cmap = plt.cm.get_cmap('tab10', n_colors)
-            
-            # Convert to RGB array
-            colors = []
-            for i in range(n_colors):
-                color = cmap(i)[:3]  # RGB tuple
-                colors.append([int(c * 255) for c in color])
+            import matplotlib
             
-            return np.array(colors)
+            # Sample the whole colormap in one call
+            try:
+                cmap = matplotlib.colormaps['tab10'].resampled(n_colors)
+            except AttributeError:
+                # matplotlib < 3.6 has no resampled(), and < 3.5 no colormap registry
+                from matplotlib import cm
+                cmap = cm.get_cmap('tab10', n_colors)
+            colors = (cmap(np.arange(n_colors))[:, :3] * 255).astype(np.uint8)
         except ImportError:
             # Fallback to manual colormap
             logger.warning("matplotlib not available, using fallback colormap")
             
-            # Create a simple colormap with distinct colors
-            colors = [
-                [255, 0, 0],     # Red
-                [0, 255, 0],     # Green
-                [0, 0, 255],     # Blue
-                [255, 255, 0],   # Yellow
-                [255, 0, 255],   # Magenta
-                [0, 255, 255],   # Cyan
-                [255, 128, 0],   # Orange
-                [128, 0, 255],   # Purple
-                [0, 128, 255],   # Light blue
-                [255, 128, 128], # Pink
-            ]
-            
-            # Repeat colors if needed
-            while len(colors) < n_colors:
-                colors.extend(colors[:n_colors - len(colors)])
-            
-            return np.array(colors[:n_colors])
+            # Repeat the distinct colors if needed
+            n_repeats = -(-n_colors // len(_FALLBACK_COLORS))
+            colors = np.tile(_FALLBACK_COLORS, (n_repeats, 1))[:n_colors]
+        
+        colors.setflags(write=False)
+        return colors
     
     @staticmethod
     def visualize_segmentation(
         segmentation: np.ndarray,
-        colormap: Optional[np.ndarray] = None
+        colormap: Optional[np.ndarray] = None,
+        out: Optional[np.ndarray] = None
     ) -> np.ndarray:
         """
         Visualize a segmentation mask with colors
@@ -73,6 +79,7 @@ class DepthVisualizer:
         Args:
             segmentation: Segmentation mask (integer labels)
             colormap: Optional colormap to use
+            out: Optional preallocated (H, W, 3) uint8 buffer to write into
             
         Returns:
             RGB visualization (uint8)
@@ -81,7 +88,7 @@ class DepthVisualizer:
             return None
             
         # Count the number of unique segments
-        unique_segments = np.unique(segmentation)
+        unique_segments, _ = DepthSegmenter.segment_areas(segmentation)
         n_segments = len(unique_segments)
         
         # Create or adjust colormap
@@ -89,26 +96,35 @@ class DepthVisualizer:
             colormap = DepthVisualizer.create_colormap(n_segments)
         elif len(colormap) < n_segments:
             # Extend colormap
-            extended = np.zeros((n_segments, 3), dtype=np.uint8)
+            extended = np.empty((n_segments, 3), dtype=np.uint8)
             extended[:len(colormap)] = colormap
-            # Fill remaining with random colors
-            for i in range(len(colormap), n_segments):
-                extended[i] = np.random.randint(0, 256, 3)
+            # Fill remaining with random colors in one call; a local seeded
+            # generator keeps colors stable and avoids the global RNG lock
+            rng = np.random.default_rng(0)
+            extended[len(colormap):] = rng.integers(
+                0, 256, (n_segments - len(colormap), 3), dtype=np.uint8
+            )
             colormap = extended
         
-        # Create an RGB image
-        height, width = segmentation.shape
-        visualization = np.zeros((height, width, 3), dtype=np.uint8)
+        # The i-th smallest segment gets the i-th color
+        palette = colormap[np.minimum(np.arange(n_segments), len(colormap) - 1)].astype(np.uint8)
         
-        # Assign colors to segments
-        for i, segment_id in enumerate(unique_segments):
-            mask = segmentation == segment_id
-            if np.any(mask):
-                # Use the colormap to color each segment
-                color = colormap[min(i, len(colormap) - 1)]
-                visualization[mask] = color
+        # Map every pixel to its segment index
+        if np.issubdtype(segmentation.dtype, np.integer) and unique_segments[0] >= 0:
+            remap = np.zeros(int(unique_segments[-1]) + 1, dtype=np.intp)
+            remap[unique_segments] = np.arange(n_segments)
+            index = remap[segmentation]
+        else:
+            index = np.searchsorted(unique_segments, segmentation)
         
-        return visualization
+        # Create the RGB image with a single gather
+        if NUMBA_AVAILABLE and (out is None or out.flags.c_contiguous):
+            if out is None:
+                out = np.empty(segmentation.shape + (3,), dtype=np.uint8)
+            _colorize_impl(np.ascontiguousarray(index, dtype=np.int64), palette, out)
+            return out
+            
+        return np.take(palette, index, axis=0, out=out)
     
     @staticmethod
     def create_overlay(
@@ -134,15 +150,22 @@ class DepthVisualizer:
             
         # Ensure the image is RGB
         if len(image.shape) == 2:
-            # Convert grayscale to RGB
-            rgb_image = np.stack([image] * 3, axis=2)
+            # View grayscale as RGB without copying it
+            rgb_image = np.broadcast_to(image[..., None], image.shape + (3,))
         else:
-            rgb_image = image.copy()
+            rgb_image = image
             
         # Visualize the segmentation
         seg_vis = DepthVisualizer.visualize_segmentation(segmentation, colormap)
         
         # Blend the segmentation with the image
+        if NUMBA_AVAILABLE and rgb_image.dtype == np.uint8 and rgb_image.shape == seg_vis.shape:
+            # Fixed-point blend in one pass, no float temporaries
+            alpha_num = min(max(int(round(alpha * 256)), 0), 256)
+            overlay = np.empty_like(seg_vis)
+            _blend_impl(seg_vis, rgb_image, alpha_num, overlay)
+            return overlay
+            
         overlay = (alpha * seg_vis + (1 - alpha) * rgb_image).astype(np.uint8)
         
         return overlay
@@ -169,32 +192,31 @@ class DepthVisualizer:
             
         # Convert original to grayscale visualization
         if original.max() <= 1.0:
-            # Normalize to 0-255
-            orig_vis = (original * 255).astype(np.uint8)
+            # Normalize to 0-255, casting straight into the uint8 output
+            # instead of through a float temporary the size of the image
+            orig_vis = np.empty(original.shape, dtype=np.uint8)
+            np.multiply(original, 255.0, out=orig_vis, casting='unsafe')
         else:
             orig_vis = original.astype(np.uint8)
             
-        # Convert to RGB
+        # Convert to RGB (a read-only view, copied once into the output below)
         if len(orig_vis.shape) == 2:
-            orig_rgb = np.stack([orig_vis] * 3, axis=2)
+            orig_rgb = np.broadcast_to(orig_vis[..., None], orig_vis.shape + (3,))
         else:
-            orig_rgb = orig_vis
+            orig_rgb = orig_vis[..., :3]
             
         # Visualize segmentation
         seg_vis = DepthVisualizer.visualize_segmentation(segmentation, colormap)
         
-        # Create side-by-side image
-        height, width = original.shape[:2]
-        comparison = np.zeros((height, width * 2, 3), dtype=np.uint8)
-        comparison[:, :width] = orig_rgb
-        comparison[:, width:] = seg_vis
-        
-        return comparison
+        # Create side-by-side image; concatenate fills uninitialized memory
+        # once instead of zeroing it first
+        return np.concatenate((orig_rgb, seg_vis), axis=1)
     
     @staticmethod
     def export_image(
         image: np.ndarray, 
-        format: str = 'png'
+        format: str = 'png',
+        is_mask: bool = False
     ) -> bytes:
         """
         Export an image as bytes
@@ -202,6 +224,8 @@ class DepthVisualizer:
         Args:
             image: Image to export (uint8)
             format: Image format ('png', 'jpg')
+            is_mask: Whether the image is a binary mask; masks are encoded as
+                PNG with the fastest deflate level, which barely affects their size
             
         Returns:
             Image bytes
@@ -209,6 +233,21 @@ class DepthVisualizer:
         if image is None:
             return None
             
+        fast_png = is_mask and format.lower() == 'png'
+        
+        if fast_png and image.ndim == 2:
+            try:
+                # libvips has a faster PNG encoder than PIL when available
+                import pyvips
+                
+                height, width = image.shape
+                vips_image = pyvips.Image.new_from_memory(
+                    np.ascontiguousarray(image).data, width, height, 1, 'uchar'
+                )
+                return vips_image.pngsave_buffer(compression=1)
+            except ImportError:
+                pass
+            
         try:
             # Use PIL for image export
             from PIL import Image
@@ -218,7 +257,10 @@ class DepthVisualizer:
             
             # Save to bytes
             output = io.BytesIO()
-            pil_image.save(output, format=format)
+            if fast_png:
+                pil_image.save(output, format='png', compress_level=1, optimize=False)
+            else:
+                pil_image.save(output, format=format)
             return output.getvalue()
             
         except ImportError:
@@ -231,7 +273,7 @@ class DepthVisualizer:
                 # Set image format
                 if format.lower() == 'png':
                     ext = '.png'
-                    params = [cv2.IMWRITE_PNG_COMPRESSION, 9]
+                    params = [cv2.IMWRITE_PNG_COMPRESSION, 1 if fast_png else 9]
                 else:
                     ext = '.jpg'
                     params = [cv2.IMWRITE_JPEG_QUALITY, 90]
@@ -246,4 +288,4 @@ class DepthVisualizer:
                     
             except ImportError:
                 logger.error("Neither PIL nor OpenCV available for image export")
-                return None 
\ No newline at end of file
+                return None
@@ -1,5 +1,6 @@
 from abc import ABC, abstractmethod
 from typing import Dict, List, Optional, Any
+import itertools
 import logging
 import threading
 
@@ -9,7 +10,14 @@ class Device(ABC):
     """
     Abstract base class for all device types (DLNA, Transcreen, etc.)
     """
+    # Whether instances carry current_position, duration_formatted and playback_progress
+    _supports_progress_fields = False
+
     def __init__(self, device_info: Dict[str, Any]):
+        # to_dict() cache, keyed by a version bumped whenever one of its fields changes
+        self._dict_versions = itertools.count(1)
+        self._dict_version = 0
+        self._dict_cache = None
         self.device_info = device_info
         self.name = device_info.get("device_name", "Unknown Device")
         self.type = device_info.get("type", "unknown")
@@ -18,7 +26,26 @@ class Device(ABC):
         self.is_playing = False
         self.streaming_url = None
         self.streaming_port = None
-        self._lock = threading.Lock()  # Lock for thread-safe status updates
+        # Separate locks so status, playback and streaming updates don't contend
+        self._lock_status = threading.Lock()
+        self._lock_play = threading.Lock()
+        self._lock_stream = threading.Lock()
+
+    def _invalidate_dict_cache(self) -> None:
+        """Make the next to_dict() call rebuild its cached dictionary"""
+        # next() on itertools.count is atomic, so concurrent updates never share a version
+        self._dict_version = next(self._dict_versions)
+
+    @property
+    def current_video(self) -> Optional[str]:
+        """Path or URL of the current video"""
+        return self._current_video
+
+    @current_video.setter
+    def current_video(self, video_path: Optional[str]) -> None:
+        # Assigned directly by the device classes and the device manager
+        self._current_video = video_path
+        self._invalidate_dict_cache()
 
     def update_status(self, status: str) -> None:
         """
@@ -27,8 +54,9 @@ class Device(ABC):
         Args:
             status: New status for the device
         """
-        with self._lock:
+        with self._lock_status:
             self.status = status
+            self._invalidate_dict_cache()
             logger.info(f"Device {self.name} status updated to {status}")
             
     def update_playing(self, is_playing: bool) -> None:
@@ -38,8 +66,9 @@ class Device(ABC):
         Args:
             is_playing: Whether the device is playing
         """
-        with self._lock:
+        with self._lock_play:
             self.is_playing = is_playing
+            self._invalidate_dict_cache()
             logger.info(f"Device {self.name} playing state updated to {is_playing}")
             
     def update_video(self, video_path: str) -> None:
@@ -49,7 +78,7 @@ class Device(ABC):
         Args:
             video_path: Path to the current video
         """
-        with self._lock:
+        with self._lock_play:
             self.current_video = video_path
             logger.info(f"Device {self.name} current video updated to {video_path}")
             
@@ -61,9 +90,10 @@ class Device(ABC):
             streaming_url: URL of the streaming server
             streaming_port: Port of the streaming server
         """
-        with self._lock:
+        with self._lock_stream:
             self.streaming_url = streaming_url
             self.streaming_port = streaming_port
+            self._invalidate_dict_cache()
             logger.info(f"Device {self.name} streaming info updated: {streaming_url} on port {streaming_port}")
             
     @abstractmethod
@@ -117,16 +147,28 @@ class Device(ABC):
         """
         Convert device to dictionary representation
         
+        Reads each attribute once without locking; single attribute reads
+        are atomic, so no update can leave a torn value behind. The result is
+        cached until the update methods or the current_video setter change
+        one of its fields, and each call returns a shallow copy.
+        
         Returns:
             Dict[str, Any]: Dictionary representation of the device
         """
-        return {
-            "name": self.name,
-            "type": self.type,
-            "status": self.status,
-            "current_video": self.current_video,
-            "is_playing": self.is_playing,
-            "streaming_url": self.streaming_url,
-            "streaming_port": self.streaming_port,
-            **self.device_info
-        }
+        version = self._dict_version
+        cached = self._dict_cache
+        if cached is None or cached[0] != version:
+            # Tag with the version read before building, so an update that
+            # races with this call leaves the cache stale rather than wrong
+            cached = (version, {
+                "name": self.name,
+                "type": self.type,
+                "status": self.status,
+                "current_video": self.current_video,
+                "is_playing": self.is_playing,
+                "streaming_url": self.streaming_url,
+                "streaming_port": self.streaming_port,
+                **self.device_info
+            })
+            self._dict_cache = cached
+        return dict(cached[1])
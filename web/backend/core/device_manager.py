@@ -1,4 +1,5 @@
 import re
+import select
 import socket
 import struct
 import sys
@@ -6,20 +7,36 @@ import xml.etree.ElementTree as ET
 import logging
 import json
 import os
+from collections import OrderedDict
 from typing import Dict, List, Optional, Any, Union, Tuple
+import asyncio
 import threading
+from concurrent.futures import ThreadPoolExecutor
 import time
 from datetime import datetime, timezone
-import traceback
+
+import requests
+from requests.adapters import HTTPAdapter
+
+try:
+    # libxml2 parses device descriptions several times faster when installed
+    from lxml import etree as xml_etree
+except ImportError:
+    xml_etree = ET
+
+try:
+    # orjson serializes the device config several times faster when installed
+    import orjson
+except ImportError:
+    orjson = None
 
 if sys.version_info.major == 3:
-    import urllib.request as urllibreq
     import urllib.parse as urllibparse
 else:
-    import urllib2 as urllibreq
     import urlparse as urllibparse
 
 from .device import Device
+from .device_status import DeviceStatus
 from .dlna_device import DLNADevice
 from .transcreen_device import TranscreenDevice
 from .config_service import ConfigService
@@ -37,30 +54,108 @@ SSDP_BROADCAST_PARAMS = [
     "MAN: \"ssdp:discover\"", "MX: 10", "ST: ssdp:all", "", ""]
 SSDP_BROADCAST_MSG = "\r\n".join(SSDP_BROADCAST_PARAMS)
 
+# The SSDP reply headers discovery uses, matched directly on the received bytes
+SSDP_HEADER_RE = re.compile(rb"^(location|usn|st|server)[ \t]*:[ \t]*(.*?)[ \t]*\r?$", re.I | re.M)
+
 UPNP_DEVICE_TYPE = "urn:schemas-upnp-org:device:MediaRenderer:1"
 UPNP_SERVICE_TYPE = "urn:schemas-upnp-org:service:AVTransport:1"
 
+# Description paths, built once: the nested renderer fallback and the
+# AVTransport control URL candidates in order of preference
+DEVICE_QUERY_NESTED = "./device/deviceList/device/[deviceType='{0}']".format(UPNP_DEVICE_TYPE)
+SERVICE_PATHS = (
+    "./serviceList/service/[serviceType='{0}']/controlURL".format(UPNP_SERVICE_TYPE),
+    "./serviceList/service/controlURL",
+    ".//service/[serviceType='{0}']/controlURL".format(UPNP_SERVICE_TYPE),
+    ".//service/controlURL",
+)
+# Device fields read from the direct children of the device element
+DEVICE_INFO_FIELDS = frozenset(("friendlyName", "manufacturer"))
+
 # Constants for video assignment
 MAX_RETRY_ATTEMPTS = 3
 RETRY_DELAY_BASE = 5  # seconds
 PLAYBACK_HEALTH_CHECK_INTERVAL = 30  # seconds
+PLAYBACK_HEALTH_MAX_INTERVAL = 300  # seconds, for devices that keep playing fine
+PLAYBACK_HEALTH_STABLE_CHECKS = 10  # healthy checks before the interval grows
+PLAYBACK_HEALTH_BACKOFF_FACTOR = 1.5
+PLAYBACK_HEALTH_UNREACHABLE_INTERVAL = 60  # seconds, doubled while the device is missing
+PLAYBACK_HEALTH_UNREACHABLE_MAX_INTERVAL = 960  # seconds
+
+# Discovery cycles a renderer's parsed description is reused for, keyed by USN
+RECENT_USN_CYCLES = 3
+# Receive buffer for the SSDP socket, so bursts of replies aren't dropped
+SSDP_RECV_BUFFER_SIZE = 1024 * 1024
+# Device descriptions fetched concurrently per discovery cycle
+DESCRIPTION_FETCH_WORKERS = 16
+# While discovery finds no changes the wait between cycles doubles, up to
+# 2 ** DISCOVERY_IDLE_BACKOFF_STEPS times discovery_interval or MAX_DISCOVERY_INTERVAL
+DISCOVERY_IDLE_BACKOFF_STEPS = 4
+MAX_DISCOVERY_INTERVAL = 60  # seconds
+# Workers registering discovered devices and processing their video assignments
+DISCOVERY_WORKERS = 16
+
+# Short-lived cache of database device rows used by the health and assignment paths
+DB_DEVICE_CACHE_TTL = 10  # seconds
+DB_DEVICE_CACHE_SIZE = 512
+# Device configurations are cached for this long; config changes invalidate them sooner
+CONFIG_CACHE_TTL = float(os.environ.get("DEVICE_CONFIG_CACHE_TTL", "30"))  # seconds
+# Renderers found by discovery are remembered here and probed directly on startup,
+# so they come back without waiting for SSDP replies
+KNOWN_DEVICES_FILE = os.environ.get(
+    "KNOWN_DEVICES_FILE", os.path.join(os.path.expanduser("~"), ".nano-dlna", "known_devices.json")
+)
+# Video file existence checks are cached for this long
+PATH_EXISTS_CACHE_TTL = 30  # seconds
+PATH_EXISTS_CACHE_SIZE = 256
+# An auto-detected streaming IP is reused for this long before detecting it again
+SERVE_IP_CACHE_TTL = 60  # seconds
+# Playback progress writes for the same device within this window are coalesced
+# into one database update
+PLAYBACK_PROGRESS_FLUSH_INTERVAL = 0.5  # seconds
+# An unchanged progress report is still written this often, so the database
+# timestamp keeps vouching for a paused device during the disconnect grace period
+PLAYBACK_PROGRESS_HEARTBEAT = 5  # seconds
+# Per-device assignment and playback history state is guarded by one of this
+# many shard locks (must be a power of two)
+DEVICE_LOCK_SHARDS = 16
+# Playback history keeps stats for at most this many recently played videos per device
+MAX_VIDEOS_PER_DEVICE = 256
+# Status record fields are written under one of this many striped locks (must be a power of two)
+STATUS_LOCK_STRIPES = 32
 
 class DeviceManager:
     """
     Manages DLNA and Transcreen devices, handling device discovery, status tracking,
     and video playback coordination.
+
+    Device state follows a single-writer, many-reader contract: mutations of
+    ``devices``, ``assigned_videos`` and ``last_seen`` happen under
+    ``device_state_lock``, while plain lookups (``get_device``,
+    ``get_devices``, ``dict.get`` on the tracking dicts) read without locking.
+    ``devices`` is replaced wholesale on every change, so readers always see a
+    consistent snapshot; the other dicts rely on single ``get`` calls being
+    atomic. Read-modify-write sequences must still take the lock.
+
+    ``device_status`` is copy-on-write like ``devices``: adding or removing a
+    record publishes a new dict, so readers can iterate it without a lock.
+    Fields of a device's ``DeviceStatus`` record are written in place under
+    that device's striped status lock rather than ``device_state_lock``, so
+    progress updates neither copy the dict nor contend across devices.
     """
     def __init__(self):
         """Initialize the device manager with consolidated locks for deadlock prevention"""
         # SECURITY FIX: Consolidated lock architecture (8 locks → 4 locks)
-        # Hierarchical lock ordering: device_state_lock → assignment_lock → monitoring_lock → statistics_lock
+        # Hierarchical lock ordering: device_state_lock → device shard lock → monitoring_lock → statistics_lock
         
         # Level 1: Core device and status state (consolidates device_lock + status_lock + assigned_videos_lock)
         self.device_state_lock = threading.RLock()  # RLock allows reentrant access for same thread
         self.device_lock_timeout = 5.0  # seconds
         
-        # Level 2: Assignment coordination (consolidates video_assignment_lock + scheduled_assignments_lock)
-        self.assignment_lock = threading.Lock()
+        # Level 2: Per-device assignment and playback history state, sharded by
+        # device name so work on different devices doesn't serialize on one lock.
+        # Readers that need every device snapshot the dicts instead of locking them all
+        self._device_shards = [threading.RLock() for _ in range(DEVICE_LOCK_SHARDS)]
         
         # Level 3: Monitoring and health checks (consolidates playback_history_lock + playback_health_threads_lock)
         self.monitoring_lock = threading.Lock()
@@ -68,28 +163,80 @@ class DeviceManager:
         # Level 4: Statistics collection (separate for performance - read-heavy operations)
         self.statistics_lock = threading.Lock()
         
+        # Locks for status record writes, striped by device name; only
+        # _status_publish_lock may be taken while one is held
+        self._status_stripes = [threading.Lock() for _ in range(STATUS_LOCK_STRIPES)]
+        # Leaf lock serializing publication of new device_status snapshots
+        self._status_publish_lock = threading.Lock()
+        
         # Core device tracking - protected by device_state_lock
+        # devices is copy-on-write: writers publish a new dict under the lock,
+        # so readers can use whatever snapshot they see without locking
         self.devices = {}  # name -> Device
-        self.device_status = {}  # name -> status dict
-        self.last_seen = {}  # name -> timestamp
+        self._device_fingerprints = {}  # name -> (hostname, location) of the registered device
+        # device_status is copy-on-write; record fields are written under the device's status stripe
+        self.device_status = {}  # name -> DeviceStatus
+        self.last_seen = {}  # name -> time.monotonic() of the last discovery reply
         self.device_connected_at = {}  # name -> timestamp
         self.assigned_videos = {}  # name -> video path
         
-        # Assignment tracking - protected by assignment_lock
+        # Assignment tracking - protected by the device's shard lock
         self.video_assignment_priority = {}  # name -> priority
         self.video_assignment_retries = {}  # name -> retry count
         self.scheduled_assignments = {}  # name -> scheduled assignment info
         self.device_assignment_queue = {}  # name -> assignment info
+        # Steady-state snapshot of devices whose last assignment check needed no
+        # action; single get/set/pop calls only, dropped whenever an input changes
+        self._assignment_signatures = {}  # name -> (assigned video, current video, is playing)
         
-        # Monitoring data - protected by monitoring_lock
-        self.playback_health_threads = {}  # name -> thread info
+        # Monitoring data - health tasks protected by monitoring_lock,
+        # playback history by the device's shard lock
+        self.playback_health_tasks = {}  # name -> health check task info
         self.video_playback_history = {}  # name -> playback stats
         
+        # Health checks and streaming recovery run as coroutines on one shared
+        # event loop thread instead of one thread per device
+        self._health_loop = None
+        self._health_loop_thread = None
+        
         # Statistics - protected by statistics_lock
         self.playback_stats = {}  # Dictionary for tracking playback stats
         
+        # Database row cache - protected by its own leaf lock, never held while taking another
+        self._db_device_cache = {}  # name -> (fetched at, db device)
+        self._db_device_cache_lock = threading.Lock()
+        
+        # Device configuration cache - protected by its own leaf lock. The
+        # generation is bumped on every invalidation so a fetch that raced with
+        # a config change doesn't store the stale result
+        self._config_cache = {}  # name -> (expires at, config or None)
+        self._config_cache_generation = 0
+        self._config_cache_lock = threading.Lock()
+        
+        # Video file existence cache - protected by its own leaf lock
+        self._path_exists_cache = {}  # path -> (checked at, exists)
+        self._path_exists_cache_lock = threading.Lock()
+        
+        # Pending playback progress writes - protected by their own leaf lock.
+        # Only the latest progress per device is kept; a flusher thread writes
+        # them to the database in one commit per flush
+        self._progress_writes = {}  # name -> (position, duration, progress)
+        self._progress_writes_lock = threading.Lock()
+        self._last_progress = {}  # name -> (position, duration, progress, reported at)
+        self._progress_flush_event = threading.Event()
+        self._progress_flush_thread = None
+        # Database session reused by each thread that flushes progress writes
+        self._progress_db_local = threading.local()
+        
+        # Auto-detected LAN IP for streaming and when it was detected (time.monotonic());
+        # racing detections find the same IP, so no lock is needed
+        self._serve_ip_cache = (None, 0.0)
+        
         # Get config service and streaming registry
         self.config_service = ConfigService.get_instance()
+        self.config_service.register_change_listener(self.invalidate_device_config)
+        # Thread loading the default configuration file, whose changes must not wake discovery
+        self._config_file_reload_thread = None
         self.streaming_registry = StreamingSessionRegistry.get_instance()
         self.streaming_registry.register_health_check_handler(self._handle_streaming_issue)
         
@@ -97,9 +244,48 @@ class DeviceManager:
         self.discovery_thread = None
         self.discovery_running = False
         self.discovery_interval = 10  # Seconds between discovery cycles
+        # Set to cut the wait between cycles short when discovery is stopped or woken
+        self._discovery_wakeup = threading.Event()
+        # Each loop thread gets its own stop event, so a loop that is still
+        # finishing a cycle after pause_discovery can't keep running beside the
+        # one started by resume_discovery, nor swallow the resume
+        self._discovery_stop = threading.Event()
+        self._consecutive_idle_cycles = 0
+        self._discovery_wait = self.discovery_interval  # Seconds waited after the last cycle
+        self._known_devices_file = KNOWN_DEVICES_FILE
+        # st_mtime_ns of the default configuration file when it was last loaded
+        self._config_file_mtime_ns = None
+        self._saved_known_devices = None  # Entries last written to _known_devices_file
+        self._recent_usns = {}  # USN -> (expires at, location, parsed device info)
+        # One SSDP socket reused across discovery cycles; the lock keeps
+        # concurrent discoveries from reading each other's replies
+        self._ssdp_sock = None
+        self._ssdp_host = None
+        self._ssdp_lock = threading.Lock()
+        
+        # Keep-alive session for device description fetches and overlay sync
+        # calls, plus the cache validators and parsed XML of each description
+        # for conditional requests
+        self._desc_session = requests.Session()
+        desc_adapter = HTTPAdapter(pool_connections=32, pool_maxsize=32)
+        self._desc_session.mount("http://", desc_adapter)
+        self._desc_session.mount("https://", desc_adapter)
+        self._desc_cache = {}  # location -> (ETag, Last-Modified, XML root)
+        # Descriptions are I/O bound, so fetch them in parallel rather than one RTT after another
+        self._desc_pool = ThreadPoolExecutor(
+            max_workers=DESCRIPTION_FETCH_WORKERS, thread_name_prefix="dlna-description"
+        )
+        # Per-device discovery work (registration, video assignment) blocks on the
+        # network and database, so devices are handled in parallel each cycle
+        self._discovery_pool = ThreadPoolExecutor(
+            max_workers=DISCOVERY_WORKERS, thread_name_prefix="dlna-discovery"
+        )
         
         # Additional attributes
         self.device_service = None
+        # device_service holds one long-lived database session, which must not be
+        # used by several threads at once (discovery workers, progress flusher)
+        self._device_service_lock = threading.RLock()
         self.connectivity_timeout = 30  # Seconds to wait before considering a device offline
 
     def set_device_service(self, device_service):
@@ -112,6 +298,73 @@ class DeviceManager:
         self.device_service = device_service
         logger.info("Device service reference set in DeviceManager")
 
+    def _shard(self, device_name: str) -> threading.RLock:
+        """
+        Get the shard lock guarding a device's assignment and playback history state
+        
+        Args:
+            device_name: Name of the device
+            
+        Returns:
+            threading.RLock: The device's shard lock
+        """
+        return self._device_shards[hash(device_name) & (DEVICE_LOCK_SHARDS - 1)]
+
+    def _status_lock_for(self, device_name: str) -> threading.Lock:
+        """
+        Get the striped lock guarding writes to a device's status record
+        
+        Args:
+            device_name: Name of the device
+            
+        Returns:
+            threading.Lock: The device's status lock
+        """
+        return self._status_stripes[hash(device_name) & (STATUS_LOCK_STRIPES - 1)]
+
+    def _get_status_record(self, device_name: str) -> DeviceStatus:
+        """
+        Get a device's status record, creating an empty one if needed
+        
+        Args:
+            device_name: Name of the device
+            
+        Returns:
+            DeviceStatus: The device's status record
+        """
+        status_dict = self.device_status.get(device_name)
+        if status_dict is None:
+            status_dict = self._publish_status(device_name, DeviceStatus())
+        return status_dict
+
+    def _publish_status(self, device_name: str, record: Optional[DeviceStatus]) -> Optional[DeviceStatus]:
+        """
+        Publish a new device_status snapshot with a record added or removed
+        
+        Adding never replaces a record another thread already published.
+        
+        Args:
+            device_name: Name of the device
+            record: The record to add, or None to remove the device's record
+            
+        Returns:
+            Optional[DeviceStatus]: The device's record after the change
+        """
+        with self._status_publish_lock:
+            current = self.device_status.get(device_name)
+            if record is None:
+                if current is None:
+                    return None
+                statuses = dict(self.device_status)
+                del statuses[device_name]
+            else:
+                if current is not None:
+                    return current
+                statuses = dict(self.device_status)
+                statuses[device_name] = record
+            self.device_status = statuses
+            return record
+
     def _acquire_device_state_lock(self):
         """Acquire the device state lock with timeout to prevent deadlock"""
         acquired = self.device_state_lock.acquire(blocking=True, timeout=self.device_lock_timeout)
@@ -127,17 +380,155 @@ class DeviceManager:
             # Lock wasn't held
             pass
 
-    # SECURITY: Legacy compatibility methods (deprecated)
-    def _acquire_device_lock(self):
-        """DEPRECATED: Use _acquire_device_state_lock instead"""
-        return self._acquire_device_state_lock()
+    def _get_db_device(self, device_name: str):
+        """
+        Get a device's database row through a short-lived cache
+        
+        Args:
+            device_name: Name of the device
+            
+        Returns:
+            The database device, or None if not found
+        """
+        now = time.monotonic()
+        with self._db_device_cache_lock:
+            cached = self._db_device_cache.get(device_name)
+            if cached is not None and now - cached[0] < DB_DEVICE_CACHE_TTL:
+                return cached[1]
+        
+        with self._device_service_lock:
+            db_device = self.device_service.get_device_by_name(device_name)
+        
+        with self._db_device_cache_lock:
+            self._db_device_cache.pop(device_name, None)
+            if len(self._db_device_cache) >= DB_DEVICE_CACHE_SIZE:
+                # Evict the oldest entry
+                self._db_device_cache.pop(next(iter(self._db_device_cache)))
+            self._db_device_cache[device_name] = (now, db_device)
+        return db_device
+
+    def invalidate_db_device(self, device_name: str) -> None:
+        """
+        Drop a device's cached database row, e.g. after its control mode changed
+        
+        Args:
+            device_name: Name of the device
+        """
+        with self._db_device_cache_lock:
+            self._db_device_cache.pop(device_name, None)
+        # The control mode feeds the assignment decision, so re-check it next cycle
+        self._assignment_signatures.pop(device_name, None)
+
+    def _get_cached_device_config(self, device_name: str) -> Optional[Dict[str, Any]]:
+        """
+        Get a device's configuration through a short-lived cache
+        
+        Args:
+            device_name: Name of the device
+            
+        Returns:
+            Optional[Dict[str, Any]]: Copy of the device configuration, or None if not configured
+        """
+        now = time.monotonic()
+        with self._config_cache_lock:
+            cached = self._config_cache.get(device_name)
+            if cached is not None and now < cached[0]:
+                return dict(cached[1]) if cached[1] is not None else None
+            generation = self._config_cache_generation
+        
+        config = self.config_service.get_device_config(device_name)
+        
+        with self._config_cache_lock:
+            if generation == self._config_cache_generation:
+                self._config_cache[device_name] = (now + CONFIG_CACHE_TTL, config)
+        return dict(config) if config is not None else None
+
+    def invalidate_device_config(self, device_name: Optional[str] = None) -> None:
+        """
+        Drop cached device configuration; registered as a ConfigService change listener
+        
+        Args:
+            device_name: Name of the device, or None to drop every cached configuration
+        """
+        with self._config_cache_lock:
+            self._config_cache_generation += 1
+            if device_name is None:
+                self._config_cache.clear()
+            else:
+                self._config_cache.pop(device_name, None)
+        if device_name is None:
+            self._assignment_signatures.clear()
+        else:
+            self._assignment_signatures.pop(device_name, None)
+        # The discovery loop handles its own file reloads; other changes apply now
+        if self._config_file_reload_thread != threading.get_ident():
+            self.wake_discovery()
 
-    def _release_device_lock(self):
-        """DEPRECATED: Use _release_device_state_lock instead"""
-        self._release_device_state_lock()
+    def _path_exists(self, path: str) -> bool:
+        """
+        Check whether a video file exists, reusing recent answers to avoid a stat() per health tick
+        
+        Args:
+            path: Path of the video file
+            
+        Returns:
+            bool: True if the file existed when last checked
+        """
+        now = time.monotonic()
+        with self._path_exists_cache_lock:
+            cached = self._path_exists_cache.get(path)
+            if cached is not None and now - cached[0] < PATH_EXISTS_CACHE_TTL:
+                return cached[1]
+        
+        exists = os.path.exists(path)
+        
+        with self._path_exists_cache_lock:
+            self._path_exists_cache.pop(path, None)
+            if len(self._path_exists_cache) >= PATH_EXISTS_CACHE_SIZE:
+                # Evict the oldest entry
+                self._path_exists_cache.pop(next(iter(self._path_exists_cache)))
+            self._path_exists_cache[path] = (now, exists)
+        return exists
+
+    def invalidate_path_exists(self, path: str) -> None:
+        """
+        Drop a cached existence check, e.g. when a video is (re)assigned
+        
+        Args:
+            path: Path of the video file
+        """
+        with self._path_exists_cache_lock:
+            self._path_exists_cache.pop(path, None)
+
+    def _get_health_loop(self) -> asyncio.AbstractEventLoop:
+        """
+        Get the event loop that runs health checks, starting it on first use
+        
+        Returns:
+            asyncio.AbstractEventLoop: The running health check loop
+        """
+        with self.monitoring_lock:
+            if self._health_loop is None:
+                loop = asyncio.new_event_loop()
+                thread = threading.Thread(
+                    target=loop.run_forever,
+                    name="playback-health-loop",
+                    daemon=True
+                )
+                thread.start()
+                self._health_loop = loop
+                self._health_loop_thread = thread
+            return self._health_loop
 
     def _handle_streaming_issue(self, session):
+        """Schedule recovery for a streaming issue without blocking the registry's monitor"""
+        asyncio.run_coroutine_threadsafe(
+            self._handle_streaming_issue_coro(session), self._get_health_loop()
+        )
+
+    async def _handle_streaming_issue_coro(self, session):
         """Handle streaming issues and attempt recovery"""
+        loop = asyncio.get_running_loop()
         try:
             device_name = session.device_name
             
@@ -154,16 +545,17 @@ class DeviceManager:
                 logger.warning(f"Device {device_name} not found for streaming issue handling - attempting recovery")
                 logger.debug(f"Current devices in manager: {list(self.devices.keys())}")
                 logger.debug(f"Device state lock held: {self.device_state_lock.locked()}")
-                with self.device_state_lock:
-                    last_seen_time = self.last_seen.get(device_name, 0)
-                    time_since_seen = time.time() - last_seen_time if last_seen_time else float('inf')
-                    logger.debug(f"Device {device_name} last seen {time_since_seen:.1f}s ago")
+                last_seen_time = self.last_seen.get(device_name, 0)
+                time_since_seen = time.monotonic() - last_seen_time if last_seen_time else float('inf')
+                logger.debug(f"Device {device_name} last seen {time_since_seen:.1f}s ago")
                 
                 # Try to recover device from database if available
                 if self.device_service:
                     try:
                         logger.info(f"Attempting to recover device {device_name} from database")
-                        db_device = self.device_service.get_device_by_name(device_name)
+                        db_device = await loop.run_in_executor(
+                            None, self._get_db_device, device_name
+                        )
                         if db_device:
                             logger.info(f"Found device {device_name} in database, attempting recovery")
                             device_info = {
@@ -191,7 +583,7 @@ class DeviceManager:
                             return
                     except Exception as e:
                         logger.error(f"Error recovering device from database: {e}")
-                        logger.debug(f"Recovery error details: {traceback.format_exc()}")
+                        logger.debug("Recovery error details", exc_info=True)
                         return
                 else:
                     logger.warning(f"No device_service available for recovery of {device_name}")
@@ -210,15 +602,18 @@ class DeviceManager:
                 # Try to restart playback
                 if device_name in self.assigned_videos:
                     video_path = self.assigned_videos[device_name]
-                    if os.path.exists(video_path):
+                    if self._path_exists(video_path):
                         logger.info(f"Attempting to restart video {video_path} on device {device_name}")
                         
-                        # Stop current playback
-                        device.stop()
-                        time.sleep(2)  # Give it time to stop
+                        # Stop current playback; device I/O runs in the executor
+                        # so it doesn't block the other health checks
+                        await loop.run_in_executor(None, device.stop)
+                        await asyncio.sleep(2)  # Give it time to stop
                         
                         # Attempt to play again
-                        success = self.auto_play_video(device, video_path, loop=True)
+                        success = await loop.run_in_executor(
+                            None, self.auto_play_video, device, video_path, True
+                        )
                         
                         if success:
                             logger.info(f"Successfully recovered streaming for {device_name}")
@@ -252,115 +647,189 @@ class DeviceManager:
                 error=str(e)
             )
 
-    def _playback_health_check_loop(self, device_name: str, video_path: str) -> None:
+    async def _playback_health_check_coro(self, device_name: str, video_path: str,
+                                          health_info: Dict[str, Any]) -> None:
         """
-        Background thread for monitoring playback health
+        Coroutine monitoring playback health on the shared health check loop
         
         Args:
             device_name: Name of the device to monitor
             video_path: Path to the video being played
+            health_info: This check's entry in playback_health_tasks
         """
         logger.info(f"Starting playback health monitoring for {device_name}")
+        loop = asyncio.get_running_loop()
         consecutive_failures = 0
         max_consecutive_failures = 3
         check_interval = PLAYBACK_HEALTH_CHECK_INTERVAL
+        healthy_streak = 0
+        unreachable_interval = 0
         
-        while True:
-            try:
-                # Sleep between checks
-                time.sleep(check_interval)
-                
-                # SECURITY FIX: Check if thread should exit using monitoring_lock
-                with self.monitoring_lock:
-                    if (device_name not in self.playback_health_threads or 
-                            not self.playback_health_threads.get(device_name, {}).get("active", False)):
-                        logger.info(f"Stopping playback health monitoring for {device_name}")
-                        break
-                
-                # Get device with thread safety
-                device = self.get_device(device_name)
-                if not device:
-                    logger.warning(f"Device {device_name} not found, stopping health check")
-                    break
-                
-                # Check device playing status
-                if not device.is_playing:
-                    logger.warning(f"Device {device_name} is not playing but should be. Consecutive failure: {consecutive_failures+1}/{max_consecutive_failures}")
-                    consecutive_failures += 1
+        try:
+            while True:
+                try:
+                    with self.monitoring_lock:
+                        health_info["interval"] = check_interval
+                    
+                    # Sleep between checks; cancelling the task wakes it immediately
+                    await asyncio.sleep(check_interval)
                     
-                    # Check if we should attempt recovery
-                    if consecutive_failures >= max_consecutive_failures:
-                        logger.warning(f"Device {device_name} playback consistently failing, attempting recovery")
+                    with self.monitoring_lock:
+                        if not health_info["active"]:
+                            logger.info(f"Stopping playback health monitoring for {device_name}")
+                            break
+                    
+                    # Get device with thread safety
+                    device = self.get_device(device_name)
+                    if not device:
+                        if unreachable_interval >= PLAYBACK_HEALTH_UNREACHABLE_MAX_INTERVAL:
+                            logger.warning(f"Device {device_name} not found, stopping health check")
+                            break
                         
-                        # Check if device was manually stopped
-                        if self.device_service:
-                            try:
-                                db_device = self.device_service.get_device_by_name(device_name)
-                                if db_device and db_device.user_control_mode == "manual" and db_device.user_control_reason == "user_stopped":
-                                    logger.info(f"Device {device_name} was manually stopped, skipping auto-recovery")
-                                    break
-                            except Exception as e:
-                                logger.warning(f"Could not check user control mode for {device_name}: {e}")
+                        # Back off exponentially while the device is missing
+                        unreachable_interval = min(
+                            unreachable_interval * 2 or PLAYBACK_HEALTH_UNREACHABLE_INTERVAL,
+                            PLAYBACK_HEALTH_UNREACHABLE_MAX_INTERVAL
+                        )
+                        check_interval = unreachable_interval
+                        healthy_streak = 0
+                        logger.warning(f"Device {device_name} not found, checking again in {check_interval}s")
+                        continue
+                    unreachable_interval = 0
+                    
+                    # Check device playing status
+                    if not device.is_playing:
+                        logger.warning(f"Device {device_name} is not playing but should be. Consecutive failure: {consecutive_failures+1}/{max_consecutive_failures}")
+                        consecutive_failures += 1
                         
-                        # Check current video assignment
-                        with self.device_state_lock:
-                            current_video = self.assigned_videos.get(device_name)
+                        # Check if we should attempt recovery
+                        if consecutive_failures >= max_consecutive_failures:
+                            logger.warning(f"Device {device_name} playback consistently failing, attempting recovery")
                             
-                        if current_video and os.path.exists(current_video):
-                            logger.info(f"Attempting to restart video {current_video} on device {device_name}")
-                            self.auto_play_video(device, current_video, loop=True)
-                            consecutive_failures = 0  # Reset after recovery attempt
-                else:
-                    # Device is playing, reset failure counter
-                    if consecutive_failures > 0:
-                        logger.info(f"Device {device_name} is now playing correctly, resetting failure counter")
-                        consecutive_failures = 0
-                
-                # Check for streaming sessions to validate device state
-                active_sessions = self.streaming_registry.get_sessions_for_device(device_name)
-                
-                # If device is playing but there are no active sessions, this might indicate an issue
-                if device.is_playing and not active_sessions:
-                    logger.warning(f"Device {device_name} is playing but has no active streaming sessions")
+                            # Check if device was manually stopped
+                            if self.device_service:
+                                try:
+                                    db_device = await loop.run_in_executor(
+                                        None, self._get_db_device, device_name
+                                    )
+                                    if db_device and db_device.user_control_mode == "manual" and db_device.user_control_reason == "user_stopped":
+                                        logger.info(f"Device {device_name} was manually stopped, skipping auto-recovery")
+                                        break
+                                except Exception as e:
+                                    logger.warning(f"Could not check user control mode for {device_name}: {e}")
+                            
+                            # Check current video assignment
+                            current_video = self.assigned_videos.get(device_name)
+                                
+                            if current_video and self._path_exists(current_video):
+                                logger.info(f"Attempting to restart video {current_video} on device {device_name}")
+                                await loop.run_in_executor(
+                                    None, self.auto_play_video, device, current_video, True
+                                )
+                                consecutive_failures = 0  # Reset after recovery attempt
+                    else:
+                        # Device is playing, reset failure counter
+                        if consecutive_failures > 0:
+                            logger.info(f"Device {device_name} is now playing correctly, resetting failure counter")
+                            consecutive_failures = 0
                     
-                    # Check if we need to restart the stream
-                    with self.device_state_lock:
-                        if device_name in self.assigned_videos and device.current_video != self.assigned_videos[device_name]:
-                            logger.info(f"Restarting video {self.assigned_videos[device_name]} on device {device_name}")
-                            self.auto_play_video(device, self.assigned_videos[device_name], loop=True)
-                
-                # If there are issues with any streaming sessions, log them
-                streaming_issues = False
-                for session in active_sessions:
-                    if session.status in ["stalled", "error"]:
-                        logger.warning(f"Streaming session {session.session_id} for device {device_name} has status {session.status}")
-                        streaming_issues = True
-                        
-                # Update device status with streaming information
-                with self.device_state_lock:
-                    if device_name in self.device_status:
-                        self.device_status[device_name]["active_streaming_sessions"] = len(active_sessions)
-                        self.device_status[device_name]["streaming_issues"] = streaming_issues
+                    # Check for streaming sessions to validate device state
+                    active_sessions = self.streaming_registry.get_sessions_for_device(device_name)
+                    
+                    # If device is playing but there are no active sessions, this might indicate an issue
+                    if device.is_playing and not active_sessions:
+                        logger.warning(f"Device {device_name} is playing but has no active streaming sessions")
                         
-                        # Add detailed streaming info if available
-                        if active_sessions:
-                            total_bytes = sum(session.bytes_served for session in active_sessions)
-                            avg_bandwidth = sum(session.get_bandwidth() for session in active_sessions) / len(active_sessions) if active_sessions else 0
+                        # Check if we need to restart the stream
+                        assigned_video = self.assigned_videos.get(device_name)
+                        if assigned_video and device.current_video != assigned_video:
+                            logger.info(f"Restarting video {assigned_video} on device {device_name}")
+                            await loop.run_in_executor(
+                                None, self.auto_play_video, device, assigned_video, True
+                            )
+                    
+                    # One pass over the sessions: log any issues and total up the
+                    # streaming figures, outside the state lock
+                    streaming_issues = False
+                    total_bytes = 0
+                    total_bandwidth = 0
+                    for session in active_sessions:
+                        if session.status in ("stalled", "error"):
+                            logger.warning(f"Streaming session {session.session_id} for device {device_name} has status {session.status}")
+                            streaming_issues = True
+                        total_bytes += session.bytes_served
+                        total_bandwidth += session.get_bandwidth()
+                    session_count = len(active_sessions)
                             
-                            self.device_status[device_name]["streaming_bytes"] = total_bytes
-                            self.device_status[device_name]["streaming_bandwidth_bps"] = avg_bandwidth
-                
-            except Exception as e:
-                logger.error(f"Error in playback health check for {device_name}: {e}")
-                time.sleep(5)  # Sleep on error to avoid tight loop
+                    # Update device status with streaming information
+                    with self._status_lock_for(device_name):
+                        status_dict = self.device_status.get(device_name)
+                        if status_dict is not None:
+                            status_dict.active_streaming_sessions = session_count
+                            status_dict.streaming_issues = streaming_issues
+                            
+                            # Add detailed streaming info if available
+                            if session_count:
+                                status_dict.streaming_bytes = total_bytes
+                                status_dict.streaming_bandwidth_bps = total_bandwidth / session_count
+                    
+                    # Poll stable devices less often; any problem resets to the base interval
+                    if device.is_playing and not streaming_issues:
+                        healthy_streak += 1
+                        if healthy_streak % PLAYBACK_HEALTH_STABLE_CHECKS == 0:
+                            check_interval = min(
+                                check_interval * PLAYBACK_HEALTH_BACKOFF_FACTOR,
+                                PLAYBACK_HEALTH_MAX_INTERVAL
+                            )
+                    else:
+                        healthy_streak = 0
+                        check_interval = PLAYBACK_HEALTH_CHECK_INTERVAL
+                    
+                except Exception as e:
+                    logger.error(f"Error in playback health check for {device_name}: {e}")
+                    await asyncio.sleep(5)  # Sleep on error to avoid tight loop
+        except asyncio.CancelledError:
+            logger.info(f"Stopping playback health monitoring for {device_name}")
+        finally:
+            logger.info(f"Playback health monitoring stopped for {device_name}")
+            
+            # Drop tracking unless a newer check has already replaced this one
+            with self.monitoring_lock:
+                if self.playback_health_tasks.get(device_name) is health_info:
+                    del self.playback_health_tasks[device_name]
+    
+    def _publish_device(self, device_name: str, device: Optional[Device]) -> None:
+        """
+        Publish a new devices snapshot with a device added, replaced or removed
         
-        logger.info(f"Playback health monitoring stopped for {device_name}")
+        The caller must hold device_state_lock.
         
-        # SECURITY FIX: Clean up thread tracking using monitoring_lock
-        with self.monitoring_lock:
-            if device_name in self.playback_health_threads:
-                del self.playback_health_threads[device_name]
-    
+        Args:
+            device_name: Name of the device
+            device: The device to store, or None to remove it
+        """
+        devices = dict(self.devices)
+        if device is None:
+            devices.pop(device_name, None)
+            self._device_fingerprints.pop(device_name, None)
+        else:
+            devices[device_name] = device
+            self._device_fingerprints[device_name] = self._device_fingerprint(device.device_info)
+        self.devices = devices
+
+    @staticmethod
+    def _device_fingerprint(device_info: Dict[str, Any]) -> Tuple[Any, Any]:
+        """
+        Get the attributes that decide whether a re-announced device has changed
+        
+        Args:
+            device_info: Device information
+            
+        Returns:
+            Tuple[Any, Any]: The device's hostname and location
+        """
+        return (device_info.get("hostname"), device_info.get("location"))
+
     def get_devices(self) -> List[Device]:
         """
         Get all registered devices
@@ -368,12 +837,8 @@ class DeviceManager:
         Returns:
             List[Device]: List of all registered devices
         """
-        if not self._acquire_device_lock():
-            return []
-        try:
-            return list(self.devices.values())
-        finally:
-            self._release_device_lock()
+        # Lock-free read of the current snapshot
+        return list(self.devices.values())
     
     def get_device(self, device_name: str) -> Optional[Device]:
         """
@@ -385,12 +850,8 @@ class DeviceManager:
         Returns:
             Optional[Device]: The device if found, None otherwise
         """
-        if not self._acquire_device_lock():
-            return None
-        try:
-            return self.devices.get(device_name)
-        finally:
-            self._release_device_lock()
+        # Lock-free read of the current snapshot
+        return self.devices.get(device_name)
     
     def register_device(self, device_info: Dict[str, Any]) -> Optional[Device]:
         """
@@ -410,6 +871,15 @@ class DeviceManager:
                 logger.error("Device missing name")
                 return None
             
+            # Devices re-announce every discovery cycle; answer an unchanged one
+            # with a single tuple comparison instead of building a new device
+            fingerprint = self._device_fingerprint(device_info)
+            if self._device_fingerprints.get(device_name) == fingerprint:
+                existing_device = self.devices.get(device_name)
+                if existing_device is not None:
+                    logger.info(f"Device {device_name} already registered with same parameters")
+                    return existing_device
+            
             # Create the appropriate device type
             if device_type == "dlna":
                 device = DLNADevice(device_info)
@@ -420,17 +890,13 @@ class DeviceManager:
                 return None
             
             # Register the device with thread safety
-            if not self._acquire_device_lock():
-                return None
-            
-            try:
+            with self.device_state_lock:
                 # Check if device already exists to avoid duplicates
                 existing_device = None
                 if device_name in self.devices:
                     existing_device = self.devices[device_name]
                     # Compare key attributes to see if it's really the same device
-                    if (existing_device.device_info.get("hostname") == device_info.get("hostname") and
-                        existing_device.device_info.get("location") == device_info.get("location")):
+                    if self._device_fingerprint(existing_device.device_info) == fingerprint:
                         logger.info(f"Device {device_name} already registered with same parameters")
                         return existing_device
                     else:
@@ -446,19 +912,15 @@ class DeviceManager:
                                 device.current_video = existing_device.current_video
                 
                 # Register or update the device
-                self.devices[device_name] = device
+                self._publish_device(device_name, device)
                 logger.info(f"Registered {device_type} device: {device_name}")
-            finally:
-                self._release_device_lock()
+            
+            self.invalidate_db_device(device_name)
             
             # Initialize device status if not already present
-            with self.device_state_lock:
-                if device_name not in self.device_status:
-                    self.device_status[device_name] = {
-                        "status": "connected",
-                        "last_updated": time.time(),
-                        "is_playing": False
-                    }
+            if device_name not in self.device_status:
+                initial_status = DeviceStatus(status="connected", last_updated=time.time(), is_playing=False)
+                if self._publish_status(device_name, initial_status) is initial_status:
                     logger.info(f"Initialized device_status for {device_name}")
             
             return device
@@ -475,24 +937,25 @@ class DeviceManager:
         """
         logger.info(f"Cleaning up state for device {device_name}")
         
-        # Stop health check
-        self._stop_playback_health_check(device_name)
+        self.invalidate_db_device(device_name)
         
-        # Clear assignments
+        # One pass in lock hierarchy order: device_state_lock → device shard lock
         with self.device_state_lock:
-            if device_name in self.assigned_videos:
+            # Stop health check
+            self._stop_playback_health_check(device_name)
+            
+            # Clear assignments
+            if self.assigned_videos.pop(device_name, None) is not None:
                 logger.info(f"Clearing assigned video for device {device_name}")
-                self.assigned_videos.pop(device_name, None)
-        
-        # Clear priority
-        if device_name in self.video_assignment_priority:
-            logger.info(f"Clearing video assignment priority for device {device_name}")
-            self.video_assignment_priority.pop(device_name, None)
-        
-        # Clear from device queue
-        if device_name in self.device_assignment_queue:
-            logger.info(f"Clearing device from assignment queue: {device_name}")
-            self.device_assignment_queue.pop(device_name, None)
+            
+            with self._shard(device_name):
+                # Clear priority
+                if self.video_assignment_priority.pop(device_name, None) is not None:
+                    logger.info(f"Clearing video assignment priority for device {device_name}")
+                
+                # Clear from device queue
+                if self.device_assignment_queue.pop(device_name, None) is not None:
+                    logger.info(f"Clearing device from assignment queue: {device_name}")
     
     def unregister_device(self, device_name: str) -> bool:
         """
@@ -505,7 +968,7 @@ class DeviceManager:
             bool: True if successful, False otherwise
         """
         # SECURITY FIX: Hierarchical lock acquisition to prevent deadlock
-        # Order: device_state_lock → assignment_lock → monitoring_lock
+        # Order: device_state_lock → device shard lock → monitoring_lock
         
         if not self._acquire_device_state_lock():
             return False
@@ -519,35 +982,28 @@ class DeviceManager:
             device = self.devices[device_name]
             
             # Level 1: Clean device state data (already have device_state_lock)
-            del self.devices[device_name]
-            if device_name in self.device_status:
-                del self.device_status[device_name]
-            if device_name in self.last_seen:
-                del self.last_seen[device_name]
-            if device_name in self.device_connected_at:
-                del self.device_connected_at[device_name]
-            if device_name in self.assigned_videos:
-                del self.assigned_videos[device_name]
-            
-            # Level 2: Clean assignment data
-            with self.assignment_lock:
-                if device_name in self.video_assignment_priority:
-                    del self.video_assignment_priority[device_name]
-                if device_name in self.video_assignment_retries:
-                    del self.video_assignment_retries[device_name]
-                if device_name in self.scheduled_assignments:
-                    del self.scheduled_assignments[device_name]
-                if device_name in self.device_assignment_queue:
-                    del self.device_assignment_queue[device_name]
-            
-            # Level 3: Clean monitoring data and stop health checks
+            self._publish_device(device_name, None)
+            self.invalidate_db_device(device_name)
+            self._publish_status(device_name, None)
+            self.last_seen.pop(device_name, None)
+            self.device_connected_at.pop(device_name, None)
+            self.assigned_videos.pop(device_name, None)
+            
+            # Level 2: Clean assignment data and playback history
+            with self._shard(device_name):
+                self.video_assignment_priority.pop(device_name, None)
+                self.video_assignment_retries.pop(device_name, None)
+                self.scheduled_assignments.pop(device_name, None)
+                self.device_assignment_queue.pop(device_name, None)
+                self.video_playback_history.pop(device_name, None)
+            
+            # Level 3: Stop health checks
             with self.monitoring_lock:
-                if device_name in self.video_playback_history:
-                    del self.video_playback_history[device_name]
-                # Stop health check thread safely
-                if device_name in self.playback_health_threads:
-                    self.playback_health_threads[device_name]["active"] = False
-                    del self.playback_health_threads[device_name]
+                # Cancel the health check task safely
+                health_info = self.playback_health_tasks.pop(device_name, None)
+                if health_info is not None:
+                    health_info["active"] = False
+                    health_info["task"].cancel()
             
             logger.info(f"Unregistered device: {device_name}")
             return True
@@ -575,11 +1031,8 @@ class DeviceManager:
             logger.info(f"Loaded {len(loaded_devices_names)} device configurations from {abs_path}")
             
             # Return the devices that were loaded and registered
-            loaded_devices = []
-            with self.device_state_lock:
-                for device_name in loaded_devices_names:
-                    if device_name in self.devices:
-                        loaded_devices.append(self.devices[device_name])
+            devices = self.devices
+            loaded_devices = [devices[name] for name in loaded_devices_names if name in devices]
             
             return loaded_devices
         except Exception as e:
@@ -597,16 +1050,18 @@ class DeviceManager:
             bool: True if successful, False otherwise
         """
         try:
-            # Get device information with thread safety
-            with self.device_state_lock:
-                # Create deep copies to avoid modification during saving
-                devices_config = [device.device_info.copy() for device in self.devices.values()]
+            # Copy device info from the current snapshot; no lock needed
+            devices_config = [device.device_info.copy() for device in self.devices.values()]
             
             # Use the config service to save configurations
             abs_path = os.path.abspath(config_file)
             
-            with open(abs_path, "w") as f:
-                json.dump(devices_config, f, indent=4)
+            if orjson is not None:
+                with open(abs_path, "wb") as f:
+                    f.write(orjson.dumps(devices_config, option=orjson.OPT_INDENT_2))
+            else:
+                with open(abs_path, "w") as f:
+                    json.dump(devices_config, f, indent=4)
             
             logger.info(f"Saved {len(devices_config)} devices to {abs_path}")
             return True
@@ -623,42 +1078,69 @@ class DeviceManager:
             self.discovery_running = False # Ensure it's not marked as running
             return
 
-        if self.discovery_thread and self.discovery_thread.is_alive():
+        if self.discovery_thread and self.discovery_thread.is_alive() and not self._discovery_stop.is_set():
             logger.warning("Discovery already running")
             return
         
         self.discovery_running = True
-        self.discovery_thread = threading.Thread(target=self._discovery_loop)
+        self._discovery_stop = threading.Event()
+        self._discovery_wakeup.clear()
+        self.discovery_thread = threading.Thread(target=self._discovery_loop, args=(self._discovery_stop,))
         self.discovery_thread.daemon = True
         self.discovery_thread.start()
         logger.info("Started DLNA device discovery")
 
-    def _discovery_loop(self) -> None:
+    def _discovery_loop(self, stop_event: Optional[threading.Event] = None) -> None:
         """
         Loop for discovering DLNA devices
+        
+        Args:
+            stop_event: Set to end this loop; the loop also ends when discovery_running is cleared
         """
+        if stop_event is None:
+            stop_event = threading.Event()
         current_devices = set()
+        previous_devices = set()
         
-        # Load default configuration only on startup
-        try:
-            # Load default configuration file
-            default_config_file = os.environ.get("DEVICE_CONFIG_FILE", "my_device_config.json")
-            if os.path.exists(default_config_file):
-                logger.info(f"Loading default configuration from {default_config_file}")
-                self.config_service.load_configs_from_file(default_config_file)
-            else:
-                logger.warning(f"Default configuration file not found: {default_config_file}")
-        except Exception as e:
-            logger.error(f"Error loading default configuration: {e}")
+        # Load the default configuration on startup; each cycle then reloads it
+        # only if its modification time has changed
+        default_config_file = os.environ.get("DEVICE_CONFIG_FILE", "my_device_config.json")
+        self._config_file_mtime_ns = None
+        self._reload_config_file_if_changed(default_config_file)
         
-        while self.discovery_running:
+        # Probe the renderers known from the last run while the first SSDP search runs
+        warm_start = self._discovery_pool.submit(self._probe_known_devices)
+        
+        while self.discovery_running and not stop_event.is_set():
             try:
                 logger.debug("Starting DLNA device discovery cycle")
+                if self._reload_config_file_if_changed(default_config_file):
+                    self._consecutive_idle_cycles = 0
                 discovered_devices = self._discover_dlna_devices()
                 logger.debug(f"Found {len(discovered_devices)} DLNA devices")
                 
+                if warm_start is not None:
+                    locations = {device.get("location") for device in discovered_devices}
+                    probed = [device for device in warm_start.result() if device.get("location") not in locations]
+                    warm_start = None
+                    if probed:
+                        logger.info(f"Found {len(probed)} known DLNA devices without waiting for SSDP")
+                        discovered_devices.extend(probed)
+                
                 # Clear current devices set for this cycle
                 current_devices.clear()
+                # One clock read per cycle: monotonic for last_seen interval math,
+                # wall clock for the connection timestamp, UTC for schedules and
+                # database timestamps
+                now = time.monotonic()
+                wall_now = time.time()
+                utc_now = datetime.now(timezone.utc)
+                
+                # Devices seen this cycle as (name, is_new, is_changed); their
+                # last_seen/status writes are applied together after the scan
+                seen_devices = []
+                # New or changed devices to register, as (name, is_new, is_changed, device_info)
+                to_register = []
                 
                 for device_info in discovered_devices:
                     device_name = device_info.get("friendly_name")
@@ -669,29 +1151,7 @@ class DeviceManager:
                     current_devices.add(device_name)
                     logger.debug(f"Processing discovered device: {device_name}")
                     
-                    # Using thread-safe device lock access
-                    is_new_device = False
-                    is_changed_device = False
-                    
-                    if not self._acquire_device_lock():
-                        logger.warning(f"Could not acquire device lock for {device_name}, skipping device")
-                        continue
-                    
-                    try:
-                        existing_device = self.devices.get(device_name)
-                        is_new_device = existing_device is None
-                        
-                        if existing_device:
-                            old_hostname = existing_device.device_info.get("hostname")
-                            new_hostname = device_info.get("hostname")
-                            old_location = existing_device.device_info.get("location")
-                            new_location = device_info.get("location")
-                            
-                            if old_hostname != new_hostname or old_location != new_location:
-                                logger.info(f"Device {device_name} parameters changed")
-                                is_changed_device = True
-                    finally:
-                        self._release_device_lock()
+                    is_new_device, is_changed_device = self._detect_change(device_name, device_info)
                     
                     device_info["device_name"] = device_name
                     device_info["type"] = "dlna"
@@ -705,46 +1165,164 @@ class DeviceManager:
                             logger.error(f"Error parsing location URL: {e}")
                     
                     if is_new_device or is_changed_device:
-                        # Atomic device registration/update - no unregister needed
-                        # register_device() handles updating existing devices safely
-                        if is_changed_device:
-                            logger.info(f"Device {device_name} parameters changed, updating atomically")
-                        
-                        device = self.register_device(device_info)
-                        if device:
-                            logger.info(f"Successfully registered device: {device_name}")
-                            self.update_device_status(device_name, "connected")
-                            with self.device_state_lock:
-                                self.last_seen[device_name] = time.time()
-                                self.device_connected_at[device_name] = time.time()
-                        else:
-                            logger.warning(f"Failed to register device: {device_name}")
-                            continue
+                        to_register.append((device_name, is_new_device, is_changed_device, device_info))
+                    else:
+                        seen_devices.append((device_name, is_new_device, is_changed_device))
+                
+                # Atomic device registration/update - no unregister needed
+                # register_device() handles updating existing devices safely
+                registered = self._discovery_pool.map(
+                    self.register_device, [entry[3] for entry in to_register]
+                )
+                for (device_name, is_new_device, is_changed_device, _), device in zip(to_register, registered):
+                    if device:
+                        logger.info(f"Successfully registered device: {device_name}")
+                        seen_devices.append((device_name, is_new_device, is_changed_device))
                     else:
-                        # Update last seen time for existing device
-                        with self.device_state_lock:
-                            self.last_seen[device_name] = time.time()
+                        logger.warning(f"Failed to register device: {device_name}")
+                
+                # One critical section for the whole cycle's bookkeeping
+                with self.device_state_lock:
+                    for device_name, is_new_device, is_changed_device in seen_devices:
+                        self.last_seen[device_name] = now
+                        if is_new_device or is_changed_device:
+                            self.device_connected_at[device_name] = wall_now
+                            self.update_device_status(device_name, "connected")
+                        elif self.device_status.get(device_name, {}).get("status") != "connected":
                             # Only update status if device was previously disconnected
-                            if self.device_status.get(device_name, {}).get("status") != "connected":
-                                self.update_device_status(device_name, "connected")
-                    
-                    # Process discovered device against configurations using improved assignment logic
-                    self._process_device_video_assignment(device_name, is_new_device, is_changed_device)
+                            self.update_device_status(device_name, "connected")
+                
+                # Read the user control modes for the whole cycle here, so the
+                # workers below don't share the service's session
+                control_modes = None
+                if self.device_service and seen_devices:
+                    try:
+                        with self._device_service_lock:
+                            control_modes = self.device_service.get_device_control_modes_by_names(
+                                [device_name for device_name, _, _ in seen_devices]
+                            )
+                    except Exception as e:
+                        # Without the control modes a device under user control could
+                        # be auto-assigned, so leave assignment to the next cycle
+                        logger.error(f"Could not load user control modes, skipping video assignment this cycle: {e}")
+                        seen_devices = []
+                
+                # Process discovered devices against configurations using improved assignment logic
+                futures = {
+                    self._discovery_pool.submit(
+                        self._process_device_video_assignment,
+                        device_name, is_new_device, is_changed_device, utc_now, control_modes
+                    ): device_name
+                    for device_name, is_new_device, is_changed_device in seen_devices
+                }
+                for future, device_name in futures.items():
+                    try:
+                        future.result()
+                    except Exception as e:
+                        logger.error(f"Error processing video assignment for {device_name}: {e}", exc_info=True)
                 
                 # Check for disconnected devices
-                self._check_disconnected_devices(current_devices)
+                self._check_disconnected_devices(current_devices, now, wall_now)
+                
+                # A cycle is idle when no device was registered, appeared or went missing
+                if to_register or current_devices != previous_devices:
+                    self._consecutive_idle_cycles = 0
+                else:
+                    self._consecutive_idle_cycles += 1
+                previous_devices = set(current_devices)
+                
+                self._save_known_devices()
                 
                 logger.debug("Finished DLNA discovery cycle")
             
             except Exception as e:
-                logger.error(f"Error during DLNA discovery loop: {e}")
-                logger.error(f"Exception details: {traceback.format_exc()}")
+                logger.error(f"Error during DLNA discovery loop: {e}", exc_info=True)
             
-            time.sleep(self.discovery_interval)
+            # Back off while nothing changes; returns early when stop_discovery,
+            # pause_discovery or wake_discovery wakes the loop
+            backoff = 2 ** min(self._consecutive_idle_cycles, DISCOVERY_IDLE_BACKOFF_STEPS)
+            self._discovery_wait = max(
+                self.discovery_interval, min(self.discovery_interval * backoff, MAX_DISCOVERY_INTERVAL)
+            )
+            if stop_event.is_set():
+                break
+            if (self._discovery_wakeup.wait(self._discovery_wait) and
+                    self.discovery_running and not stop_event.is_set()):
+                # Woken for a prompt rediscovery rather than stopped
+                self._discovery_wakeup.clear()
+                self._consecutive_idle_cycles = 0
         
         logger.error("Discovery loop exited unexpectedly!")
 
-    def _process_device_video_assignment(self, device_name: str, is_new_device: bool, is_changed_device: bool) -> None:
+    def _reload_config_file_if_changed(self, config_file: str) -> bool:
+        """
+        Load a configuration file if it is new or was modified since it was last loaded
+        
+        One stat() call decides this, so it is cheap enough to run every discovery
+        cycle. Reloading notifies the config listeners, which drop the cached
+        configurations and assignment signatures.
+        
+        Args:
+            config_file: Path to the configuration file
+            
+        Returns:
+            bool: True if the file was (re)loaded
+        """
+        try:
+            mtime_ns = os.stat(config_file).st_mtime_ns
+        except FileNotFoundError:
+            if self._config_file_mtime_ns != -1:
+                logger.warning(f"Default configuration file not found: {config_file}")
+                self._config_file_mtime_ns = -1
+            return False
+        except OSError as e:
+            logger.error(f"Error checking default configuration {config_file}: {e}")
+            return False
+        
+        if mtime_ns == self._config_file_mtime_ns:
+            return False
+        
+        if self._config_file_mtime_ns is None or self._config_file_mtime_ns == -1:
+            logger.info(f"Loading default configuration from {config_file}")
+        else:
+            logger.info(f"Configuration file {config_file} changed, reloading")
+        self._config_file_mtime_ns = mtime_ns
+        self._config_file_reload_thread = threading.get_ident()
+        try:
+            self.config_service.load_configs_from_file(config_file)
+        except Exception as e:
+            logger.error(f"Error loading default configuration: {e}")
+        finally:
+            self._config_file_reload_thread = None
+        return True
+
+    def _detect_change(self, device_name: str, device_info: Dict[str, Any]) -> Tuple[bool, bool]:
+        """
+        Compare a discovery reply with the registered device
+        
+        Reads the lock-free devices snapshot, so no lock is taken.
+        
+        Args:
+            device_name: Name of the discovered device
+            device_info: Device information from the discovery reply
+            
+        Returns:
+            Tuple[bool, bool]: Whether the device is new, and whether its hostname or location changed
+        """
+        existing_device = self.devices.get(device_name)
+        if existing_device is None:
+            return True, False
+        
+        existing_info = existing_device.device_info
+        if (existing_info.get("hostname") != device_info.get("hostname") or
+                existing_info.get("location") != device_info.get("location")):
+            logger.info(f"Device {device_name} parameters changed")
+            return False, True
+        return False, False
+
+    def _process_device_video_assignment(self, device_name: str, is_new_device: bool, is_changed_device: bool,
+                                         utc_now: Optional[datetime] = None,
+                                         control_modes: Optional[Dict[str, Tuple[Optional[str], Optional[str]]]] = None) -> None:
         """
         Process video assignment for a device using improved assignment logic
         
@@ -752,33 +1330,53 @@ class DeviceManager:
             device_name: Name of the device to process
             is_new_device: Whether this is a newly discovered device
             is_changed_device: Whether the device parameters have changed
+            utc_now: Current UTC time for the discovery cycle, read now if not given
+            control_modes: (user_control_mode, user_control_reason) of the cycle's devices
+                found in the database, looked up per device if not given
         """
         device = self.get_device(device_name)
         if not device:
             logger.warning(f"Device {device_name} not found, cannot process video assignment")
             return
         
+        # Steady state: nothing changed since the last check found no work to do,
+        # so skip the user-control, schedule and config lookups entirely
+        signature = (self.assigned_videos.get(device_name), device.current_video, device.is_playing)
+        if (not is_new_device and not is_changed_device and
+                device_name not in self.scheduled_assignments and
+                self._assignment_signatures.get(device_name) == signature):
+            return
+        self._assignment_signatures.pop(device_name, None)
+        
         # Check if device is under user control
-        if self.device_service:
+        control = None
+        if control_modes is not None:
+            control = control_modes.get(device_name)
+        elif self.device_service:
             try:
-                db_device = self.device_service.get_device_by_name(device_name)
-                if db_device and db_device.user_control_mode != 'auto':
-                    logger.info(f"Skipping {device_name} - under user control mode: {db_device.user_control_mode} (reason: {db_device.user_control_reason})")
-                    return
+                db_device = self._get_db_device(device_name)
+                if db_device:
+                    control = (db_device.user_control_mode, db_device.user_control_reason)
             except Exception as e:
-                logger.warning(f"Could not check user control mode for {device_name}: {e}")
+                # Don't treat an unknown control mode as 'auto'
+                logger.warning(f"Could not check user control mode for {device_name}, skipping assignment: {e}")
+                return
+        if control and control[0] != 'auto':
+            logger.info(f"Skipping {device_name} - under user control mode: {control[0]} (reason: {control[1]})")
+            return
         
         # Check for scheduled assignments that are due
-        scheduled_video = self._check_scheduled_assignments(device_name)
+        scheduled_video = self._check_scheduled_assignments(device_name, utc_now)
         if scheduled_video:
             logger.info(f"Found scheduled video assignment for {device_name}: {scheduled_video}")
             self.assign_video_to_device(device_name, scheduled_video, priority=100)  # High priority for scheduled
             return
             
         # Check if there's a configuration for this device
-        config = self.config_service.get_device_config(device_name)
+        config = self._get_cached_device_config(device_name)
         if not config:
             logger.info(f"No configuration found for {device_name}, skipping video assignment")
+            self._assignment_signatures[device_name] = signature
             return
             
         logger.info(f"Found configuration for {device_name}")
@@ -790,14 +1388,12 @@ class DeviceManager:
             return
             
         video_path = config.get("video_file")
-        if not video_path or not os.path.exists(video_path):
+        if not video_path or not self._path_exists(video_path):
             logger.error(f"Video file {video_path} not found or not specified in config")
             return
         
         # Get the current video assignment
-        current_video = None
-        with self.device_state_lock:
-            current_video = self.assigned_videos.get(device_name)
+        current_video = self.assigned_videos.get(device_name)
         
         # Only assign if:
         # 1. No video is currently assigned
@@ -816,6 +1412,7 @@ class DeviceManager:
             self.assign_video_to_device(device_name, video_path, priority=priority)
         else:
             logger.debug(f"No need to reassign video for device {device_name}")
+            self._assignment_signatures[device_name] = signature
             
     def assign_video_to_device(self, device_name: str, video_path: str, 
                               priority: int = 50, schedule_time: Optional[datetime] = None) -> bool:
@@ -836,14 +1433,15 @@ class DeviceManager:
             logger.error(f"Device {device_name} not found, cannot assign video")
             return False
             
-        # Check if video file exists
-        if not os.path.exists(video_path):
+        # Check if video file exists, bypassing any cached answer for a new assignment
+        self.invalidate_path_exists(video_path)
+        if not self._path_exists(video_path):
             logger.error(f"Video file {video_path} does not exist")
             return False
             
         # Handle scheduled assignments
         if schedule_time is not None:
-            with self.assignment_lock:
+            with self._shard(device_name):
                 self.scheduled_assignments[device_name] = {
                     "video_path": video_path,
                     "priority": priority,
@@ -856,7 +1454,7 @@ class DeviceManager:
         should_override = False
         current_priority = 0
         
-        with self.assignment_lock:
+        with self._shard(device_name):
             current_priority = self.video_assignment_priority.get(device_name, 0)
             if priority >= current_priority:
                 should_override = True
@@ -873,21 +1471,25 @@ class DeviceManager:
             if current_video == video_path and device.is_playing:
                 logger.info(f"Device {device_name} is already playing {video_path}")
                 return True
-                
-            if current_video and current_video != video_path and device.is_playing:
-                logger.info(f"Device {device_name} is playing {current_video}, stopping first")
-                device.stop()
-                time.sleep(1)  # Give it time to stop
-            
-            # Store the assigned video
+            needs_stop = bool(current_video) and current_video != video_path and device.is_playing
+        
+        # stop() returns once the device has answered the Stop request, so there
+        # is no need to wait any longer; it runs outside the lock since it blocks on the network
+        if needs_stop:
+            logger.info(f"Device {device_name} is playing {current_video}, stopping first")
+            if not device.stop():
+                logger.warning(f"Device {device_name} did not confirm stopping {current_video}")
+        
+        # Store the assigned video
+        with self.device_state_lock:
             self.assigned_videos[device_name] = video_path
             
         # Reset retry counter when assigning a new video
-        with self.assignment_lock:
+        with self._shard(device_name):
             self.video_assignment_retries[device_name] = 0
             
         # Get device config to check for loop setting
-        config = self.config_service.get_device_config(device_name) if self.config_service else {}
+        config = self._get_cached_device_config(device_name) if self.config_service else {}
         loop_enabled = config.get("loop", True) if config else True
         
         # Play the video
@@ -916,7 +1518,7 @@ class DeviceManager:
             video_path: Path to the video
             priority: Priority of the assignment
         """
-        with self.assignment_lock:
+        with self._shard(device_name):
             # Get current retry count
             retry_count = self.video_assignment_retries.get(device_name, 0)
             
@@ -933,14 +1535,30 @@ class DeviceManager:
             delay = RETRY_DELAY_BASE * (2 ** retry_count)
             logger.info(f"Scheduling retry {retry_count+1}/{MAX_RETRY_ATTEMPTS} for {device_name} in {delay}s")
         
-        # Schedule retry using a timer
-        retry_timer = threading.Timer(
-            delay, 
-            self.assign_video_to_device,
-            args=[device_name, video_path, priority]
+        # Schedule the retry on the shared health loop instead of a Timer thread per retry
+        asyncio.run_coroutine_threadsafe(
+            self._retry_assignment_coro(delay, device_name, video_path, priority),
+            self._get_health_loop()
         )
-        retry_timer.daemon = True
-        retry_timer.start()
+    
+    async def _retry_assignment_coro(self, delay: float, device_name: str, video_path: str, priority: int) -> None:
+        """
+        Retry a video assignment after a delay
+        
+        Args:
+            delay: Seconds to wait before retrying
+            device_name: Name of the device
+            video_path: Path to the video
+            priority: Priority of the assignment
+        """
+        await asyncio.sleep(delay)
+        try:
+            # Assignment does blocking device I/O, so keep it off the loop thread
+            await asyncio.get_running_loop().run_in_executor(
+                None, self.assign_video_to_device, device_name, video_path, priority
+            )
+        except Exception as e:
+            logger.error(f"Error retrying video assignment for {device_name}: {e}")
     
     def _track_playback_result(self, device_name: str, video_path: str, success: bool) -> None:
         """
@@ -951,105 +1569,105 @@ class DeviceManager:
             video_path: Path to the video
             success: Whether playback was successful
         """
-        with self.monitoring_lock:
-            if device_name not in self.video_playback_history:
-                self.video_playback_history[device_name] = {
-                    "attempts": 0,
-                    "successes": 0,
-                    "last_attempt": time.time(),
-                    "videos": {}
-                }
-                
+        succeeded = int(bool(success))
+        with self._shard(device_name):
             # Update overall stats
-            history = self.video_playback_history[device_name]
+            history = self.video_playback_history.setdefault(device_name, {
+                "attempts": 0,
+                "successes": 0,
+                "last_attempt": 0.0,
+                "videos": OrderedDict()
+            })
             history["attempts"] += 1
-            if success:
-                history["successes"] += 1
+            history["successes"] += succeeded
             history["last_attempt"] = time.time()
             
-            # Update video-specific stats
-            if video_path not in history["videos"]:
-                history["videos"][video_path] = {
-                    "attempts": 0,
-                    "successes": 0
-                }
-                
-            video_stats = history["videos"][video_path]
+            # Update video-specific stats, keeping only the most recently played videos
+            videos = history["videos"]
+            video_stats = videos.setdefault(video_path, {"attempts": 0, "successes": 0})
             video_stats["attempts"] += 1
-            if success:
-                video_stats["successes"] += 1
+            video_stats["successes"] += succeeded
+            videos.move_to_end(video_path)
+            if len(videos) > MAX_VIDEOS_PER_DEVICE:
+                videos.popitem(last=False)
+        
+        if not success:
+            # Re-evaluate the assignment on the next discovery cycle
+            self._assignment_signatures.pop(device_name, None)
     
-    def _check_scheduled_assignments(self, device_name: str) -> Optional[str]:
+    def _check_scheduled_assignments(self, device_name: str, utc_now: Optional[datetime] = None) -> Optional[str]:
         """
         Check if there are any scheduled assignments due for a device
         
         Args:
             device_name: Name of the device to check
+            utc_now: Current UTC time, read now if not given
             
         Returns:
             Optional[str]: Video path if a scheduled assignment is due, None otherwise
         """
-        with self.assignment_lock:
-            if device_name not in self.scheduled_assignments:
+        with self._shard(device_name):
+            assignment = self.scheduled_assignments.get(device_name)
+            if assignment is None:
                 return None
                 
-            assignment = self.scheduled_assignments[device_name]
             scheduled_time = assignment.get("scheduled_time")
             
             if not scheduled_time:
                 return None
                 
             # Check if scheduled time has passed
-            if datetime.now(timezone.utc) >= scheduled_time:
+            if (utc_now or datetime.now(timezone.utc)) >= scheduled_time:
                 video_path = assignment.get("video_path")
                 # Remove the scheduled assignment
-                del self.scheduled_assignments[device_name]
+                self.scheduled_assignments.pop(device_name, None)
                 return video_path
                 
         return None
     
     def _start_playback_health_check(self, device_name: str, video_path: str) -> None:
         """
-        Start a health check thread for playback monitoring with secure lock ordering
+        Start a health check task for playback monitoring with secure lock ordering
         
         Args:
             device_name: Name of the device to monitor
             video_path: Path to the video being played
         """
-        # Stop any existing health check thread first
+        # Stop any existing health check first
         self._stop_playback_health_check(device_name)
         
-        # Create a new thread for health checking
-        health_thread = threading.Thread(
-            target=self._playback_health_check_loop,
-            args=[device_name, video_path],
-            daemon=True
-        )
+        loop = self._get_health_loop()
         
-        # SECURITY FIX: Use monitoring_lock for health thread management (was video_assignment_lock)
+        # SECURITY FIX: Use monitoring_lock for health check management (was video_assignment_lock)
         with self.monitoring_lock:
-            self.playback_health_threads[device_name] = {
-                "thread": health_thread,
+            health_info = {
                 "active": True,
-                "video_path": video_path
+                "video_path": video_path,
+                "interval": PLAYBACK_HEALTH_CHECK_INTERVAL
             }
+            # Schedule the check as a coroutine on the shared health check loop
+            health_info["task"] = asyncio.run_coroutine_threadsafe(
+                self._playback_health_check_coro(device_name, video_path, health_info),
+                loop
+            )
+            self.playback_health_tasks[device_name] = health_info
         
-        # Start the thread
-        health_thread.start()
         logger.info(f"Started playback health check for {device_name}")
     
     def _stop_playback_health_check(self, device_name: str) -> None:
         """
-        Stop the health check thread for a device with secure lock ordering
+        Stop the health check task for a device with secure lock ordering
         
         Args:
             device_name: Name of the device
         """
         # SECURITY FIX: Use monitoring_lock consistently (was video_assignment_lock)
         with self.monitoring_lock:
-            if device_name in self.playback_health_threads:
-                # Mark thread as not active
-                self.playback_health_threads[device_name]["active"] = False
+            health_info = self.playback_health_tasks.get(device_name)
+            if health_info is not None:
+                # Mark the check as not active and wake it from its sleep
+                health_info["active"] = False
+                health_info["task"].cancel()
                 logger.info(f"Stopped playback health check for {device_name}")
     
     def auto_play_video(self, device: Device, video_path: str, loop: bool = True, config: Optional[Dict[str, Any]] = None) -> bool:
@@ -1072,15 +1690,16 @@ class DeviceManager:
             if self.device_service:
                 try:
                     # Get device ID from database
-                    db_device = self.device_service.get_device_by_name(device.name)
+                    db_device = self._get_db_device(device.name)
                     if db_device and hasattr(db_device, 'id'):
                         logger.info(f"Using device_service for stream reuse on device {device.name}")
-                        return self.device_service.play_video(db_device.id, video_path, loop)
+                        with self._device_service_lock:
+                            return self.device_service.play_video(db_device.id, video_path, loop)
                 except Exception as e:
                     logger.warning(f"Failed to use device_service: {e}, falling back to direct play")
             
             # Validate video file
-            if not os.path.exists(video_path):
+            if not self._path_exists(video_path):
                 logger.error(f"Video file not found: {video_path}")
                 self.update_device_status(
                     device_name=device.name,
@@ -1089,11 +1708,11 @@ class DeviceManager:
                 )
                 return False
             
-            # Stop any current playback
+            # Stop any current playback; stop() returns once the device has answered
             if device.is_playing:
                 logger.info(f"Stopping current playback on {device.name}")
-                device.stop()
-                time.sleep(1)  # Give it time to stop
+                if not device.stop():
+                    logger.warning(f"Device {device.name} did not confirm stopping playback")
             
             # Get serve IP for streaming
             serve_ip = self.get_serve_ip()
@@ -1129,10 +1748,8 @@ class DeviceManager:
             # Get video URL and attempt playback
             video_url = urls[file_name]
             
-            # Extract port from URL and update device streaming info
-            import re
-            port_match = re.search(r':(\d+)/', video_url)
-            streaming_port = int(port_match.group(1)) if port_match else None
+            # The server knows the port it picked; no need to parse it back out of the URL
+            streaming_port = server.port
             device.update_streaming_info(video_url, streaming_port)
             
             # Set the video file path on the device for duration detection
@@ -1160,9 +1777,7 @@ class DeviceManager:
             )
             
             # Register session with StreamingSessionRegistry
-            from .streaming_registry import StreamingSessionRegistry
-            registry = StreamingSessionRegistry.get_instance()
-            session = registry.register_session(
+            session = self.streaming_registry.register_session(
                 device_name=device.name,
                 video_path=video_path,
                 server_ip=serve_ip,
@@ -1199,7 +1814,7 @@ class DeviceManager:
         Returns:
             Dict[str, Any]: Playback statistics
         """
-        with self.monitoring_lock:
+        with self._shard(device_name):
             if device_name not in self.video_playback_history:
                 return {
                     "attempts": 0,
@@ -1227,96 +1842,116 @@ class DeviceManager:
         Returns:
             Dict[str, Dict[str, Any]]: Dictionary of scheduled assignments
         """
-        with self.assignment_lock:
-            return {k: v.copy() for k, v in self.scheduled_assignments.items()}
+        # Snapshot the items rather than taking every shard lock
+        return {k: v.copy() for k, v in list(self.scheduled_assignments.items())}
     
-    def _check_disconnected_devices(self, current_devices: set) -> None:
+    def _check_disconnected_devices(self, current_devices: set, now: Optional[float] = None,
+                                    wall_now: Optional[float] = None) -> None:
         """
         Check for disconnected devices
         
         Args:
             current_devices: Set of currently discovered device names
+            now: time.monotonic() reading for the discovery cycle, read now if not given
+            wall_now: time.time() reading for the discovery cycle, read now if not given
         """
-        with self.device_state_lock:
-            for device_name in list(self.devices.keys()):
-                if device_name not in current_devices:
-                    with self.device_state_lock:
-                        last_seen = self.last_seen.get(device_name, 0)
-                        time_since_last_seen = time.time() - last_seen
-                    
-                    # Get device from database
-                    db_device = None
-                    if self.device_service:
-                        try:
-                            db_device = self.device_service.get_device_by_name(device_name)
-                        except Exception as e:
-                            logger.error(f"Error loading device {device_name} from database: {e}")
-                    
-                    # Check if device should be marked as disconnected
-                    grace_period = 10  # Reduced from 30 to 10 seconds
-                    extended_grace = 20  # Reduced from 60 to 20 seconds
-                    
-                    if db_device:
-                        updated_at = db_device.updated_at
-                        is_playing = db_device.is_playing
-                        
-                        if updated_at:
-                            seconds_since_update = (datetime.now(timezone.utc) - updated_at.replace(tzinfo=timezone.utc)).total_seconds()
-                            limit = extended_grace if is_playing else grace_period
-                            
-                            if seconds_since_update < limit:
-                                logger.info(f"Skipping disconnect for {device_name}, updated {seconds_since_update:.1f}s ago")
-                                continue
+        # Work out the candidates from lock-free snapshots; locks are only
+        # taken for the writes at the end
+        missing = [name for name in self.devices if name not in current_devices]
+        if not missing:
+            return
+        
+        if now is None:
+            now = time.monotonic()
+        if wall_now is None:
+            wall_now = time.time()
+        last_seen_snapshot = {name: self.last_seen.get(name, 0) for name in missing}
+        # Idle backoff stretches the gap between cycles, so allow at least two
+        # missed cycles before treating a device as offline
+        connectivity_timeout = max(self.connectivity_timeout, 2 * self._discovery_wait)
+        
+        # Get the activity of all candidates from the database in one query
+        db_activity = {}
+        if self.device_service:
+            try:
+                with self._device_service_lock:
+                    db_activity = self.device_service.get_device_activity_by_names(missing)
+            except Exception as e:
+                logger.error(f"Error loading devices {missing} from database: {e}")
+        
+        # Check if device should be marked as disconnected
+        grace_period = 10  # Reduced from 30 to 10 seconds
+        extended_grace = 20  # Reduced from 60 to 20 seconds
+        
+        for device_name in missing:
+            time_since_last_seen = now - last_seen_snapshot[device_name]
+            
+            activity = db_activity.get(device_name)
+            if activity:
+                updated_at, is_playing = activity
+                
+                if updated_at is not None:
+                    seconds_since_update = wall_now - updated_at
+                    limit = extended_grace if is_playing else grace_period
                     
-                    if time_since_last_seen > self.connectivity_timeout:
-                        logger.info(f"Device {device_name} not seen for {time_since_last_seen:.1f}s, marking disconnected")
-                        self.update_device_status(device_name, "disconnected")
-                        
-                        # Clean up any active streaming sessions for this device
-                        try:
-                            from .streaming_registry import StreamingSessionRegistry
-                            streaming_registry = StreamingSessionRegistry.get_instance()
-                            device_sessions = streaming_registry.get_sessions_for_device(device_name)
-                            for session in device_sessions:
-                                logger.info(f"Cleaning up streaming session {session.session_id} for disconnected device {device_name}")
-                                streaming_registry.unregister_session(session.session_id)
-                        except Exception as e:
-                            logger.error(f"Error cleaning up streaming sessions for device {device_name}: {e}")
-                        
-                        # Clear device from memory if it's been disconnected for too long
-                        if time_since_last_seen > self.connectivity_timeout * 2:
-                            logger.info(f"Removing device {device_name} from memory due to extended disconnection")
-                            
-                            # Also clean up any lingering streaming sessions
-                            try:
-                                from .streaming_registry import StreamingSessionRegistry
-                                streaming_registry = StreamingSessionRegistry.get_instance()
-                                device_sessions = streaming_registry.get_sessions_for_device(device_name)
-                                for session in device_sessions:
-                                    logger.info(f"Cleaning up streaming session {session.session_id} for removed device {device_name}")
-                                    streaming_registry.unregister_session(session.session_id)
-                            except Exception as e:
-                                logger.error(f"Error cleaning up streaming sessions for removed device {device_name}: {e}")
-                            
-                            self.devices.pop(device_name, None)
-                            self.device_status.pop(device_name, None)
-                            self.last_seen.pop(device_name, None)
-                            self.device_connected_at.pop(device_name, None)
+                    if seconds_since_update < limit:
+                        logger.info(f"Skipping disconnect for {device_name}, updated {seconds_since_update:.1f}s ago")
+                        continue
+            
+            if time_since_last_seen <= connectivity_timeout:
+                continue
+            
+            logger.info(f"Device {device_name} not seen for {time_since_last_seen:.1f}s, marking disconnected")
+            self.update_device_status(device_name, "disconnected")
+            
+            # Clean up any active streaming sessions for this device
+            try:
+                device_sessions = self.streaming_registry.get_sessions_for_device(device_name)
+                for session in device_sessions:
+                    logger.info(f"Cleaning up streaming session {session.session_id} for disconnected device {device_name}")
+                    self.streaming_registry.unregister_session(session.session_id)
+            except Exception as e:
+                logger.error(f"Error cleaning up streaming sessions for device {device_name}: {e}")
+            
+            # Clear device from memory if it's been disconnected for too long
+            if time_since_last_seen > connectivity_timeout * 2:
+                with self.device_state_lock:
+                    # Skip devices that were seen again since the snapshot
+                    if self.last_seen.get(device_name, 0) != last_seen_snapshot[device_name]:
+                        continue
+                    logger.info(f"Removing device {device_name} from memory due to extended disconnection")
+                    self._publish_device(device_name, None)
+                    self._publish_status(device_name, None)
+                    self.last_seen.pop(device_name, None)
+                    self.device_connected_at.pop(device_name, None)
 
     def stop_discovery(self) -> None:
         """
         Stop discovering DLNA devices on the network
         """
         self.discovery_running = False
+        self._discovery_stop.set()
+        self._discovery_wakeup.set()
         if self.discovery_thread:
             self.discovery_thread.join(timeout=1.0)
             logger.info("Stopped DLNA device discovery")
+        with self._ssdp_lock:
+            self._close_ssdp_socket()
+        # The progress flusher is a daemon thread; write what it hasn't flushed yet
+        self._flush_playback_progress()
     
     def pause_discovery(self) -> None:
         """Pause discovery loop"""
         self.discovery_running = False
+        self._discovery_stop.set()
+        self._discovery_wakeup.set()
         logger.info("Paused DLNA device discovery")
     
+    def wake_discovery(self) -> None:
+        """Run the next discovery cycle now instead of waiting out the interval"""
+        self._consecutive_idle_cycles = 0
+        self._discovery_wakeup.set()
+    
     def resume_discovery(self) -> None:
         """Resume discovery loop"""
         self.start_discovery()
@@ -1324,11 +1959,13 @@ class DeviceManager:
     
     def get_discovery_status(self) -> dict:
         """Get current discovery status"""
+        # One lock-free snapshot, so both counts describe the same set of devices
+        devices = self.devices
         return {
             "running": self.discovery_running,
             "interval": self.discovery_interval,
-            "devices_discovered": len(self.devices),
-            "devices_playing": sum(1 for d in self.devices.values() if d.is_playing)
+            "devices_discovered": len(devices),
+            "devices_playing": sum(1 for d in devices.values() if d.is_playing)
         }
     
     def update_device_status(self, device_name: str, status: str, is_playing: bool = None, 
@@ -1343,23 +1980,22 @@ class DeviceManager:
             current_video: Current video path (optional)
             error: Error message if any (optional)
         """
-        with self.device_state_lock:
-            if device_name not in self.device_status:
-                self.device_status[device_name] = {}
+        with self._status_lock_for(device_name):
+            status_dict = self._get_status_record(device_name)
             
-            status_dict = self.device_status[device_name]
-            status_dict["status"] = status
-            status_dict["last_updated"] = time.time()
+            now = time.time()
+            status_dict.status = status
+            status_dict.last_updated = now
             
             if is_playing is not None:
-                status_dict["is_playing"] = is_playing
+                status_dict.is_playing = is_playing
             
             if current_video is not None:
-                status_dict["current_video"] = current_video
+                status_dict.current_video = current_video
                 
             if error is not None:
-                status_dict["last_error"] = error
-                status_dict["last_error_time"] = time.time()
+                status_dict.last_error = error
+                status_dict.last_error_time = now
                 
     def update_device_playback_progress(self, device_name: str, position: str, duration: str, progress: int) -> None:
         """
@@ -1388,91 +2024,145 @@ class DeviceManager:
             logger.error(f"Invalid progress value for {device_name}: {progress}")
             progress = 0
         
-        # First update in-memory status
-        with self.device_state_lock:
-            if device_name not in self.device_status:
-                self.device_status[device_name] = {}
+        # First update in-memory status, unless nothing changed since the last report
+        now = time.time()
+        with self._status_lock_for(device_name):
+            last = self._last_progress.get(device_name)
+            if last is not None and last[:3] == (position, duration, progress) and now - last[3] < PLAYBACK_PROGRESS_HEARTBEAT:
+                return
+            self._last_progress[device_name] = (position, duration, progress, now)
+            
+            status_dict = self._get_status_record(device_name)
             
-            status_dict = self.device_status[device_name]
-            status_dict["playback_position"] = position
-            status_dict["playback_duration"] = duration
-            status_dict["playback_progress"] = progress
-            status_dict["last_updated"] = time.time()
+            status_dict.playback_position = position
+            status_dict.playback_duration = duration
+            status_dict.playback_progress = progress
+            status_dict.last_updated = now
             
             # Log the update for debugging
             logger.info(f"Updated in-memory playback progress for {device_name}: {position}/{duration} ({progress}%)")
         
-        # Update the database outside the status lock to avoid potential deadlocks
+        # Queue the database write outside the status lock; repeated updates for
+        # the same device are coalesced until the next flush
+        self._queue_progress_write(device_name, position, duration, progress)
+            
+        # Update the core device object if it exists
         try:
+            device = self.get_device(device_name)
+            if device is not None and getattr(type(device), "_supports_progress_fields", False):
+                device.current_position = position
+                device.duration_formatted = duration
+                device.playback_progress = progress
+                logger.debug(f"Updated core device object playback progress for {device_name}")
+        except Exception as e:
+            logger.error(f"Error updating core device object playback progress: {e}")
+
+    def _queue_progress_write(self, device_name: str, position: str, duration: str, progress: int) -> None:
+        """
+        Queue a playback progress write, replacing any pending one for the device
+        
+        Args:
+            device_name: Name of the device
+            position: Current playback position (HH:MM:SS)
+            duration: Total video duration (HH:MM:SS)
+            progress: Playback progress as a percentage (0-100)
+        """
+        with self._progress_writes_lock:
+            self._progress_writes[device_name] = (position, duration, progress)
+            if self._progress_flush_thread is None or not self._progress_flush_thread.is_alive():
+                self._progress_flush_thread = threading.Thread(
+                    target=self._progress_flush_loop,
+                    name="playback-progress-flusher",
+                    daemon=True
+                )
+                self._progress_flush_thread.start()
+        self._progress_flush_event.set()
+
+    def _progress_flush_loop(self) -> None:
+        """Wait for queued progress writes and flush them in batches"""
+        while True:
+            self._progress_flush_event.wait()
+            # Give other devices a chance to report before writing the batch
+            time.sleep(PLAYBACK_PROGRESS_FLUSH_INTERVAL)
+            self._progress_flush_event.clear()
+            try:
+                self._flush_playback_progress()
+            except Exception as e:
+                logger.error(f"Error flushing playback progress: {e}")
+
+    def _get_progress_session(self):
+        """
+        Get this thread's cached database session for playback progress writes
+        
+        Returns:
+            Session: The thread's session, created on first use
+        """
+        db = getattr(self._progress_db_local, "db", None)
+        if db is None:
             # Import here to avoid circular imports
             from database.database import get_db
+            
+            db_generator = get_db()
+            db = next(db_generator)
+            self._progress_db_local.db_generator = db_generator
+            self._progress_db_local.db = db
+        return db
+
+    def _drop_progress_session(self) -> None:
+        """Close and forget this thread's cached progress session, e.g. after an error"""
+        db_generator = getattr(self._progress_db_local, "db_generator", None)
+        db = getattr(self._progress_db_local, "db", None)
+        self._progress_db_local.db_generator = None
+        self._progress_db_local.db = None
+        try:
+            if db is not None:
+                db.rollback()
+            if db_generator is not None:
+                db_generator.close()
+        except Exception:
+            pass
+
+    def _flush_playback_progress(self) -> None:
+        """Write all pending playback progress updates to the database in one commit"""
+        with self._progress_writes_lock:
+            pending, self._progress_writes = self._progress_writes, {}
+        if not pending:
+            return
+        
+        try:
+            # Import here to avoid circular imports
             from services.device_service import DeviceService
             
-            # Create a new database session
             try:
-                # Get a new database session
-                db_generator = get_db()
-                db = next(db_generator)
-                
-                # Get the device from the database
-                device_service = DeviceService(db, self)
-                db_device = device_service.get_device_by_name(device_name)
-                
-                if db_device:
-                    # Update the playback progress fields
-                    db_device.playback_position = position
-                    db_device.playback_duration = duration
-                    db_device.playback_progress = progress
-                    # Commit the changes
-                    db.commit()
-                    logger.info(f"Updated playback progress for {device_name} in database: {position}/{duration} ({progress}%)")
-                else:
-                    logger.warning(f"Device {device_name} not found in database, cannot update playback progress")
-                
-                # Close the database session
+                db = self._get_progress_session()
                 try:
-                    db_generator.close()
-                except:
-                    pass
+                    DeviceService(db, self).update_playback_progress(pending)
+                    # Commit all devices at once
+                    db.commit()
+                except Exception:
+                    self._drop_progress_session()
+                    raise
+                logger.info(f"Updated playback progress for {len(pending)} device(s) in database")
                     
             except Exception as db_error:
-                logger.error(f"Error creating database session: {db_error}")
-                logger.debug(traceback.format_exc())
+                logger.error(f"Error writing playback progress with the progress session: {db_error}")
+                logger.debug("Database session error details", exc_info=True)
                 
                 # Fallback: Try to use device_service if it's already set
                 if hasattr(self, 'device_service') and self.device_service:
                     try:
-                        # Get the device from the database
-                        db_device = self.device_service.get_device_by_name(device_name)
-                        if db_device:
-                            # Update the playback progress fields
-                            db_device.playback_position = position
-                            db_device.playback_duration = duration
-                            db_device.playback_progress = progress
-                            # Commit the changes
+                        with self._device_service_lock:
+                            self.device_service.update_playback_progress(pending)
                             self.device_service.db.commit()
-                            logger.info(f"Updated playback progress for {device_name} using existing device_service: {progress}%")
-                        else:
-                            logger.warning(f"Device {device_name} not found in database via device_service")
+                        logger.info(f"Updated playback progress for {len(pending)} device(s) using existing device_service")
                     except Exception as service_error:
                         logger.error(f"Error updating via device_service: {service_error}")
         except ImportError as import_error:
             logger.error(f"Import error when updating playback progress: {import_error}")
-            logger.debug(traceback.format_exc())
+            logger.debug("Playback progress write failed", exc_info=True)
         except Exception as e:
             logger.error(f"Error updating device playback progress in database: {e}")
-            logger.debug(traceback.format_exc())
-            
-        # Update the core device object if it exists
-        try:
-            device = self.get_device(device_name)
-            if device and hasattr(device, 'current_position') and hasattr(device, 'duration_formatted') and hasattr(device, 'playback_progress'):
-                device.current_position = position
-                device.duration_formatted = duration
-                device.playback_progress = progress
-                logger.debug(f"Updated core device object playback progress for {device_name}")
-        except Exception as e:
-            logger.error(f"Error updating core device object playback progress: {e}")
+            logger.debug("Playback progress write failed", exc_info=True)
 
     def update_device_playing_state(self, device_name: str, is_playing: bool, video_path: str = None) -> None:
         """
@@ -1487,21 +2177,19 @@ class DeviceManager:
         if not device:
             return
             
-        with self.device_state_lock:
-            # Update device status
-            device.update_playing(is_playing)
+        # Update device status
+        device.update_playing(is_playing)
+        if video_path:
+            device.current_video = video_path
+            
+        # Update status dictionary
+        with self._status_lock_for(device_name):
+            status_dict = self._get_status_record(device_name)
+            
+            status_dict.is_playing = is_playing
             if video_path:
-                device.current_video = video_path
-                
-            # Update status dictionary
-            if device_name not in self.device_status: # Initialize if not present
-                self.device_status[device_name] = {}
-            
-            self.device_status[device_name].update({
-                "is_playing": is_playing,
-                "current_video": video_path if video_path else self.device_status[device_name].get("current_video"),
-                "last_updated": time.time()
-            })
+                status_dict.current_video = video_path
+            status_dict.last_updated = time.time()
 
     def _discover_dlna_devices(self, timeout: float = 2.0, host: Optional[str] = None) -> List[Dict[str, Any]]:
         """
@@ -1518,46 +2206,52 @@ class DeviceManager:
             host = "0.0.0.0"
         logger.debug(f"Searching for DLNA devices on {host}")
         
-        # Configure socket for SSDP broadcast
-        s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM, socket.IPPROTO_UDP)
-        ttl = struct.pack("B", 4)
-        s.setsockopt(socket.IPPROTO_IP, socket.IP_MULTICAST_TTL, ttl)
-        s.bind((host, 0))
-        
-        # Send SSDP broadcast message
-        logger.debug("Sending SSDP broadcast message")
-        s.sendto(SSDP_BROADCAST_MSG.encode("UTF-8"), (SSDP_BROADCAST_ADDR, SSDP_BROADCAST_PORT))
+        with self._ssdp_lock:
+            devices = self._collect_ssdp_responses(timeout, host)
         
-        # Wait for responses
-        logger.debug(f"Waiting for DLNA devices ({timeout} seconds)")
-        s.settimeout(timeout)
-        
-        devices = []
-        while True:
-            try:
-                data, addr = s.recvfrom(1024)
-            except socket.timeout:
-                break
-            
-            try:
-                info = [a.split(":", 1) for a in data.decode("UTF-8").split("\r\n")[1:]]
-                device = dict([(a[0].strip().lower(), a[1].strip()) for a in info if len(a) >= 2])
-                devices.append(device)
-                logger.debug(f"Received DLNA device broadcast response from {addr}")
-            except Exception as e:
-                logger.error(f"Error parsing DLNA device response: {e}")
-        
-        # Filter devices with AVTransport service
-        devices_urls = [
+        # Filter devices with AVTransport service, fetching each description once
+        devices_urls = dict.fromkeys(
             dev["location"]
             for dev in devices
-            if "st" in dev and "AVTransport" in dev["st"]
-        ]
+            if "st" in dev and "AVTransport" in dev["st"] and "location" in dev
+        )
+        location_usns = {
+            dev["location"]: dev["usn"]
+            for dev in devices
+            if dev.get("location") in devices_urls and "usn" in dev
+        }
+        
+        # Forget renderers that haven't answered for a few cycles
+        now = time.monotonic()
+        self._recent_usns = {
+            usn: entry for usn, entry in self._recent_usns.items() if entry[0] > now
+        }
+        usn_ttl = max(self.discovery_interval, self._discovery_wait) * RECENT_USN_CYCLES
+        
+        # Reuse the description of renderers seen recently and fetch the rest in parallel
+        reused = {}
+        to_fetch = []
+        for location_url in devices_urls:
+            cached = self._recent_usns.get(location_usns.get(location_url))
+            if cached is not None and cached[1] == location_url:
+                reused[location_url] = dict(cached[2])
+            else:
+                to_fetch.append(location_url)
+        if len(to_fetch) > 1:
+            fetched = dict(zip(to_fetch, self._desc_pool.map(self._register_dlna_device, to_fetch)))
+        else:
+            fetched = {location_url: self._register_dlna_device(location_url) for location_url in to_fetch}
         
-        # Register devices
+        # Register devices in discovery order
         registered_devices = []
         for location_url in devices_urls:
-            device_info = self._register_dlna_device(location_url)
+            if location_url in reused:
+                device_info = reused[location_url]
+            else:
+                device_info = fetched[location_url]
+                usn = location_usns.get(location_url)
+                if device_info and usn:
+                    self._recent_usns[usn] = (now + usn_ttl, location_url, dict(device_info))
             if device_info:
                 registered_devices.append(device_info)
         
@@ -1566,6 +2260,127 @@ class DeviceManager:
         
         return registered_devices
     
+    def _get_ssdp_socket(self, host: str) -> socket.socket:
+        """
+        Get the SSDP socket bound to host, creating it on first use
+        
+        The caller must hold _ssdp_lock.
+        
+        Args:
+            host: Host to bind to for discovery
+            
+        Returns:
+            socket.socket: Non-blocking UDP socket for SSDP searches
+        """
+        if self._ssdp_sock is not None and self._ssdp_host != host:
+            self._close_ssdp_socket()
+        if self._ssdp_sock is None:
+            s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM, socket.IPPROTO_UDP)
+            try:
+                s.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+                s.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, SSDP_RECV_BUFFER_SIZE)
+                ttl = struct.pack("B", 4)
+                s.setsockopt(socket.IPPROTO_IP, socket.IP_MULTICAST_TTL, ttl)
+                s.bind((host, 0))
+                s.setblocking(False)
+            except OSError:
+                s.close()
+                raise
+            self._ssdp_sock = s
+            self._ssdp_host = host
+        return self._ssdp_sock
+    
+    def _close_ssdp_socket(self) -> None:
+        """Close the reusable SSDP socket, if open"""
+        if self._ssdp_sock is not None:
+            try:
+                self._ssdp_sock.close()
+            except OSError:
+                pass
+            self._ssdp_sock = None
+            self._ssdp_host = None
+    
+    def _collect_ssdp_responses(self, timeout: float, host: str) -> List[Dict[str, str]]:
+        """
+        Send an SSDP search and collect one reply per renderer until the timeout
+        
+        The caller must hold _ssdp_lock.
+        
+        Args:
+            timeout: Timeout for discovery in seconds
+            host: Host to bind to for discovery
+            
+        Returns:
+            List[Dict[str, str]]: Parsed SSDP replies
+        """
+        s = self._get_ssdp_socket(host)
+        
+        devices = []
+        seen_usns = set()
+        try:
+            # Throw away late replies to the previous search
+            while True:
+                try:
+                    s.recvfrom(4096)
+                except (BlockingIOError, InterruptedError):
+                    break
+            
+            # Send SSDP broadcast message
+            logger.debug("Sending SSDP broadcast message")
+            s.sendto(SSDP_BROADCAST_MSG.encode("UTF-8"), (SSDP_BROADCAST_ADDR, SSDP_BROADCAST_PORT))
+            
+            # Wait for responses until the deadline, draining every queued reply
+            # after each wakeup instead of one blocking recv per packet
+            logger.debug(f"Waiting for DLNA devices ({timeout} seconds)")
+            deadline = time.monotonic() + timeout
+            
+            while True:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                readable, _, _ = select.select([s], [], [], remaining)
+                if not readable:
+                    break
+                
+                while True:
+                    try:
+                        data, addr = s.recvfrom(4096)
+                    except (BlockingIOError, InterruptedError):
+                        break
+                    
+                    device = self._parse_ssdp_response(data)
+                    
+                    # Renderers answer once per advertised service; keep one reply per USN
+                    usn = device.get("usn")
+                    if usn:
+                        if usn in seen_usns:
+                            continue
+                        seen_usns.add(usn)
+                    devices.append(device)
+                    logger.debug(f"Received DLNA device broadcast response from {addr}")
+        except OSError:
+            # Start from a fresh socket next time
+            self._close_ssdp_socket()
+            raise
+        
+        return devices
+    
+    @staticmethod
+    def _parse_ssdp_response(data: bytes) -> Dict[str, str]:
+        """
+        Parse the headers discovery needs from an SSDP response
+        
+        Args:
+            data: Raw response datagram
+            
+        Returns:
+            Dict[str, str]: Lower-case header names mapped to their values
+        """
+        return {
+            name.lower().decode("ascii"): value.decode("UTF-8", "replace")
+            for name, value in SSDP_HEADER_RE.findall(data)
+        }
+    
     def _register_dlna_device(self, location_url: str) -> Optional[Dict[str, Any]]:
         """
         Register a DLNA device from its location URL
@@ -1580,9 +2395,7 @@ class DeviceManager:
             logger.debug(f"Registering DLNA device at {location_url}")
             
             # Get device description with timeout
-            xml_raw = urllibreq.urlopen(location_url, timeout=5).read().decode("UTF-8")
-            xml = re.sub(r"""\s(xmlns="[^"]+"|xmlns='[^']+')""", '', xml_raw, count=1)
-            info = ET.fromstring(xml)
+            info = self._fetch_device_description(location_url)
             
             # Parse location URL
             location = urllibparse.urlparse(location_url)
@@ -1591,26 +2404,21 @@ class DeviceManager:
             
             # Find device root
             device_root = info.find("./device")
-            if not device_root:
-                device_root = info.find(
-                    "./device/deviceList/device/"
-                    "[deviceType='{0}']".format(UPNP_DEVICE_TYPE)
-                )
-            
-            # Get device information
-            friendly_name = self._get_xml_field_text(device_root, "./friendlyName")
-            manufacturer = self._get_xml_field_text(device_root, "./manufacturer")
+            if device_root is None:
+                device_root = info.find(DEVICE_QUERY_NESTED)
+            
+            # Get device information in one pass over the device's children
+            fields = {}
+            if device_root is not None:
+                for child in device_root:
+                    if child.tag in DEVICE_INFO_FIELDS and child.tag not in fields:
+                        fields[child.tag] = child.text
+            friendly_name = fields.get("friendlyName")
+            manufacturer = fields.get("manufacturer")
             
             # Try multiple paths to find the control URL
-            service_paths = [
-                "./serviceList/service/[serviceType='{0}']/controlURL".format(UPNP_SERVICE_TYPE),
-                "./serviceList/service/controlURL",
-                ".//service/[serviceType='{0}']/controlURL".format(UPNP_SERVICE_TYPE),
-                ".//service/controlURL"
-            ]
-            
             action_url_path = None
-            for path in service_paths:
+            for path in SERVICE_PATHS:
                 action_url_path = self._get_xml_field_text(device_root, path)
                 if action_url_path:
                     break
@@ -1647,6 +2455,61 @@ class DeviceManager:
             logger.error(f"Error registering DLNA device at {location_url}: {e}")
             return None
     
+    def _fetch_device_description(self, location_url: str):
+        """
+        Fetch and parse a device description, revalidating cached copies
+        
+        Args:
+            location_url: Location URL of the DLNA device
+            
+        Returns:
+            Root element of the description XML (lxml or ElementTree)
+        """
+        headers = {}
+        cached = self._desc_cache.get(location_url)
+        if cached:
+            etag, last_modified, _ = cached
+            if etag:
+                headers["If-None-Match"] = etag
+            if last_modified:
+                headers["If-Modified-Since"] = last_modified
+        
+        response = self._desc_session.get(location_url, headers=headers, timeout=5)
+        
+        # Unchanged descriptions come back as 304 without a body
+        if cached and response.status_code == 304:
+            return cached[2]
+        response.raise_for_status()
+        
+        # Parse the raw bytes, letting the parser handle the declared encoding
+        info = xml_etree.fromstring(response.content)
+        self._strip_namespaces(info)
+        
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if etag or last_modified:
+            self._desc_cache[location_url] = (etag, last_modified, info)
+        else:
+            self._desc_cache.pop(location_url, None)
+        
+        return info
+    
+    @staticmethod
+    def _strip_namespaces(xml_root) -> None:
+        """
+        Drop the namespace from every element tag in place, so paths need no prefixes
+        
+        Works for any default or prefixed namespace, on lxml and ElementTree trees alike.
+        
+        Args:
+            xml_root: Root element of the parsed XML
+        """
+        for element in xml_root.iter():
+            tag = element.tag
+            # Comments and processing instructions have non-string tags in lxml
+            if isinstance(tag, str) and tag[:1] == "{":
+                element.tag = tag.partition("}")[2]
+
     def _get_xml_field_text(self, xml_root, query):
         """
         Get text from an XML field
@@ -1659,11 +2522,69 @@ class DeviceManager:
             str: Text from the XML field or None if not found
         """
         result = None
-        if xml_root:
+        if xml_root is not None:
             node = xml_root.find(query)
             result = node.text if node is not None else None
         return result
     
+    def _probe_known_devices(self) -> List[Dict[str, Any]]:
+        """
+        Fetch the descriptions of the renderers saved by the last run
+        
+        Returns:
+            List[Dict[str, Any]]: Device information of the known renderers that answered
+        """
+        try:
+            with open(self._known_devices_file, "r") as f:
+                known_devices = json.load(f)
+        except FileNotFoundError:
+            return []
+        except Exception as e:
+            logger.warning(f"Could not load known devices from {self._known_devices_file}: {e}")
+            return []
+        
+        locations = list(dict.fromkeys(
+            entry["location"] for entry in known_devices
+            if isinstance(entry, dict) and entry.get("location")
+        ))
+        if not locations:
+            return []
+        
+        logger.info(f"Probing {len(locations)} known DLNA devices")
+        return [info for info in self._desc_pool.map(self._register_dlna_device, locations) if info]
+    
+    def _save_known_devices(self) -> None:
+        """
+        Save the registered DLNA renderers for the next startup, if they changed
+        """
+        known_devices = sorted(
+            (
+                {
+                    "name": name,
+                    "friendly_name": device.device_info.get("friendly_name"),
+                    "hostname": device.device_info.get("hostname"),
+                    "location": device.device_info.get("location"),
+                }
+                for name, device in self.devices.items()
+                if device.device_info.get("type", "dlna") == "dlna" and device.device_info.get("location")
+            ),
+            key=lambda entry: entry["name"]
+        )
+        if known_devices == self._saved_known_devices:
+            return
+        self._saved_known_devices = known_devices
+        
+        try:
+            os.makedirs(os.path.dirname(self._known_devices_file) or ".", exist_ok=True)
+            # Write to a temporary file first so a crash can't leave a truncated list
+            tmp_path = f"{self._known_devices_file}.tmp"
+            with open(tmp_path, "w") as f:
+                json.dump(known_devices, f, indent=4)
+            os.replace(tmp_path, self._known_devices_file)
+            logger.debug(f"Saved {len(known_devices)} known devices to {self._known_devices_file}")
+        except Exception as e:
+            logger.warning(f"Could not save known devices to {self._known_devices_file}: {e}")
+
     def _remove_duplicates(self, devices: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """
         Remove duplicate devices
@@ -1677,10 +2598,11 @@ class DeviceManager:
         seen = set()
         result_devices = []
         for device in devices:
-            device_str = str(device)
-            if device_str not in seen:
+            # The description URL and name identify a DLNA endpoint
+            key = (device.get("location"), device.get("friendly_name"))
+            if key not in seen:
                 result_devices.append(device)
-                seen.add(device_str)
+                seen.add(key)
         return result_devices
 
     def _start_streaming_server(self, video_path: str, device_name: str, port_range: Optional[Tuple[int, int]] = None) -> Tuple[str, Any]:
@@ -1731,8 +2653,8 @@ class DeviceManager:
             video_name: Name of the video to sync
         """
         try:
-            import requests
-            response = requests.post(
+            # Reuse the keep-alive session so repeated syncs skip the TCP handshake
+            response = self._desc_session.post(
                 "http://localhost:8000/api/overlay/sync",
                 params={
                     "triggered_by": "dlna_auto_play",
@@ -1790,7 +2712,7 @@ class DeviceManager:
                 # If direct URL doesn't work, try using a black video as fallback
                 logger.warning(f"Direct URL playback failed, trying fallback video")
                 fallback_video = config.get("video_file")
-                if fallback_video and os.path.exists(fallback_video):
+                if fallback_video and self._path_exists(fallback_video):
                     success = self.auto_play_video(device, fallback_video, loop=True)
                     if success:
                         logger.info(f"Started fallback video on {device_name}")
@@ -1835,6 +2757,9 @@ class DeviceManager:
                 logger.error("STREAMING_SERVE_IP is set to localhost/127.0.0.1, which is not valid for DLNA streaming.")
                 raise RuntimeError("STREAMING_SERVE_IP must be a LAN IP, not localhost/127.0.0.1")
             return env_ip
+        cached_ip, detected_at = self._serve_ip_cache
+        if cached_ip and time.monotonic() - detected_at < SERVE_IP_CACHE_TTL:
+            return cached_ip
         s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
         try:
             s.connect(('8.8.8.8', 80))
@@ -1842,6 +2767,7 @@ class DeviceManager:
             if ip.startswith("127."):
                 raise Exception("Auto-detected IP is localhost, not valid for DLNA streaming.")
             logger.info(f"Auto-detected LAN IP for streaming: {ip}")
+            self._serve_ip_cache = (ip, time.monotonic())
             return ip
         except Exception as e:
             logger.error(f"Could not auto-detect LAN IP for streaming: {e}")
@@ -1852,6 +2778,7 @@ class DeviceManager:
 # Add this at the end of the file
 # Singleton instance for DeviceManager
 _device_manager_instance = None
+_device_manager_lock = threading.Lock()
 
 def get_device_manager() -> DeviceManager:
     """
@@ -1862,5 +2789,8 @@ def get_device_manager() -> DeviceManager:
     """
     global _device_manager_instance
     if _device_manager_instance is None:
-        _device_manager_instance = DeviceManager()
+        with _device_manager_lock:
+            # Re-check under the lock so concurrent first callers share one instance
+            if _device_manager_instance is None:
+                _device_manager_instance = DeviceManager()
     return _device_manager_instance
@@ -0,0 +1,79 @@
+from typing import Any, Dict, Iterator, Optional
+
+class DeviceStatus:
+    """
+    Live status record for a single device, kept by DeviceManager
+
+    Fields live in __slots__ rather than a per-device dict, which keeps the
+    records small and attribute access cheap. Callers that still treat a
+    status as a dict (``status["is_playing"]``, ``status.get(...)``,
+    ``"key" in status``, ``status.update(...)``) keep working; a field that has
+    never been set counts as missing.
+    """
+    __slots__ = (
+        'status', 'last_updated', 'is_playing', 'current_video',
+        'last_error', 'last_error_time',
+        'playback_position', 'playback_duration', 'playback_progress',
+        'active_streaming_sessions', 'streaming_issues',
+        'streaming_bytes', 'streaming_bandwidth_bps',
+    )
+
+    def __init__(self, **fields: Any):
+        for key, value in fields.items():
+            self[key] = value
+
+    def __getitem__(self, key: str) -> Any:
+        if key not in self.__slots__:
+            raise KeyError(key)
+        try:
+            return getattr(self, key)
+        except AttributeError:
+            raise KeyError(key) from None
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        if key not in self.__slots__:
+            raise KeyError(key)
+        setattr(self, key, value)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self.__slots__ and hasattr(self, key)
+
+    def __iter__(self) -> Iterator[str]:
+        return (key for key in self.__slots__ if hasattr(self, key))
+
+    def __repr__(self) -> str:
+        return f"DeviceStatus({self.to_dict()!r})"
+
+    def get(self, key: str, default: Optional[Any] = None) -> Any:
+        """
+        Get a field, or the default if it has never been set
+
+        Args:
+            key: Field name
+            default: Value returned for unset or unknown fields
+
+        Returns:
+            Any: The field value or the default
+        """
+        if key not in self.__slots__:
+            return default
+        return getattr(self, key, default)
+
+    def update(self, fields: Dict[str, Any]) -> None:
+        """
+        Set several fields at once
+
+        Args:
+            fields: Field names and their new values
+        """
+        for key, value in fields.items():
+            self[key] = value
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Convert the set fields to a dictionary
+
+        Returns:
+            Dict[str, Any]: Dictionary of the fields that have been set
+        """
+        return {key: getattr(self, key) for key in self}
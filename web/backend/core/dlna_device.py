@@ -1,15 +1,27 @@
 import os
 import pkgutil
+import random
 import sys
 import logging
 import traceback
 import time
 import socket
 import threading
+import xml.etree.ElementTree as ET
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import Dict, List, Optional, Any, Tuple
 from xml.sax.saxutils import escape as xmlescape
 
+import requests
+from requests.adapters import HTTPAdapter
+
+try:
+    # libxml2 parses the polled SOAP responses several times faster when installed
+    from lxml import etree as xml_etree
+except ImportError:
+    xml_etree = ET
+
 if sys.version_info.major == 3:
     import urllib.request as urllibreq
 else:
@@ -19,22 +31,95 @@ from .device import Device
 
 logger = logging.getLogger(__name__)
 
-# Delay between retries in seconds
-RETRY_DELAY = 2
+# Retries back off exponentially from RETRY_BASE_DELAY up to RETRY_MAX_DELAY
+# seconds, with up to RETRY_JITTER of the delay added at random
+RETRY_BASE_DELAY = 0.25
+RETRY_MAX_DELAY = 4.0
+RETRY_JITTER = 0.25
+# Connect and read timeouts for SOAP requests, in seconds
+SOAP_TIMEOUT = (2, 5)
+
+# Keep-alive session shared by all devices, so the GetPositionInfo and
+# GetTransportInfo polls don't open a new connection per request
+_soap_session = requests.Session()
+_soap_adapter = HTTPAdapter(pool_connections=16, pool_maxsize=32)
+_soap_session.mount("http://", _soap_adapter)
+_soap_session.mount("https://", _soap_adapter)
+
+# AVTransport SOAP request envelope; InstanceID is always 0 for standard DLNA
+SOAP_ENVELOPE_TEMPLATE = (
+    '<?xml version="1.0" encoding="utf-8"?>'
+    '<s:Envelope xmlns:s="http://schemas.xmlsoap.org/soap/envelope/"'
+    ' s:encodingStyle="http://schemas.xmlsoap.org/soap/encoding/">'
+    '<s:Body><u:{action} xmlns:u="urn:schemas-upnp-org:service:AVTransport:1">'
+    '<InstanceID>0</InstanceID>{params}</u:{action}></s:Body></s:Envelope>'
+)
+
+# Monitors query position and transport state side by side on this pool
+# rather than one round trip after the other
+POLL_WORKERS = 16
+# The v2 monitor polls about POLLS_PER_VIDEO times per play-through, within
+# MIN_POLL_INTERVAL..MAX_POLL_INTERVAL seconds and +/- POLL_JITTER of that
+POLLS_PER_VIDEO = 20
+MIN_POLL_INTERVAL = 0.5
+MAX_POLL_INTERVAL = 10.0
+POLL_JITTER = 0.1
+_poll_pool = ThreadPoolExecutor(max_workers=POLL_WORKERS, thread_name_prefix="dlna-poll")
+
+# Paths of the values read from GetPositionInfo and GetTransportInfo responses
+AV_TRANSPORT_NS = "{urn:schemas-upnp-org:service:AVTransport:1}"
+REL_TIME_PATH = f".//{AV_TRANSPORT_NS}RelTime"
+ABS_TIME_PATH = f".//{AV_TRANSPORT_NS}AbsTime"
+TRACK_DURATION_PATH = f".//{AV_TRANSPORT_NS}TrackDuration"
+TRANSPORT_STATE_PATH = f".//{AV_TRANSPORT_NS}CurrentTransportState"
+TRANSPORT_STATUS_PATH = f".//{AV_TRANSPORT_NS}CurrentTransportStatus"
+
+# Action templates by action name, read from disk on first use
+_action_templates: Dict[str, str] = {}
+
+
+def _load_action_template(action: str) -> str:
+    """
+    Read the SOAP template for an action, preferring the nanodlna package's copy
+    
+    Args:
+        action: Action name
+        
+    Returns:
+        str: Template text
+    """
+    template_path = os.path.join(os.path.dirname(__file__), "templates", f"action-{action}.xml")
+    try:
+        template_data = pkgutil.get_data(
+            "nanodlna", f"templates/action-{action}.xml")
+        if template_data is not None:
+            return template_data.decode("UTF-8")
+    except (ImportError, FileNotFoundError):
+        pass
+    # If the template is not found in the nanodlna package, try to find it in our package
+    if os.path.exists(template_path):
+        with open(template_path, "r") as f:
+            return f.read()
+    raise FileNotFoundError(f"Template for action {action} not found")
 
 class DLNADevice(Device):
     """
     Implementation of a DLNA device
     """
+    _supports_progress_fields = True
+
     def __init__(self, device_info: Dict[str, Any]):
         super().__init__(device_info)
         self.type = "dlna"
         self.action_url = device_info.get("action_url")
         self.hostname = device_info.get("hostname")
         self.st = device_info.get("st", "urn:schemas-upnp-org:service:AVTransport:1")
+        self._soap_headers = {}  # action -> request headers, which only depend on st and the action
         self.max_retries = 3  # Number of retries for DLNA actions
         
         # Thread management
+        # Guards the compound updates of the loop flag, stop event and loop thread;
+        # lone reads and stores of _loop_enabled and _last_activity_time don't need it
         self._thread_lock = threading.Lock()
         self._loop_enabled = False
         self._loop_thread = None  # Explicitly initialize loop_thread
@@ -219,6 +304,7 @@ class DLNADevice(Device):
                         if thread_is_running:
                             logger.debug(f"[{self.name}] Stopping existing loop thread (v1)")
                             self._loop_enabled = False
+                            self._stop_event.set()  # Wake it from its wait
                             # Wait short time for thread to exit
                             self._loop_thread.join(timeout=2.0)
                 except (AttributeError, TypeError, RuntimeError) as e:
@@ -227,6 +313,7 @@ class DLNADevice(Device):
                     self._loop_thread = None
             
             # Enable looping
+            self._stop_event.clear()
             self._loop_enabled = True
             self._last_activity_time = time.time()
             
@@ -239,12 +326,12 @@ class DLNADevice(Device):
                     # For brevity, assuming the original logic of this version is here
                     # This version had issues with duration and restart logic
                     while True:
-                        with self._thread_lock:
-                            if not self._loop_enabled:
-                                logger.info(f"[{self.name}] Loop monitoring (v1) flag is False, exiting thread.")
-                                break
+                        if not self._loop_enabled:
+                            logger.info(f"[{self.name}] Loop monitoring (v1) flag is False, exiting thread.")
+                            break
                         logger.debug(f"[{self.name}] Loop v1 still active, sleeping...")
-                        time.sleep(10) # Simplified for this example
+                        if self._stop_event.wait(10): # Simplified for this example
+                            break
                     logger.info(f"[{self.name}] Loop monitoring thread (v1) finished.")
                 except Exception as e:
                     logger.error(f"[{self.name}] Error in loop monitoring thread (v1): {e}")
@@ -273,14 +360,13 @@ class DLNADevice(Device):
             # Send GetPositionInfo action
             response = self._send_dlna_action_with_response(None, "GetPositionInfo")
             
-            # Parse the response
-            import xml.etree.ElementTree as ET
-            root = ET.fromstring(response)
+            # Parse the response; lxml rejects str input that carries an XML declaration
+            root = xml_etree.fromstring(response.encode("UTF-8"))
             
             # Extract the relevant information
-            rel_time = root.find(".//{urn:schemas-upnp-org:service:AVTransport:1}RelTime")
-            abs_time = root.find(".//{urn:schemas-upnp-org:service:AVTransport:1}AbsTime")
-            track_duration = root.find(".//{urn:schemas-upnp-org:service:AVTransport:1}TrackDuration")
+            rel_time = root.find(REL_TIME_PATH)
+            abs_time = root.find(ABS_TIME_PATH)
+            track_duration = root.find(TRACK_DURATION_PATH)
             
             return {
                 "RelTime": rel_time.text if rel_time is not None else "NOT_IMPLEMENTED",
@@ -302,21 +388,19 @@ class DLNADevice(Device):
             # Send GetTransportInfo action
             response = self._send_dlna_action_with_response(None, "GetTransportInfo")
             
-            # Parse the response
-            import xml.etree.ElementTree as ET
-            root = ET.fromstring(response)
+            # Parse the response; lxml rejects str input that carries an XML declaration
+            root = xml_etree.fromstring(response.encode("UTF-8"))
             
             # Extract the transport state
-            transport_state = root.find(".//{urn:schemas-upnp-org:service:AVTransport:1}CurrentTransportState")
-            transport_status = root.find(".//{urn:schemas-upnp-org:service:AVTransport:1}CurrentTransportStatus")
+            transport_state = root.find(TRANSPORT_STATE_PATH)
+            transport_status = root.find(TRANSPORT_STATUS_PATH)
             
             state = transport_state.text if transport_state is not None else "UNKNOWN"
             status = transport_status.text if transport_status is not None else "UNKNOWN"
             
             # If we got a non-null state response, update the last activity time
             if state != "UNKNOWN":
-                with self._thread_lock:
-                    self._last_activity_time = time.time()
+                self._last_activity_time = time.time()
             
             return {
                 "CurrentTransportState": state,
@@ -326,6 +410,28 @@ class DLNADevice(Device):
             logger.error(f"Error getting transport info for {self.name}: {e}")
             return {"CurrentTransportState": "UNKNOWN", "CurrentTransportStatus": "UNKNOWN"}
     
+    def _poll_interval(self) -> float:
+        """
+        Get the delay before the monitor's next position poll
+        
+        Returns:
+            float: Seconds, proportional to the video duration and jittered
+        """
+        duration = self.current_video_duration or MAX_POLL_INTERVAL * POLLS_PER_VIDEO
+        interval = max(MIN_POLL_INTERVAL, min(MAX_POLL_INTERVAL, duration / POLLS_PER_VIDEO))
+        return interval * random.uniform(1 - POLL_JITTER, 1 + POLL_JITTER)
+    
+    def _get_transport_and_position(self) -> Tuple[Dict[str, str], Dict[str, str]]:
+        """
+        Get the transport info and position info from the device concurrently
+        
+        Returns:
+            Tuple[Dict[str, str], Dict[str, str]]: Transport info and position info
+        """
+        position_future = _poll_pool.submit(self._get_position_info)
+        transport_info = self._get_transport_info()
+        return transport_info, position_future.result()
+    
     def _send_dlna_action_with_response(self, data: Optional[Dict[str, Any]], action: str) -> str:
         """
         Send a DLNA action to the device and return the response
@@ -344,57 +450,42 @@ class DLNADevice(Device):
             raise ValueError(f"Cannot send action to device {self.name}: action_url is missing")
         
         # Get the action template
-        try:
-            template_data = pkgutil.get_data(
-                "nanodlna", f"templates/action-{action}.xml")
-            if template_data is not None:
-                action_data = template_data.decode("UTF-8")
-            else:
-                # If template_data is None, try to find it in our package
-                template_path = os.path.join(os.path.dirname(__file__), "templates", f"action-{action}.xml")
-                if os.path.exists(template_path):
-                    with open(template_path, "r") as f:
-                        action_data = f.read()
-                else:
-                    raise FileNotFoundError(f"Template for action {action} not found")
-        except (ImportError, FileNotFoundError):
-            # If the template is not found in the nanodlna package, try to find it in our package
-            template_path = os.path.join(os.path.dirname(__file__), "templates", f"action-{action}.xml")
-            if os.path.exists(template_path):
-                with open(template_path, "r") as f:
-                    action_data = f.read()
-            else:
-                raise FileNotFoundError(f"Template for action {action} not found")
+        action_data = _action_templates.get(action)
+        if action_data is None:
+            action_data = _action_templates[action] = _load_action_template(action)
         
         # Format the action data with the provided data
         if data:
             action_data = action_data.format(**data)
         action_data = action_data.encode("UTF-8")
         
-        # Prepare headers
-        headers = {
-            "Content-Type": "text/xml; charset=\"utf-8\"",
-            "Content-Length": f"{len(action_data)}",
-            "Connection": "close",
-            "SOAPACTION": f"\"{self.st}#{action}\""
-        }
+        # Prepare headers; requests fills in Content-Length from the body
+        headers = self._soap_headers.get(action)
+        if headers is None:
+            headers = self._soap_headers[action] = {
+                "Content-Type": "text/xml; charset=\"utf-8\"",
+                "SOAPACTION": f"\"{self.st}#{action}\""
+            }
         
         # Send the request with retry logic
         last_exception = None
+        delay = RETRY_BASE_DELAY
         for retry in range(self.max_retries):
             try:
                 logger.debug(f"Sending DLNA request to {self.action_url} (attempt {retry+1}/{self.max_retries})")
-                request = urllibreq.Request(self.action_url, action_data, headers)
-                response = urllibreq.urlopen(request)
-                response_data = response.read().decode("UTF-8")
+                response = _soap_session.post(self.action_url, data=action_data, headers=headers, timeout=SOAP_TIMEOUT)
+                response.raise_for_status()
+                response_data = response.content.decode("UTF-8")
                 logger.debug(f"DLNA request sent successfully")
                 return response_data
             except Exception as e:
                 last_exception = e
                 logger.warning(f"DLNA request failed (attempt {retry+1}/{self.max_retries}): {e}")
                 if retry < self.max_retries - 1:
-                    logger.info(f"Retrying in {RETRY_DELAY} seconds...")
-                    time.sleep(RETRY_DELAY)
+                    wait = delay + random.uniform(0, delay * RETRY_JITTER)
+                    logger.info(f"Retrying in {wait:.2f} seconds...")
+                    time.sleep(wait)
+                    delay = min(delay * 2, RETRY_MAX_DELAY)
         
         # If we get here, all retries failed
         logger.error(f"DLNA request failed after {self.max_retries} attempts")
@@ -512,8 +603,7 @@ class DLNADevice(Device):
                  return False
             
             # Update last activity time to prevent false inactivity detection
-            with self._thread_lock:
-                self._last_activity_time = time.time()
+            self._last_activity_time = time.time()
                 
             return True
         except Exception as e:
@@ -576,44 +666,15 @@ class DLNADevice(Device):
         Returns:
             bool: True if successful, False otherwise
         """
-        import requests # Ensure requests is imported if not globally
-        import xml.etree.ElementTree as ET
-        
-        # Define SOAP namespaces
-        ns = {
-            "s": "http://schemas.xmlsoap.org/soap/envelope/",
-            "u": "urn:schemas-upnp-org:service:AVTransport:1",
-        }
-        
-        # Create SOAP envelope
-        envelope = ET.Element("{http://schemas.xmlsoap.org/soap/envelope/}Envelope")
-        envelope.set("xmlns:s", ns["s"])
-        envelope.set("s:encodingStyle", "http://schemas.xmlsoap.org/soap/encoding/")
-        
-        # Create SOAP body
-        body = ET.SubElement(envelope, "{http://schemas.xmlsoap.org/soap/envelope/}Body")
-        
-        # Create action element
-        action_element = ET.SubElement(body, "{urn:schemas-upnp-org:service:AVTransport:1}" + action)
-        
-        # Add instance ID (always 0 for standard DLNA)
-        instance_id = ET.SubElement(action_element, "InstanceID")
-        instance_id.text = "0"
-        
-        # Add parameters
-        for name, value in parameters.items():
-            param = ET.SubElement(action_element, name)
-            param.text = str(value) # Ensure value is string
-        
-        # Convert to XML string
-        from xml.dom.minidom import parseString
-        xml_str_bytes = ET.tostring(envelope, encoding="utf-8", method="xml")
-        xml_str = xml_str_bytes.decode('utf-8') # Ensure it's a string for requests
+        # Fill the fixed envelope; only the action name and its arguments vary
+        params = "".join(
+            f"<{name}>{xmlescape(str(value))}</{name}>" for name, value in parameters.items()
+        )
+        xml_str_bytes = SOAP_ENVELOPE_TEMPLATE.format(action=action, params=params).encode("utf-8")
         
         # Log the request
         logger.debug(f"Sending AVTransport action {action} to {self.name}")
         logger.debug(f"Action URL: {self.action_url}")
-        # logger.debug(f"SOAP request: {parseString(xml_str).toprettyxml(indent='  ')}") # Can be verbose
         
         # Define SOAP headers
         headers = {
@@ -623,7 +684,7 @@ class DLNADevice(Device):
         
         # Send the request
         try:
-            response = requests.post(self.action_url, data=xml_str_bytes, headers=headers, timeout=10) # Send bytes
+            response = _soap_session.post(self.action_url, data=xml_str_bytes, headers=headers, timeout=10) # Send bytes
             
             # Check if the request was successful
             if response.status_code == 200:
@@ -703,12 +764,14 @@ class DLNADevice(Device):
             if self._loop_thread and self._loop_thread.is_alive():
                 logger.info(f"[{self.name}] Loop monitoring thread (v2) already running. Stopping it first.")
                 self._loop_enabled = False
+                self._stop_event.set()  # Wake it from its wait
                 current_thread = self._loop_thread
                 self._loop_thread = None # Allow new thread to be created
                 current_thread.join(timeout=5.0)
                 if current_thread.is_alive():
                     logger.warning(f"[{self.name}] Previous loop thread (v2) did not terminate in time.")
 
+            self._stop_event.clear()
             self._loop_enabled = True
             self._last_activity_time = time.time() # Reset activity time
             
@@ -761,7 +824,7 @@ class DLNADevice(Device):
         self.playback_progress = 0
         
         monitoring_start_time = time.time()
-        update_interval = 2  # Check every 2 seconds
+        update_interval = 2  # Retry the duration query every 2 seconds
         last_progress_update_time = 0
         seeking_triggered = False  # Track if we've triggered seek for this loop
 
@@ -771,11 +834,10 @@ class DLNADevice(Device):
         progress_logger.info(f"[PROGRESS_DEBUG] [{self.name}] Attempting to determine video duration...")
         
         while retry_count < max_duration_retries:
-            with self._thread_lock: # Check loop_enabled under lock
-                if not self._loop_enabled:
-                    logger.info(f"[{self.name}] Loop disabled (v2) during duration check. Exiting monitor thread.")
-                    progress_logger.info(f"[PROGRESS_DEBUG] [{self.name}] Loop disabled during duration check, exiting")
-                    return
+            if not self._loop_enabled:
+                logger.info(f"[{self.name}] Loop disabled (v2) during duration check. Exiting monitor thread.")
+                progress_logger.info(f"[PROGRESS_DEBUG] [{self.name}] Loop disabled during duration check, exiting")
+                return
 
             try:
                 position_info = self._get_position_info()
@@ -792,8 +854,9 @@ class DLNADevice(Device):
                 logger.warning(f"[{self.name}] Error getting video duration (v2) (attempt {retry_count + 1}): {e}")
             
             retry_count += 1
-            if retry_count < max_duration_retries:
-                time.sleep(update_interval)
+            if retry_count < max_duration_retries and self._stop_event.wait(update_interval):
+                logger.info(f"[{self.name}] Stop requested (v2) during duration check. Exiting monitor thread.")
+                return
 
 
         if not self.current_video_duration:
@@ -884,25 +947,21 @@ class DLNADevice(Device):
             loop_iteration += 1
             progress_logger.debug(f"[PROGRESS_DEBUG] [{self.name}] Loop iteration {loop_iteration} starting")
             
-            loop_active_check = False
-            with self._thread_lock:
-                loop_active_check = self._loop_enabled
-            
-            if not loop_active_check:
+            if not self._loop_enabled:
                 logger.info(f"[{self.name}] Loop disabled (v2). Exiting monitor thread.")
                 progress_logger.info(f"[PROGRESS_DEBUG] [{self.name}] Loop disabled, exiting monitor thread")
                 break
 
             try:
                 current_time = time.time()
+                poll_interval = self._poll_interval()
                 
                 # Update progress
-                if current_time - last_progress_update_time >= update_interval:
-                    progress_logger.debug(f"[PROGRESS_DEBUG] [{self.name}] Time to update progress (interval: {update_interval}s)")
+                if current_time - last_progress_update_time >= poll_interval:
+                    progress_logger.debug(f"[PROGRESS_DEBUG] [{self.name}] Time to update progress (interval: {poll_interval:.2f}s)")
                     
-                    position_info = self._get_position_info()
+                    transport_info, position_info = self._get_transport_and_position()
                     rel_time_str = position_info.get("RelTime")
-                    transport_info = self._get_transport_info()
                     transport_state = transport_info.get("CurrentTransportState", "UNKNOWN")
                     
                     progress_logger.info(f"[PROGRESS_DEBUG] [{self.name}] Got position info: RelTime={rel_time_str}, State={transport_state}")
@@ -1044,8 +1103,7 @@ class DLNADevice(Device):
                             # Re-fetch duration immediately
                             retry_count = 0
                             while retry_count < max_duration_retries:
-                                with self._thread_lock:
-                                    if not self._loop_enabled: break
+                                if not self._loop_enabled: break
                                 try:
                                     pos_info_restart = self._get_position_info()
                                     dur_str_restart = pos_info_restart.get("TrackDuration")
@@ -1056,7 +1114,7 @@ class DLNADevice(Device):
                                         break
                                 except Exception: pass
                                 retry_count += 1
-                                if retry_count < max_duration_retries: time.sleep(1)
+                                if retry_count < max_duration_retries and self._stop_event.wait(1): break
                             if not self.current_video_duration: self.current_video_duration = 60
                             self.duration_formatted = self._format_time(self.current_video_duration)
 
@@ -1065,7 +1123,7 @@ class DLNADevice(Device):
                             continue # Restart loop immediately
                         else:
                             logger.error(f"[{self.name}] Failed to restart video (v2). Will retry.")
-                            time.sleep(5) # Wait before next cycle if restart fails
+                            self._stop_event.wait(5) # Wait before next cycle if restart fails
                             continue
                     
                     elif transport_state not in ["PLAYING", "TRANSITIONING", "UNKNOWN"]:
@@ -1076,7 +1134,7 @@ class DLNADevice(Device):
                             seeking_triggered = False  # Reset seeking flag
                             # Re-fetch duration as above
                         else:
-                            time.sleep(5)
+                            self._stop_event.wait(5)
                         continue
                     last_progress_update_time = current_time
 
@@ -1094,8 +1152,7 @@ class DLNADevice(Device):
                         if time_since_activity < 30:  # Accept activity within last 30 seconds
                             has_active_stream = True
                             # Update our last activity time based on streaming activity
-                            with self._thread_lock:
-                                self._last_activity_time = time.time()
+                            self._last_activity_time = time.time()
                             logger.debug(f"[{self.name}] Found recent streaming activity {time_since_activity:.1f}s ago")
                             break
                 except Exception as e:
@@ -1115,17 +1172,18 @@ class DLNADevice(Device):
                         last_progress_update_time = time.time()
                         seeking_triggered = False  # Reset seeking flag
                     else:
-                        time.sleep(5) # Wait on failure
+                        self._stop_event.wait(5) # Wait on failure
                     continue
 
-                time.sleep(1) # Main loop sleep
+                # Main loop sleep, until the next poll is due
+                self._stop_event.wait(max(MIN_POLL_INTERVAL, last_progress_update_time + poll_interval - time.time()))
             
             except Exception as e:
                 logger.error(f"[{self.name}] Error in loop monitoring (v2): {e}")
                 logger.error(traceback.format_exc())
                 progress_logger.error(f"[PROGRESS_DEBUG] [{self.name}] ERROR in monitoring loop iteration {loop_iteration}: {e}")
                 progress_logger.error(f"[PROGRESS_DEBUG] [{self.name}] Traceback: {traceback.format_exc()}")
-                time.sleep(5) # Sleep on error
+                self._stop_event.wait(5) # Sleep on error
         
         logger.info(f"[{self.name}] Playback monitoring (v2) for {video_url} finished.")
         progress_logger.info(f"[PROGRESS_DEBUG] [{self.name}] === MONITOR THREAD EXITED === After {loop_iteration} iterations")
@@ -1349,7 +1407,7 @@ class DLNADevice(Device):
                     if rel_time and rel_time not in ("UNKNOWN", "NOT_IMPLEMENTED", "00:00:00", "0:00:00"):
                         # If it's playing and not at the very beginning, assume it's fine
                         logger.info(f"[{self.name}] Video seems to be playing at {rel_time} (v2), no restart needed now.")
-                        with self._thread_lock: self._last_activity_time = time.time() # Update activity
+                        self._last_activity_time = time.time() # Update activity
                         return True 
                 except Exception as e:
                     logger.warning(f"[{self.name}] Error checking position info during restart (v2): {e}")
@@ -1380,8 +1438,7 @@ class DLNADevice(Device):
             self.update_playing(True) # Update internal state
             logger.info(f"[{self.name}] Video restarted successfully (v2)")
             
-            with self._thread_lock:
-                self._last_activity_time = time.time()
+            self._last_activity_time = time.time()
                 
             return True
             
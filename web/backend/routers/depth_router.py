@@ -34,6 +34,8 @@ except ImportError as e:
         @staticmethod
         def depth_band_segmentation(*args, **kwargs): return None
         @staticmethod
+        def segment_areas(*args, **kwargs): return [], []
+        @staticmethod
         def extract_binary_mask(*args, **kwargs): return None
         @staticmethod
         def clean_binary_mask(*args, **kwargs): return None
@@ -226,7 +228,8 @@ async def segment_depth_map(depth_id: str, request: SegmentationRequest):
         temp_depth_maps[depth_id]['segmentation'] = segmentation
         
         # Get unique segment IDs
-        segments = sorted(list(map(int, set(segmentation.flatten()))))
+        segment_ids, _ = DepthSegmenter.segment_areas(segmentation)
+        segments = [int(segment_id) for segment_id in segment_ids]
         
         return {
             "success": True,
@@ -306,10 +309,12 @@ async def export_masks(depth_id: str, request: MaskExportRequest):
                 )
             
             # Export the mask
-            mask_bytes = DepthVisualizer.export_image(binary_mask)
+            mask_bytes = DepthVisualizer.export_image(binary_mask, is_mask=True)
             
-            # Add to ZIP file
-            zip_file.writestr(f"mask_{segment_id}.png", mask_bytes)
+            # Add to ZIP file; PNGs are already deflated, so store them as-is
+            zip_file.writestr(
+                f"mask_{segment_id}.png", mask_bytes, compress_type=zipfile.ZIP_STORED
+            )
         
         # Add a metadata file
         metadata = {
@@ -385,7 +390,7 @@ async def get_mask(depth_id: str, segment_id: int, clean: bool = True, min_area:
         )
     
     # Export the mask
-    mask_bytes = DepthVisualizer.export_image(binary_mask)
+    mask_bytes = DepthVisualizer.export_image(binary_mask, is_mask=True)
     
     return StreamingResponse(io.BytesIO(mask_bytes), media_type="image/png")
 
@@ -526,7 +531,7 @@ def generate_projection_html(config: ProjectionConfig) -> str:
         
         # Convert to base64 for embedding in HTML
         import base64
-        mask_bytes = DepthVisualizer.export_image(binary_mask)
+        mask_bytes = DepthVisualizer.export_image(binary_mask, is_mask=True)
         mask_base64 = base64.b64encode(mask_bytes).decode("utf-8")
         
         # Store the mask
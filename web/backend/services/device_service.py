@@ -2,7 +2,8 @@ import logging
 import os
 import json
 import traceback
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
+from sqlalchemy import bindparam
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import SQLAlchemyError
 from fastapi import Depends
@@ -17,6 +18,19 @@ from core.config_service import ConfigService
 
 logger = logging.getLogger(__name__)
 
+# Playback progress is written often, so it is a plain UPDATE by name, built once,
+# instead of loading each device row through the ORM
+_device_table = DeviceModel.__table__
+PLAYBACK_PROGRESS_UPDATE = (
+    _device_table.update()
+    .where(_device_table.c.name == bindparam("device_name"))
+    .values(
+        playback_position=bindparam("position"),
+        playback_duration=bindparam("duration"),
+        playback_progress=bindparam("progress"),
+    )
+)
+
 class DeviceService:
     """
     Service for managing devices
@@ -133,6 +147,66 @@ class DeviceService:
         """
         return self.db.query(DeviceModel).filter(DeviceModel.name == name).first()
     
+    def get_device_activity_by_names(self, names: List[str]) -> Dict[str, Tuple[Optional[float], bool]]:
+        """
+        Get when several devices were last updated and whether they are playing, in a single query
+        
+        Only the needed columns are selected, so no full device rows are loaded.
+        
+        Args:
+            names: Names of the devices to get
+            
+        Returns:
+            Dict[str, Tuple[Optional[float], bool]]: (updated_at as epoch seconds, is_playing)
+            of the devices that were found, keyed by name
+        """
+        if not names:
+            return {}
+        rows = (
+            self.db.query(DeviceModel.name, DeviceModel.updated_at, DeviceModel.is_playing)
+            .filter(DeviceModel.name.in_(names))
+            .all()
+        )
+        # updated_at is stored as naive UTC
+        return {
+            name: (updated_at.replace(tzinfo=timezone.utc).timestamp() if updated_at else None, bool(is_playing))
+            for name, updated_at, is_playing in rows
+        }
+    
+    def get_device_control_modes_by_names(self, names: List[str]) -> Dict[str, Tuple[Optional[str], Optional[str]]]:
+        """
+        Get the user control mode and reason of several devices in a single query
+        
+        Args:
+            names: Names of the devices to get
+            
+        Returns:
+            Dict[str, Tuple[Optional[str], Optional[str]]]: (user_control_mode, user_control_reason)
+            of the devices that were found, keyed by name
+        """
+        if not names:
+            return {}
+        rows = (
+            self.db.query(DeviceModel.name, DeviceModel.user_control_mode, DeviceModel.user_control_reason)
+            .filter(DeviceModel.name.in_(names))
+            .all()
+        )
+        return {name: (mode, reason) for name, mode, reason in rows}
+    
+    def update_playback_progress(self, progress_by_device: Dict[str, Tuple[str, str, int]]) -> None:
+        """
+        Write the playback progress of several devices with one UPDATE statement, without committing
+        
+        Args:
+            progress_by_device: Map of device name to (position, duration, progress)
+        """
+        if not progress_by_device:
+            return
+        self.db.execute(PLAYBACK_PROGRESS_UPDATE, [
+            {"device_name": name, "position": position, "duration": duration, "progress": progress}
+            for name, (position, duration, progress) in progress_by_device.items()
+        ])
+    
     def create_device(self, device: DeviceCreate) -> DeviceModel:
         """
         Create a new device
@@ -356,6 +430,8 @@ class DeviceService:
                 db_device.user_control_expires_at = None
             
             self.db.commit()
+            self.device_manager.invalidate_db_device(db_device.name)
+            self.device_manager.wake_discovery()
             logger.info(f"Set device {db_device.name} to {mode} mode, reason: {reason}")
             return True
             
@@ -519,6 +595,8 @@ class DeviceService:
                 db_device.user_control_mode = "manual"
                 db_device.user_control_reason = "user_play"
                 self.db.commit()
+                self.device_manager.invalidate_db_device(db_device.name)
+                self.device_manager.wake_discovery()
                 
                 # Now update to playing - this will set the timestamp
                 self.update_device_status(device.name, "connected", is_playing=True)
@@ -567,6 +645,8 @@ class DeviceService:
                 db_device.user_control_mode = "manual"
                 db_device.user_control_reason = "user_stopped"
                 self.db.commit()
+                self.device_manager.invalidate_db_device(db_device.name)
+                self.device_manager.wake_discovery()
                 
                 # Stop streaming server
                 streaming_service = getattr(self.device_manager, 'streaming_service', None)
@@ -13,7 +13,7 @@ from web.backend.core.device import Device
 from web.backend.models.device import DeviceModel # Added import for DeviceModel
 # from web.backend.tests_backend.mock_device import MockDevice  # Removed - file deleted
 from web.backend.tests_backend.mock_streaming_session import MockStreamingSession
-from web.backend.core.device_manager import DeviceManager 
+from web.backend.core.device_manager import DeviceManager, SERVE_IP_CACHE_TTL
 # Corrected import for DeviceService:
 from web.backend.services.device_service import DeviceService 
 from web.backend.core.streaming_registry import StreamingSessionRegistry
@@ -96,6 +96,35 @@ class TestDeviceClass:
         assert device_dict["type"] == "test"
         assert device_dict["action_url"] == "http://127.0.0.1:8000/action"
     
+    def test_device_to_dict_cache_invalidation(self):
+        """Test that the cached dictionary follows the update methods and current_video."""
+        device = MockDevice({"device_name": "Test Cache"})
+        
+        first = device.to_dict()
+        assert first["status"] == "disconnected"
+        
+        # Callers get a copy, so mutating it leaves the cache intact
+        first["status"] = "mutated"
+        assert device.to_dict()["status"] == "disconnected"
+        
+        device.update_status("connected")
+        assert device.to_dict()["status"] == "connected"
+        
+        device.current_video = "/test/video.mp4"
+        assert device.to_dict()["current_video"] == "/test/video.mp4"
+        
+        device.update_playing(True)
+        device.update_streaming_info("http://127.0.0.1:9000/video.mp4", 9000)
+        device_dict = device.to_dict()
+        assert device_dict["is_playing"] is True
+        assert device_dict["streaming_url"] == "http://127.0.0.1:9000/video.mp4"
+        assert device_dict["streaming_port"] == 9000
+        
+        # Attributes outside the dictionary leave the cache alone
+        version = device._dict_version
+        device.current_position = "00:00:05"
+        assert device._dict_version == version
+    
     def test_device_equality(self):
         """Test device equality."""
         device1 = MockDevice({
@@ -205,6 +234,26 @@ class TestDeviceManager:
         from web.backend.core import device_manager as dm_module
         dm_module._device_manager_instance = None
 
+    def test_get_device_manager_concurrent_first_call(self):
+        """Test that concurrent first callers of get_device_manager share one instance."""
+        import threading
+        from web.backend.core import device_manager as dm_module
+        dm_module._device_manager_instance = None
+        barrier = threading.Barrier(8)
+        results = []
+
+        def worker():
+            barrier.wait()
+            results.append(dm_module.get_device_manager())
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert len({id(m) for m in results}) == 1
+        dm_module._device_manager_instance = None
+
 
     @patch('socket.socket')
     def test_get_serve_ip_auto_detect(self, mock_socket_constructor):
@@ -218,6 +267,23 @@ class TestDeviceManager:
         mock_socket_instance.connect.assert_called_once_with(('8.8.8.8', 80))
         mock_socket_instance.close.assert_called_once()
 
+    @patch('socket.socket')
+    def test_get_serve_ip_cached(self, mock_socket_constructor):
+        """Test that an auto-detected IP is reused until the cache expires."""
+        mock_socket_instance = MagicMock()
+        mock_socket_instance.getsockname.return_value = ('192.168.1.101', 12345)
+        mock_socket_constructor.return_value = mock_socket_instance
+        manager = DeviceManager()
+        assert manager.get_serve_ip() == '192.168.1.101'
+        assert manager.get_serve_ip() == '192.168.1.101'
+        mock_socket_instance.connect.assert_called_once()
+
+        # An expired entry is detected again
+        manager._serve_ip_cache = ('192.168.1.101', 0.0)
+        with patch('web.backend.core.device_manager.time.monotonic', return_value=SERVE_IP_CACHE_TTL + 1):
+            manager.get_serve_ip()
+        assert mock_socket_instance.connect.call_count == 2
+
     @patch.dict(os.environ, {'STREAMING_SERVE_IP': '10.0.0.5'})
     def test_get_serve_ip_env_variable(self):
         """Test get_serve_ip using environment variable."""
@@ -381,11 +447,16 @@ class TestDeviceManager:
         assert status_dict["playback_position"] == "00:10:00"
         assert status_dict["playback_duration"] == "01:00:00"
         assert status_dict["playback_progress"] == 16
+        
+        # Database writes are queued and coalesced; flush them synchronously
+        manager._flush_playback_progress()
             
-        mock_device_service_instance.get_device_by_name.assert_called_once_with(device_name)
-        # If the side_effect returned mock_db_device, then commit should have been called.
-        if mock_db_device == configured_mock_service_instance.get_device_by_name.return_value: # Check if it was configured to return mock_db_device
-            mock_db_session.commit.assert_called_once()
+        # Progress is written with one UPDATE by name rather than loading the row
+        mock_device_service_instance.update_playback_progress.assert_called_once_with(
+            {device_name: ("00:10:00", "01:00:00", 16)}
+        )
+        mock_device_service_instance.get_device_by_name.assert_not_called()
+        mock_db_session.commit.assert_called_once()
             
         assert mock_core_device.current_position == "00:10:00"
         assert mock_core_device.duration_formatted == "01:00:00"